@@ -0,0 +1,153 @@
+from __future__ import annotations
+from array import array
+from operator import mul
+from typing import Iterable, Sequence
+import heapq
+import math
+import random
+
+from .index import Vector
+from .vector_batch import VectorBatch
+
+
+class AngleIndex:
+    """Approximate nearest-neighbour index that finds stored vectors with the smallest angles
+
+    Random-hyperplane LSH: each of `tables` hash tables draws `bits` random hyperplanes
+    through the origin, and a vector's bucket key has one bit per hyperplane telling which
+    side of it the vector lies on. Two vectors at angle θ fall on the same side of a random
+    hyperplane with probability 1 - θ/180°, so close vectors share buckets far more often
+    than distant ones. A query looks up its bucket in every table (and `probes` neighbouring
+    buckets, flipping the bits the query is least sure about) and ranks only the vectors
+    found there by their exact angle.
+
+    More bits make buckets smaller and queries faster; more tables and probes raise recall.
+    The defaults find about 93% of the 10 nearest of 3000 random 32-dimensional vectors
+    (97% of 20000) while ranking a fifth of them (scripts/benchmark_ann.py).
+
+    Example of usage:
+    >>> index = AngleIndex(dimension=2, tables=4, bits=2, seed=0)
+    >>> index.extend([Vector(1, 0), Vector(0, 1), Vector(1, 1)])
+    >>> index.query(Vector(2, 1), 1) # returns [(2, 18.43...)]
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        tables: int = 32,
+        bits: int = 10,
+        probes: int = 4,
+        seed: int | None = None,
+    ):
+        """Initializes an empty index
+
+        Args:
+            dimension (int): length of the indexed vectors
+            tables (int, optional): number of hash tables. Defaults to 32.
+            bits (int, optional): hyperplanes (key bits) per table. Defaults to 10.
+            probes (int, optional): extra buckets looked up per table by default. Defaults to 4.
+            seed (int | None, optional): seed for the random hyperplanes. Defaults to None.
+        """
+        if tables < 1 or bits < 1:
+            raise ValueError("Index needs at least one table and one bit")
+        generator = random.Random(seed)
+        self.tables = tables
+        self.bits = bits
+        self.probes = probes
+        self.vectors = VectorBatch(dimension=dimension)
+        self.planes = [
+            [
+                array("d", (generator.gauss(0, 1) for _ in range(dimension)))
+                for _ in range(bits)
+            ]
+            for _ in range(tables)
+        ]
+        self.buckets: list[dict[int, list[int]]] = [{} for _ in range(tables)]
+
+    def _projections(self, values: Sequence[float]) -> list[list[float]]:
+        """Signed distances (up to scale) of a vector to every hyperplane of every table"""
+        return [
+            [sum(map(mul, plane, values)) for plane in planes] for planes in self.planes
+        ]
+
+    @staticmethod
+    def _key(projections: list[float]) -> int:
+        """Bucket key with bit `b` set if the vector lies on the positive side of plane `b`"""
+        key = 0
+        for bit, projection in enumerate(projections):
+            if projection >= 0:
+                key |= 1 << bit
+        return key
+
+    def add(self, vector: Vector | Iterable[int | float]) -> int:
+        """Adds a vector and returns its index
+
+        Zero vectors are stored, but never returned by queries since they have no angle.
+        """
+        i = self.vectors.append(vector)
+        if self.vectors.norms[i] == 0:
+            return i
+        for table, projections in zip(
+            self.buckets, self._projections(self.vectors._row(i))
+        ):
+            table.setdefault(self._key(projections), []).append(i)
+        return i
+
+    def extend(self, vectors: Iterable[Vector | Iterable[int | float]]) -> None:
+        """Adds several vectors"""
+        for vector in vectors:
+            self.add(vector)
+
+    def __len__(self) -> int:
+        """Returns the number of vectors in the index"""
+        return len(self.vectors)
+
+    def candidates(
+        self, query: Vector | Iterable[int | float], probes: int | None = None
+    ) -> list[int]:
+        """Indices of the vectors sharing a bucket with the query in any table
+
+        Besides the query's own bucket, `probes` buckets per table are looked up that differ
+        from it in one bit, starting with the hyperplanes the query lies closest to.
+        """
+        probes = self.probes if probes is None else probes
+        found: set[int] = set()
+        for table, projections in zip(
+            self.buckets, self._projections(self.vectors._query(query))
+        ):
+            key = self._key(projections)
+            found.update(table.get(key, ()))
+            closest = sorted(range(self.bits), key=lambda bit: abs(projections[bit]))
+            for bit in closest[:probes]:
+                found.update(table.get(key ^ (1 << bit), ()))
+        return sorted(found)
+
+    def query(
+        self, query: Vector | Iterable[int | float], k: int, probes: int | None = None
+    ) -> list[tuple[int, float]]:
+        """Finds up to `k` stored vectors with (approximately) the smallest angles to the query
+
+        Args:
+            query (Vector | Iterable[int | float]): query vector, must not be zero
+            k (int): number of neighbours to return
+            probes (int | None, optional): overrides the index default for this query
+
+        Returns:
+            list[tuple[int, float]]: (index, angle in degrees) pairs, smallest angle first
+        """
+        values = self.vectors._query(query)
+        candidates = self.candidates(values, probes)
+        if not candidates:
+            return []
+        similarities = self.vectors.cosine_similarities(values, candidates)
+        best = heapq.nlargest(
+            k, zip(candidates, similarities), key=lambda pair: pair[1]
+        )
+        return [(i, math.degrees(math.acos(similarity))) for i, similarity in best]
+
+    def __repr__(self) -> str:
+        """Returns a representation of the index"""
+        return (
+            f"AngleIndex(size={len(self)}, dimension={self.vectors.dimension}, "
+            f"tables={self.tables}, bits={self.bits}, probes={self.probes})"
+        )
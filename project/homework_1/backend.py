@@ -0,0 +1,134 @@
+from __future__ import annotations
+from typing import Any, Literal
+
+from .storage import ArrayStorage, typecode_dtype
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the environment
+    numpy = None  # type: ignore[assignment]
+
+Backend = Literal["python", "numpy"]
+
+_backend: Backend = "python"
+
+
+def numpy_available() -> bool:
+    """Checks if NumPy can be imported"""
+    return numpy is not None
+
+
+def set_backend(name: Literal["python", "numpy", "auto"]) -> Backend:
+    """Selects the compute backend for Matrix and Vector arithmetic
+
+    Args:
+        name (Literal["python", "numpy", "auto"]): "auto" picks NumPy when it is installed
+
+    Raises:
+        ImportError: if "numpy" is requested but NumPy is not installed
+        ValueError: if the backend name is unknown
+
+    Returns:
+        Backend: the backend that is active now
+    """
+    global _backend
+
+    if name == "auto":
+        name = "numpy" if numpy_available() else "python"
+    if name == "numpy" and not numpy_available():
+        raise ImportError("NumPy backend requested, but NumPy is not installed")
+    if name not in ("python", "numpy"):
+        raise ValueError(f"Unknown backend: {name}")
+
+    _backend = name
+    return _backend
+
+
+def get_backend() -> Backend:
+    """Returns the active compute backend"""
+    return _backend
+
+
+def use_numpy() -> bool:
+    """Checks if arithmetic should be handed to NumPy"""
+    return _backend == "numpy"
+
+
+def as_ndarray(values: Any, writeable: bool = False) -> Any:
+    """Wraps storage into an ndarray without copying, other values are converted by NumPy
+
+    With `writeable=True` writes into the ndarray go straight to the storage.
+    """
+    if not isinstance(values, ArrayStorage):
+        return numpy.asarray(values)
+
+    flat = numpy.frombuffer(values.data, dtype=numpy.dtype(values.typecode))
+    return numpy.lib.stride_tricks.as_strided(
+        flat[values.offset :],
+        shape=values.shape,
+        strides=tuple(stride * values.itemsize for stride in values.strides),
+        writeable=writeable,
+    )
+
+
+def exact(operation: Literal["add", "matmul"], left: Any, right: Any) -> Any:
+    """Applies `numpy.add` or `numpy.matmul` without wrapping integers around
+
+    NumPy integers silently wrap around on overflow. Integer operands are widened to int64
+    when the result surely fits in it and to Python ints (object arrays) otherwise, so the
+    result is exact like on the plain Python path. Other operands are passed as they are.
+    """
+    function = getattr(numpy, operation)
+    if left.dtype.kind not in "iu" or right.dtype.kind not in "iu":
+        return function(left, right)
+
+    left_max, right_max = _magnitude(left), _magnitude(right)
+    if operation == "add":
+        bound = left_max + right_max
+    else:
+        bound = left.shape[-1] * left_max * right_max
+    dtype: Any = numpy.result_type(left, right)
+    if bound > numpy.iinfo(dtype).max:
+        dtype = numpy.int64 if bound <= numpy.iinfo(numpy.int64).max else object
+    return function(left.astype(dtype, copy=False), right.astype(dtype, copy=False))
+
+
+def _magnitude(values: Any) -> int:
+    """Largest absolute value of an integer ndarray (0 if it is empty)"""
+    if values.size == 0:
+        return 0
+    return max(abs(int(values.max())), abs(int(values.min())))
+
+
+def check_range(result: Any, typecode: str) -> None:
+    """Checks that an exact integer result fits into elements of the given typecode
+
+    Raises:
+        OverflowError: if some element does not fit
+    """
+    if result.dtype.kind not in "iuO" or typecode not in "bBhHiIlLqQ":
+        return
+    limits = numpy.iinfo(numpy.dtype(typecode))
+    if result.size and (result.min() < limits.min or result.max() > limits.max):
+        raise OverflowError(f"Result does not fit into {typecode_dtype(typecode)}")
+
+
+def to_storage(result: Any, typecode: str) -> ArrayStorage:
+    """Wraps an ndarray result into storage of the given typecode
+
+    Raises:
+        OverflowError: if an integer result does not fit into the typecode
+    """
+    check_range(result, typecode)
+    result = numpy.ascontiguousarray(result, dtype=numpy.dtype(typecode))
+    return ArrayStorage(typecode, result.shape, result)
+
+
+def write(storage: ArrayStorage, result: Any) -> None:
+    """Copies an ndarray result into existing storage
+
+    Raises:
+        OverflowError: if an integer result does not fit into the storage
+    """
+    check_range(result, storage.typecode)
+    as_ndarray(storage, writeable=True)[...] = result
@@ -1,6 +1,23 @@
 from __future__ import annotations
-from typing import Iterable, Sized
+from array import array
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Literal, Sequence, Sized
 import math
+import operator
+import os
+
+from . import backend, linalg, serialization
+from .kernels import MultiplicationMethod, chain_order, multiply
+from .lazy import LazyMatrix, Leaf
+from .parallel import fits_int64, multiply_parallel
+from .storage import (
+    ArrayStorage,
+    DType,
+    dtype_typecode,
+    infer_typecode,
+    promote_typecodes,
+    typecode_dtype,
+)
 
 
 class Vector:
@@ -12,16 +29,43 @@ class Vector:
     >>> vec1 * vec2 # returns 30
     >>> vec1.length() # 1
     >>> vec1.angle(vec2) # returns 90
+
+    With storage="array" the values are kept unboxed in a typed `array.array`:
+    >>> vec = Vector(1.5, 2.5, storage="array")
+    >>> vec.memoryview().tolist() # returns [1.5, 2.5]
+
+    A dtype ("int32", "int64", "float32" or "float64") picks the element type explicitly:
+    >>> Vector(1, 2, 3, dtype="float32").dtype # "float32"
+
+    Arithmetic is handed to NumPy after `backend.set_backend("numpy")`.
     """
 
     values: Iterable[int | float] = []
 
-    def __init__(self, *values: int | float):
-        """Initializes a vector with the given values"""
-        self.values = values
+    def __init__(
+        self,
+        *values: int | float,
+        storage: Literal["list", "array"] = "list",
+        dtype: DType | None = None,
+    ):
+        """Initializes a vector with the given values, `dtype` implies array storage"""
+        if dtype is not None:
+            self.values = array(dtype_typecode(dtype), values)
+        elif storage == "array":
+            self.values = array(infer_typecode(values), values)
+        elif storage == "list":
+            self.values = values
+        else:
+            raise ValueError(f"Unknown storage: {storage}")
 
-    def __mul__(self, other: Vector) -> int | float:
+    def __mul__(self, other: Vector | FrozenVector) -> int | float:
         """Calculates the scalar product of two vectors"""
+        if backend.use_numpy():
+            product = backend.exact(
+                "matmul", self._to_numpy(), backend.as_ndarray(other.values)
+            )
+            return backend.numpy.asarray(product).item()
+
         scalar_product: float | int = 0
 
         for x, y in zip(self.values, other.values):
@@ -31,18 +75,162 @@ class Vector:
 
     def length(self):
         """Calculates the length of the vector"""
+        if backend.use_numpy():
+            return float(backend.numpy.linalg.norm(self._to_numpy()))
+
         sum_of_squares = 0
         for x in self.values:
             sum_of_squares += x**2
 
         return math.sqrt(sum_of_squares)
 
-    def angle(self, other: Vector) -> float:
+    def angle(self, other: Vector | FrozenVector) -> float:
         """Calculates the angle between two vectors. Returns an angle in degrees"""
+        if backend.use_numpy():
+            x, y = self._to_numpy(), backend.as_ndarray(other.values)
+            cosine = backend.exact("matmul", x, y) / (
+                backend.numpy.linalg.norm(x) * backend.numpy.linalg.norm(y)
+            )
+            return float(backend.numpy.degrees(backend.numpy.arccos(cosine)))
+
         dot_product = self * other
         length_product = self.length() * other.length()
         return math.acos(dot_product / length_product) * 180 / math.pi
 
+    @property
+    def dtype(self) -> str | None:
+        """Element type of an array-backed vector, e.g. "float32"; None for list storage"""
+        if isinstance(self.values, (array, memoryview)):
+            return typecode_dtype(memoryview(self.values).format)
+        return None
+
+    def astype(self, dtype: DType) -> Vector:
+        """Returns a copy of the vector with elements converted to the given dtype
+
+        Floats converted to an integer dtype are truncated towards zero.
+        """
+        values: Iterable[int | float] = self.values
+        if dtype.startswith("int"):
+            values = map(int, values)
+        return Vector(*values, dtype=dtype)
+
+    def memoryview(self) -> memoryview:
+        """Exposes the values of an array-backed vector through the buffer protocol"""
+        if not isinstance(self.values, (array, memoryview)):
+            raise BufferError("Vector must use array storage to be exposed as a buffer")
+        return memoryview(self.values)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Writes the vector to a file in the binary format (see serialization)"""
+        values = self.values
+        if isinstance(values, (array, memoryview)):
+            typecode = memoryview(values).format
+        else:
+            typecode = infer_typecode(values)
+        serialization.write(path, typecode, (len(values),), [values])  # type: ignore[arg-type]
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, mmap: bool = False) -> Vector:
+        """Reads a vector saved by `save`, with mmap=True the file is mapped instead of read"""
+        typecode, shape, buffer, offset = serialization.read(path, mmap)
+        if len(shape) != 1:
+            raise ValueError("File does not contain a vector")
+        vector = cls()
+        if offset:
+            data = memoryview(buffer).cast("B").cast(typecode)  # type: ignore[call-overload]
+            vector.values = data[offset:]
+        else:
+            vector.values = buffer
+        return vector
+
+    def _to_numpy(self):
+        """Wraps the values into an ndarray (without copying for array storage)"""
+        return backend.as_ndarray(self.values)
+
+    def freeze(self) -> FrozenVector:
+        """Returns an immutable copy of the vector (see FrozenVector)"""
+        return FrozenVector(*self.values)
+
+
+class FrozenVector:
+    """Immutable vector with cached length and hash
+
+    Values are materialized into a tuple once, the instance has no `__dict__` and cannot be
+    changed, so the length is computed on first use and reused by every later `angle()`
+    call, and the vector can be used as a dict key or a cache entry.
+
+    Example of usage:
+    >>> query = FrozenVector(1, 1, 1)
+    >>> query.length() # computed once, then cached
+    >>> query.angle(Vector(4, 5, 6))
+    >>> cache = {query: "result"} # hashable
+    >>> query.values = (0, 0, 0) # raises AttributeError
+    """
+
+    __slots__ = ("values", "_length", "_hash")
+
+    values: tuple[int | float, ...]
+    _length: float | None
+    _hash: int | None
+
+    def __init__(self, *values: int | float):
+        """Initializes a vector with the given values"""
+        object.__setattr__(self, "values", tuple(values))
+        object.__setattr__(self, "_length", None)
+        object.__setattr__(self, "_hash", None)
+
+    def __setattr__(self, name: str, value: object):
+        """Forbids changing the vector"""
+        raise AttributeError("FrozenVector is immutable")
+
+    def __delattr__(self, name: str):
+        """Forbids changing the vector"""
+        raise AttributeError("FrozenVector is immutable")
+
+    def __mul__(self, other: Vector | FrozenVector) -> int | float:
+        """Calculates the scalar product of two vectors"""
+        return sum(map(operator.mul, self.values, other.values))
+
+    def length(self) -> float:
+        """Calculates the length of the vector, once per instance"""
+        length = self._length
+        if length is None:
+            length = math.sqrt(sum(x * x for x in self.values))
+            object.__setattr__(self, "_length", length)
+        return length
+
+    def angle(self, other: Vector | FrozenVector) -> float:
+        """Calculates the angle between two vectors. Returns an angle in degrees"""
+        dot_product = self * other
+        length_product = self.length() * other.length()
+        return math.acos(dot_product / length_product) * 180 / math.pi
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if two frozen vectors have equal values"""
+        if not isinstance(other, FrozenVector):
+            return NotImplemented
+        return self.values == other.values
+
+    def __hash__(self) -> int:
+        """Returns a hash of the values, computed once per instance"""
+        value_hash = self._hash
+        if value_hash is None:
+            value_hash = hash(self.values)
+            object.__setattr__(self, "_hash", value_hash)
+        return value_hash
+
+    def __len__(self) -> int:
+        """Returns the number of values"""
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[int | float]:
+        """Iterates over the values, so the vector can be passed wherever values are expected"""
+        return iter(self.values)
+
+    def __repr__(self) -> str:
+        """Returns a representation of the vector"""
+        return f"FrozenVector{self.values}"
+
 
 class Matrix:
     """Matrix class that supports addition, multiplication and transposition
@@ -60,65 +248,877 @@ class Matrix:
     >>> mat1 + mat2 # returns Matrix([[2, 4, 6], [8, 10, 12], [14, 16, 18]])
     >>> mat1 * mat2 # returns Matrix([[30, 36, 42], [66, 81, 96], [102, 126, 150]])
     >>> mat1.transpose() # returns Matrix([[1, 4, 7], [2, 5, 8], [3, 6, 9]])
+
+    With storage="array" the elements are packed into one typed buffer (see ArrayStorage):
+    >>> mat = Matrix([1.0, 2.0], [3.0, 4.0], storage="array")
+    >>> mat.memoryview().tolist() # returns [[1.0, 2.0], [3.0, 4.0]]
+    >>> (mat + mat).storage # returns ArrayStorage(typecode='d', shape=(2, 2))
+
+    A dtype ("int32", "int64", "float32" or "float64") picks the element type explicitly,
+    results of arithmetic on mixed dtypes are promoted (see promote_typecodes):
+    >>> small = Matrix([1, 2], [3, 4], dtype="float32")
+    >>> (small + small).dtype # "float32"
+    >>> (small + Matrix([1, 2], [3, 4], dtype="int32")).dtype # "float64"
+
+    Integer dtypes are fixed width on every backend: a result that does not fit raises
+    OverflowError instead of wrapping around (in-place forms may have written some elements
+    by then). Integers of list-backed matrices are exact Python ints.
+
+    Multiplication picks a kernel by shape: blocked (tiled) for most products and Strassen
+    once all dimensions exceed `strassen_threshold`. Both knobs and the method can be set
+    on the class or on an instance:
+    >>> mat1.multiplication = "strassen"
+    >>> mat1.multiply(mat2, method="blocked") # explicit kernel for a single product
+
+    method="parallel" splits the result into row blocks computed by `workers` processes
+    (defaults to the number of CPUs) over operands in shared memory. Products with fewer than
+    `parallel_threshold` multiply-adds, and integer products of list-backed matrices that do
+    not fit in int64, are computed by the serial kernel instead:
+    >>> mat1.workers = 4
+    >>> mat1.multiply(mat2, method="parallel")
+
+    In-place forms reuse existing elements instead of allocating a result:
+    >>> mat1 += mat2
+    >>> mat1 *= mat2 # mat2 must be square
+    >>> mat1.add(mat2, out=acc) # acc is a preallocated matrix of the right shape
+    >>> mat1.multiply(mat2, out=acc)
+
+    Transposition and slicing of array-backed matrices return views that share elements:
+    >>> mat[:, 1] # returns the second column without copying
+    >>> mat.transpose() # O(1), swaps strides
+
+    Powers are computed by repeated squaring, and chains of products in the cheapest order:
+    >>> mat1 ** 10
+    >>> Matrix.chain(mat1, mat2, mat1) # same as mat1 * mat2 * mat1
+
+    Chained expressions can be evaluated lazily without intermediate matrices (see LazyMatrix):
+    >>> ((mat1.lazy() + mat2) * mat1.transpose()).evaluate()
+
+    After `backend.set_backend("numpy")` arithmetic is handed to NumPy, results keep the
+    same type and storage kind.
     """
 
-    values: list[list[int | float]] = []
+    storage: ArrayStorage | None = None
+    multiplication: MultiplicationMethod | Literal["parallel"] = "auto"
+    block_size: int = 128
+    strassen_threshold: int = 128
+    workers: int | None = None
+    parallel_threshold: int = 1_000_000
+    _scratch: list[int | float] | None = None
+    _version: int = 0
+    _lu: linalg.LUFactorization | None = None
+
+    def __init__(
+        self,
+        *values: list[int | float],
+        storage: Literal["list", "array"] = "list",
+        dtype: DType | None = None,
+    ):
+        """Initializes a matrix with the given values, `dtype` implies array storage"""
+        if storage == "array" or dtype is not None:
+            self._values: list[list[int | float]] = []
+            typecode = dtype_typecode(dtype) if dtype is not None else None
+            self.storage = ArrayStorage.from_rows(values, typecode)
+        elif storage == "list":
+            self.values = list(values)
+        else:
+            raise ValueError(f"Unknown storage: {storage}")
+
+    @classmethod
+    def from_storage(cls, storage: ArrayStorage) -> Matrix:
+        """Creates a matrix on top of an existing storage without copying it"""
+        matrix = cls()
+        matrix.storage = storage
+        return matrix
+
+    @property
+    def values(self) -> list[list[int | float]]:
+        """Rows of the matrix as lists. For array-backed matrices this is a copy"""
+        if self.storage is not None:
+            return self.storage.tolist()
+        return self._values
+
+    @values.setter
+    def values(self, values: list[list[int | float]]):
+        """Replaces the rows of the matrix and switches it to list storage"""
+        self._values = values
+        self.storage = None
+        self._modified()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Number of rows and columns of the matrix"""
+        if self.storage is not None:
+            return self.storage.shape[0], self.storage.shape[1]
+        if not self._values:
+            return 0, 0
+        return len(self._values), len(self._values[0])
+
+    @property
+    def storage_kind(self) -> Literal["list", "array"]:
+        """Kind of storage the matrix uses"""
+        return "list" if self.storage is None else "array"
+
+    @property
+    def dtype(self) -> str | None:
+        """Element type of an array-backed matrix, e.g. "float32"; None for list storage"""
+        if self.storage is None:
+            return None
+        return typecode_dtype(self.storage.typecode)
+
+    def astype(self, dtype: DType) -> Matrix:
+        """Returns an array-backed copy of the matrix with elements converted to the given dtype
+
+        Floats converted to an integer dtype are truncated towards zero.
+        """
+        flat: Iterable[int | float] = (x for row in self.rows() for x in row)
+        if dtype.startswith("int"):
+            flat = map(int, flat)
+        return Matrix.from_storage(
+            ArrayStorage.from_flat(dtype_typecode(dtype), self.shape, flat)
+        )
+
+    def rows(self) -> Sequence[Sequence[int | float]]:
+        """Returns the rows without copying: lists for list storage, memoryviews for array storage"""
+        if self.storage is not None:
+            return self.storage.rows()
+        return self._values
 
-    def __init__(self, *values: list[int | float]):
-        """Initializes a matrix with the given values"""
-        self.values = list(values)
+    def lazy(self) -> LazyMatrix:
+        """Starts a lazy expression: +, * and transpose() build a tree until evaluate() is called"""
+        return LazyMatrix(Leaf(self))
+
+    def as_storage(self, storage: Literal["list", "array"]) -> Matrix:
+        """Returns a copy of the matrix with the given storage kind"""
+        return Matrix(*(list(row) for row in self.rows()), storage=storage)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Writes the matrix to a file in the binary format (see serialization)
+
+        Rows of array-backed matrices are written straight from the buffer.
+        """
+        typecode = (
+            self.storage.typecode
+            if self.storage is not None
+            else infer_typecode(x for row in self._values for x in row)
+        )
+        serialization.write(path, typecode, self.shape, self.rows())
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, mmap: bool = False) -> Matrix:
+        """Reads a matrix saved by `save`
+
+        With mmap=True the file is mapped read-only and the matrix uses it as its storage,
+        so loading does not depend on the file size and the elements are not copied.
+        """
+        typecode, shape, buffer, offset = serialization.read(path, mmap)
+        if len(shape) != 2:
+            raise ValueError("File does not contain a matrix")
+        return cls.from_storage(ArrayStorage(typecode, shape, buffer, offset=offset))
+
+    def memoryview(self) -> memoryview:
+        """Exposes the elements of an array-backed matrix through the buffer protocol"""
+        if self.storage is None:
+            raise BufferError("Matrix must use array storage to be exposed as a buffer")
+        return self.storage.memoryview()
+
+    def _result_typecode(self, other: Matrix) -> str | None:
+        """Typecode for the result of a binary operation, None if both operands use list storage
+
+        The typecode of a list-backed operand is inferred from its values (see promote_typecodes).
+        """
+        if self.storage is None and other.storage is None:
+            return None
+        return promote_typecodes(
+            *(
+                m.storage.typecode
+                if m.storage is not None
+                else infer_typecode(x for row in m._values for x in row)
+                for m in (self, other)
+            )
+        )
+
+    @staticmethod
+    def _from_rows(
+        rows: Iterable[Iterable[int | float]],
+        shape: tuple[int, int],
+        typecode: str | None,
+    ) -> Matrix:
+        """Builds a matrix from result rows, packing them if a typecode is given"""
+        if typecode is None:
+            return Matrix(*(list(row) for row in rows))
+        flat = (x for row in rows for x in row)
+        return Matrix.from_storage(ArrayStorage.from_flat(typecode, shape, flat))
+
+    def _to_numpy(self):
+        """Wraps the matrix into a 2D ndarray (without copying for array storage)"""
+        if self.storage is not None:
+            return backend.as_ndarray(self.storage)
+        return backend.as_ndarray(self._values).reshape(self.shape)
+
+    @staticmethod
+    def _from_numpy(result, typecode: str | None) -> Matrix:
+        """Converts an ndarray result back into a matrix of the requested storage kind"""
+        if typecode is None:
+            return Matrix(*result.tolist())
+        return Matrix.from_storage(backend.to_storage(result, typecode))
 
     def __add__(self, other: Matrix):
         """Adds two matrices"""
-        if len(self.values) != len(other.values):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.shape != other.shape:
             raise ValueError("Matrices must have the same dimensions")
 
-        result: list[list[int | float]] = []
+        if backend.use_numpy():
+            result_array = backend.exact("add", self._to_numpy(), other._to_numpy())
+            return self._from_numpy(result_array, self._result_typecode(other))
 
-        for i in range(len(self.values)):
-            result.append([])
-            for j in range(len(self.values[0])):
-                result[i].append(self.values[i][j] + other.values[i][j])
-        return Matrix(*result)
+        result = (
+            [x + y for x, y in zip(row, other_row)]
+            for row, other_row in zip(self.rows(), other.rows())
+        )
+        return self._from_rows(result, self.shape, self._result_typecode(other))
 
     def __mul__(self, other: Matrix):
         """Multiplies two matrices"""
-        if len(self.values[0]) != len(other.values):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.multiply(other)
+
+    def add(self, other: Matrix, out: Matrix | None = None) -> Matrix:
+        """Adds two matrices, writing the result into `out` (which may be an operand) if it is given"""
+        if out is None:
+            return self + other
+        if not self.shape == other.shape == out.shape:
+            raise ValueError("Matrices must have the same dimensions")
+        self._check_out(other, out)
+
+        if backend.use_numpy() and out.storage is not None:
+            result_array = backend.exact("add", self._to_numpy(), other._to_numpy())
+            backend.write(out.storage, result_array)
+            out._modified()
+            return out
+
+        # Element (i, j) is read right before it is written only if the layouts match
+        left, right = (
+            operand.copy()
+            if operand._shares_elements(out) and not operand._same_layout(out)
+            else operand
+            for operand in (self, other)
+        )
+        with out._fixed_width():
+            for row, other_row, out_row in zip(
+                left.rows(), right.rows(), out._mutable_rows()
+            ):
+                for j in range(len(out_row)):
+                    out_row[j] = row[j] + other_row[j]
+        return out
+
+    def __iadd__(self, other: Matrix | SparseMatrix):
+        """Adds a matrix in place, without allocating a new one"""
+        if isinstance(other, SparseMatrix):
+            if self.shape != other.shape:
+                raise ValueError("Matrices must have the same dimensions")
+            with self._fixed_width():
+                for i, row in enumerate(self._mutable_rows()):
+                    for j, value in other.row(i):
+                        row[j] += value
+            return self
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.add(other, out=self)
+
+    def __imul__(self, other: Matrix):
+        """Multiplies by a square matrix in place, using one cached scratch row"""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        rows, cols = self.shape
+        if other.shape != (cols, cols):
+            raise ValueError("In-place multiplication needs a square right operand")
+        if other._shares_elements(self):
+            other = other.copy()
+
+        if backend.use_numpy() and self.storage is not None:
+            result_array = backend.exact("matmul", self._to_numpy(), other._to_numpy())
+            backend.write(self.storage, result_array)
+            self._modified()
+            return self
+
+        scratch = self._scratch_row(cols)
+        other_rows = other.rows()
+        with self._fixed_width():
+            for row in self._mutable_rows():
+                for j in range(cols):
+                    scratch[j] = 0
+                for k in range(cols):
+                    x, other_row = row[k], other_rows[k]
+                    for j in range(cols):
+                        scratch[j] += x * other_row[j]
+                for j in range(cols):
+                    row[j] = scratch[j]
+        return self
+
+    @contextmanager
+    def _fixed_width(self) -> Iterator[None]:
+        """Reports integers that do not fit into the storage as OverflowError, like `array` does
+
+        Writes through a memoryview raise ValueError instead. Elements written before the
+        failing one keep their new values.
+        """
+        try:
+            yield
+        except ValueError as error:
+            if self.storage is None:
+                raise
+            raise OverflowError(f"Result does not fit into {self.dtype}") from error
+
+    def _mutable_rows(self) -> Sequence[Any]:
+        """Rows that can be written in place: lists or writable memoryviews"""
+        self._modified()
+        return self.rows()
+
+    def _modified(self) -> None:
+        """Invalidates results cached for the current elements (e.g. the LU factorization)"""
+        if self.storage is not None:
+            self.storage.mark_modified()
+        else:
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter of changes made through Matrix methods, shared with views of the matrix
+
+        Rows changed directly (m.values[i][j] = x, writes through m.memoryview()) are not tracked.
+        """
+        if self.storage is not None:
+            return self.storage.version
+        return self._version
+
+    def lu(self) -> linalg.LUFactorization:
+        """Returns the LU factorization of a square matrix (see LUFactorization)
+
+        The factorization is cached and reused while the matrix keeps the same elements.
+        Checking that costs O(n^2) against O(n^3) for factorizing, and also catches direct
+        writes (m.values[i][j] = x, writes through m.memoryview()) that `version` misses.
+
+        Example of usage:
+        >>> mat = Matrix([4, 3], [6, 3])
+        >>> mat.lu().solve(Vector(10, 12)) # returns Vector(1.0, 2.0)
+        >>> mat.lu().det() # returns -6.0
+        """
+        factorization = self._lu
+        if factorization is None or not factorization.matches(self):
+            factorization = linalg.LUFactorization(self)
+            self._lu = factorization
+        return factorization
+
+    def _scratch_row(self, size: int) -> list[int | float]:
+        """Returns a row buffer that is reused between in-place operations"""
+        scratch = self._scratch
+        if scratch is None or len(scratch) != size:
+            scratch = [0] * size
+            self._scratch = scratch
+        return scratch
+
+    def _shares_elements(self, other: Matrix) -> bool:
+        """Checks if writing into one matrix may change the other"""
+        if self is other:
+            return True
+        if self.storage is not None and other.storage is not None:
+            return self.storage.buffer is other.storage.buffer
+        if self.storage is not None or other.storage is not None:
+            return False
+        # List-backed matrices may be different lists holding the same row lists
+        rows = {id(row) for row in self._values}
+        return any(id(row) in rows for row in other._values)
+
+    def _check_out(self, other: Matrix, out: Matrix) -> None:
+        """Raises ValueError if the result of an operation cannot be written into `out`"""
+        if out.storage is None or out.storage.typecode in "fd":
+            return
+        if self._result_typecode(other) in ("f", "d"):
+            raise ValueError(
+                f"Cannot write a floating point result into a matrix of {out.dtype}"
+            )
+
+    def _same_layout(self, other: Matrix) -> bool:
+        """Checks if both matrices place element (i, j) at the same memory location"""
+        if self.storage is None and other.storage is None:
+            return len(self._values) == len(other._values) and all(
+                row is other_row for row, other_row in zip(self._values, other._values)
+            )
+        if self.storage is None or other.storage is None:
+            return False
+        mine, theirs = self.storage, other.storage
+        return (
+            mine.buffer is theirs.buffer
+            and mine.offset == theirs.offset
+            and mine.strides == theirs.strides
+        )
+
+    def multiply(
+        self,
+        other: Matrix,
+        method: MultiplicationMethod | Literal["parallel"] | None = None,
+        out: Matrix | None = None,
+    ) -> Matrix:
+        """Multiplies two matrices with the given kernel (defaults to `self.multiplication`)
+
+        If `out` is given, the product is written straight into it row by row (i-k-j order)
+        and no new matrix is allocated; `out` must not share elements with the operands.
+        """
+        rows, inner = self.shape
+        if inner != other.shape[0]:
             raise ValueError("Matrices must have the same dimensions")
 
-        result: list[list[int | float]] = []
+        cols = other.shape[1]
+        if out is not None:
+            return self._multiply_into(other, out)
+        if backend.use_numpy():
+            result_array = backend.exact("matmul", self._to_numpy(), other._to_numpy())
+            return self._from_numpy(result_array, self._result_typecode(other))
+
+        method = method or self.multiplication
+        if method == "parallel" and not self._worth_parallel(other):
+            method = "auto"
+        if method == "parallel":
+            typecode = self._result_typecode(other)
+            storage = multiply_parallel(
+                self.rows(), other.rows(), cols, self.workers, typecode, self.block_size
+            )
+            if typecode is None:
+                return Matrix(*storage.tolist())
+            return Matrix.from_storage(storage)
 
-        for i in range(len(self.values)):
-            result.append([])
-            for j in range(len(other.values[0])):
-                result[i].append(
-                    sum(
-                        self.values[i][k] * other.values[k][j]
-                        for k in range(len(self.values[0]))
-                    )
-                )
-        return Matrix(*result)
+        result = multiply(
+            self.rows(),
+            other.rows(),
+            cols,
+            method,
+            self.block_size,
+            self.strassen_threshold,
+        )
+        return self._from_rows(result, (rows, cols), self._result_typecode(other))
+
+    def _worth_parallel(self, other: Matrix) -> bool:
+        """Checks if a product is large enough for a process pool and can be computed in one"""
+        rows, inner = self.shape
+        if rows * inner * other.shape[1] < self.parallel_threshold:
+            return False
+        # List-backed ints are exact bigints, the shared memory blocks are int64
+        return self._result_typecode(other) is not None or fits_int64(
+            self.rows(), other.rows()
+        )
+
+    def __pow__(self, power: int) -> Matrix:
+        """Raises a square matrix to a non-negative integer power by repeated squaring
+
+        Needs about 2 * log2(power) multiplications instead of power - 1. The zeroth power
+        is the identity matrix.
+        """
+        if not isinstance(power, int):
+            return NotImplemented
+        rows, cols = self.shape
+        if rows != cols:
+            raise ValueError("Only square matrices can be raised to a power")
+        if power < 0:
+            raise ValueError("Power must be non-negative")
+
+        result: Matrix | None = None
+        base = self
+        while power:
+            if power & 1:
+                result = base if result is None else result.multiply(base)
+            power >>= 1
+            if power:
+                base = base.multiply(base)
+
+        if result is None:
+            identity = ([int(i == j) for j in range(cols)] for i in range(rows))
+            typecode = self.storage.typecode if self.storage is not None else None
+            return self._from_rows(identity, self.shape, typecode)
+        return self.copy() if result is self else result
+
+    @staticmethod
+    def chain(*matrices: Matrix) -> Matrix:
+        """Multiplies a chain of matrices in the cheapest order
+
+        The parenthesization with the fewest scalar multiplications is found by dynamic
+        programming over the shapes before anything is multiplied. E.g. for shapes
+        (10, 1000), (1000, 10), (10, 1000) computing (AB)C costs 200 000 multiplications
+        and A(BC) costs 20 000 000.
+
+        Example of usage:
+        >>> Matrix.chain(mat1, mat2, mat3) # same result as mat1 * mat2 * mat3
+        """
+        if not matrices:
+            raise ValueError("Chain must contain at least one matrix")
+        for left, right in zip(matrices, matrices[1:]):
+            if left.shape[1] != right.shape[0]:
+                raise ValueError("Matrices must have the same dimensions")
+        if len(matrices) == 1:
+            return matrices[0].copy()
+
+        dims = [matrices[0].shape[0]] + [matrix.shape[1] for matrix in matrices]
+        _, split = chain_order(dims)
+
+        def product(start: int, end: int) -> Matrix:
+            if start == end:
+                return matrices[start]
+            middle = split[start][end]
+            return product(start, middle).multiply(product(middle + 1, end))
+
+        return product(0, len(matrices) - 1)
+
+    def _multiply_into(self, other: Matrix, out: Matrix) -> Matrix:
+        """Writes the product of two matrices into `out`"""
+        inner, cols = other.shape
+        if out.shape != (self.shape[0], cols):
+            raise ValueError("Output matrix has wrong dimensions")
+        if out._shares_elements(self) or out._shares_elements(other):
+            raise ValueError("Output matrix must not share elements with the operands")
+        self._check_out(other, out)
+
+        if backend.use_numpy() and out.storage is not None:
+            result_array = backend.exact("matmul", self._to_numpy(), other._to_numpy())
+            backend.write(out.storage, result_array)
+            out._modified()
+            return out
+
+        other_rows = other.rows()
+        with out._fixed_width():
+            for row, out_row in zip(self.rows(), out._mutable_rows()):
+                for j in range(cols):
+                    out_row[j] = 0
+                for k in range(inner):
+                    x, other_row = row[k], other_rows[k]
+                    for j in range(cols):
+                        out_row[j] += x * other_row[j]
+        return out
 
     def transpose(self):
-        """Transposes a matrix"""
-        result = []
-        for i in range(len(self.values[0])):
-            result.append([])
-            for j in range(len(self.values)):
-                result[i].append(self.values[j][i])
-        return Matrix(*result)
+        """Transposes a matrix. For array storage this is an O(1) view that shares the elements"""
+        if self.storage is not None:
+            return Matrix.from_storage(self.storage.transposed())
+        if backend.use_numpy():
+            return self._from_numpy(self._to_numpy().T, None)
+
+        rows, cols = self.shape
+        values = self.rows()
+        result = ([values[j][i] for j in range(rows)] for i in range(cols))
+        return self._from_rows(result, (cols, rows), None)
+
+    @property
+    def is_view(self) -> bool:
+        """Checks if the matrix shares its elements with another array-backed matrix"""
+        return self.storage is not None and self.storage.base is not None
+
+    def copy(self) -> Matrix:
+        """Returns a copy that owns its elements (contiguous for array storage)"""
+        if self.storage is not None:
+            return Matrix.from_storage(self.storage.copy())
+        return Matrix(*(list(row) for row in self._values))
+
+    def _split_index(self, index) -> tuple[int | slice, int | slice]:
+        """Splits m[i], m[i, j] or m[rows, cols] into a row and a column component"""
+        if not isinstance(index, tuple):
+            return index, slice(None)
+        if len(index) != 2:
+            raise IndexError("Matrix index must have two components")
+        return index
+
+    @staticmethod
+    def _check_position(i: int, size: int) -> int:
+        """Converts a possibly negative index into a position within `size`"""
+        if not -size <= i < size:
+            raise IndexError("Matrix index out of range")
+        return i + size if i < 0 else i
+
+    def __getitem__(self, index):
+        """Returns an element for m[i, j] and a sub-matrix for m[i], m[:, j] or m[r0:r1, c0:c1]
+
+        Sub-matrices of array-backed matrices are views: they share the elements with the
+        original matrix and cost O(1) to create. For list storage they are copies.
+        """
+        i, j = self._split_index(index)
+        rows, cols = self.shape
+        if isinstance(i, int) and isinstance(j, int):
+            i, j = self._check_position(i, rows), self._check_position(j, cols)
+            if self.storage is not None:
+                return self.storage[i, j]
+            return self._values[i][j]
+
+        if isinstance(i, int):
+            i = self._check_position(i, rows)
+            i = slice(i, i + 1)
+        if isinstance(j, int):
+            j = self._check_position(j, cols)
+            j = slice(j, j + 1)
+        if self.storage is not None:
+            return Matrix.from_storage(self.storage.sliced(i, j))
+        return Matrix(*(row[j] for row in self._values[i]))
+
+    def __setitem__(self, index: tuple[int, int], value: int | float):
+        """Writes an element m[i, j]. Writes through a view are visible in the original matrix"""
+        i, j = self._split_index(index)
+        if not isinstance(i, int) or not isinstance(j, int):
+            raise TypeError("Only single elements can be assigned")
+        rows, cols = self.shape
+        i, j = self._check_position(i, rows), self._check_position(j, cols)
+        if self.storage is not None:
+            self.storage[i, j] = value
+        else:
+            self._values[i][j] = value
+            self._modified()
 
     def __eq__(self, other: object) -> bool:
         """Checks if two matrices are equal"""
+        if isinstance(other, SparseMatrix):
+            return other == self
         if not isinstance(other, Matrix):
             raise NotImplementedError("Can only compare matrices with other matrices")
 
-        if len(self.values) != len(other.values):
+        if backend.use_numpy() and self.shape == other.shape:
+            return bool(backend.numpy.array_equal(self._to_numpy(), other._to_numpy()))
+
+        rows, other_rows = self.rows(), other.rows()
+        if len(rows) != len(other_rows):
             return False
-        for i in range(len(self.values)):
-            if len(self.values[i]) != len(other.values[i]):
+        for row, other_row in zip(rows, other_rows):
+            if len(row) != len(other_row):
                 return False
-            for j in range(len(self.values[i])):
-                if self.values[i][j] != other.values[i][j]:
+            for x, y in zip(row, other_row):
+                if x != y:
                     return False
         return True
+
+
+class SparseMatrix:
+    """Sparse matrix in CSR (compressed sparse row) format
+
+    Only nonzero elements are stored: `data` holds their values row by row, `indices` their
+    column numbers and `indptr[i]:indptr[i + 1]` is the slice of row `i` in both arrays.
+    Addition and multiplication take time proportional to the number of nonzeros.
+
+    Example of usage:
+    >>> sparse = SparseMatrix.from_coo([0, 1], [1, 0], [5, 7], shape=(2, 2))
+    >>> sparse.nnz # returns 2
+    >>> sparse * Vector(1, 2) # returns Vector(10, 7)
+    >>> sparse * Matrix([1, 0], [0, 1]) # returns Matrix([0, 5], [7, 0])
+    >>> sparse + Matrix([1, 1], [1, 1]) # returns Matrix([1, 6], [8, 1])
+    >>> sparse.to_dense() # returns Matrix([0, 5], [7, 0])
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, int],
+        data: list[int | float],
+        indices: Iterable[int],
+        indptr: Iterable[int],
+    ):
+        """Initializes a matrix from CSR arrays (column indices must be sorted within rows)"""
+        self.shape = shape
+        self.data = data
+        self.indices = array("q", indices)
+        self.indptr = array("q", indptr)
+
+        if len(self.indptr) != shape[0] + 1:
+            raise ValueError("indptr must have one entry per row plus one")
+        if len(self.indices) != len(self.data) or self.indptr[-1] != len(self.data):
+            raise ValueError("data and indices must have one entry per nonzero")
+
+    @classmethod
+    def from_coo(
+        cls,
+        rows: Iterable[int],
+        cols: Iterable[int],
+        values: Iterable[int | float],
+        shape: tuple[int, int],
+    ) -> SparseMatrix:
+        """Creates a matrix from COO triplets, summing duplicates and dropping zeros"""
+        entries: list[dict[int, int | float]] = [{} for _ in range(shape[0])]
+        for i, j, value in zip(rows, cols, values):
+            if not (0 <= i < shape[0] and 0 <= j < shape[1]):
+                raise IndexError(f"Element ({i}, {j}) is out of shape {shape}")
+            entries[i][j] = entries[i].get(j, 0) + value
+        return cls._from_row_dicts(entries, shape)
+
+    @classmethod
+    def from_dense(cls, matrix: Matrix) -> SparseMatrix:
+        """Converts a dense matrix, keeping only its nonzero elements"""
+        data: list[int | float] = []
+        indices: list[int] = []
+        indptr = [0]
+        for row in matrix.rows():
+            for j, value in enumerate(row):
+                if value != 0:
+                    data.append(value)
+                    indices.append(j)
+            indptr.append(len(data))
+        return cls(matrix.shape, data, indices, indptr)
+
+    @classmethod
+    def _from_row_dicts(
+        cls, entries: list[dict[int, int | float]], shape: tuple[int, int]
+    ) -> SparseMatrix:
+        """Builds CSR arrays from one {column: value} dict per row"""
+        data: list[int | float] = []
+        indices: list[int] = []
+        indptr = [0]
+        for row in entries:
+            for j in sorted(row):
+                if row[j] != 0:
+                    data.append(row[j])
+                    indices.append(j)
+            indptr.append(len(data))
+        return cls(shape, data, indices, indptr)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored (nonzero) elements"""
+        return len(self.data)
+
+    def row(self, i: int) -> Iterator[tuple[int, int | float]]:
+        """Iterates over (column, value) pairs of the nonzero elements of row `i`"""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return zip(self.indices[start:end], self.data[start:end])
+
+    def to_coo(self) -> tuple[list[int], list[int], list[int | float]]:
+        """Returns row indices, column indices and values of the nonzero elements"""
+        rows = [i for i in range(self.shape[0]) for _ in self.row(i)]
+        return rows, list(self.indices), list(self.data)
+
+    def to_dense(self, storage: Literal["list", "array"] = "list") -> Matrix:
+        """Converts the matrix into a dense one"""
+        result: list[list[int | float]] = [
+            [0] * self.shape[1] for _ in range(self.shape[0])
+        ]
+        for i, result_row in enumerate(result):
+            for j, value in self.row(i):
+                result_row[j] = value
+        return Matrix(*result, storage=storage)
+
+    def transpose(self) -> SparseMatrix:
+        """Transposes a matrix"""
+        rows, cols = self.shape
+        counts = [0] * (cols + 1)
+        for j in self.indices:
+            counts[j + 1] += 1
+        for j in range(cols):
+            counts[j + 1] += counts[j]
+
+        indptr = counts[:]
+        position = counts[:-1]
+        data: list[int | float] = [0] * self.nnz
+        indices = [0] * self.nnz
+        for i in range(rows):
+            for j, value in self.row(i):
+                data[position[j]] = value
+                indices[position[j]] = i
+                position[j] += 1
+        return SparseMatrix((cols, rows), data, indices, indptr)
+
+    def __add__(self, other: SparseMatrix | Matrix):
+        """Adds a sparse or a dense matrix. Sparse + sparse stays sparse, sparse + dense is dense"""
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if self.shape != other.shape:
+            raise ValueError("Matrices must have the same dimensions")
+
+        if isinstance(other, Matrix):
+            result = [list(row) for row in other.rows()]
+            for i, result_row in enumerate(result):
+                for j, value in self.row(i):
+                    result_row[j] += value
+            return Matrix(*result, storage=other.storage_kind)
+
+        entries: list[dict[int, int | float]] = []
+        for i in range(self.shape[0]):
+            row = dict(self.row(i))
+            for j, value in other.row(i):
+                row[j] = row.get(j, 0) + value
+            entries.append(row)
+        return SparseMatrix._from_row_dicts(entries, self.shape)
+
+    def __radd__(self, other: Matrix):
+        """Adds the matrix to a dense matrix on the left"""
+        return self.__add__(other)
+
+    def __mul__(self, other: SparseMatrix | Matrix | Vector | FrozenVector):
+        """Multiplies by a sparse matrix, a dense matrix or a vector"""
+        if isinstance(other, (Vector, FrozenVector)):
+            return self._multiply_vector(other)
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            return NotImplemented
+        if self.shape[1] != other.shape[0]:
+            raise ValueError("Matrices must have the same dimensions")
+
+        if isinstance(other, Matrix):
+            cols = other.shape[1]
+            other_rows = other.rows()
+            result = []
+            for i in range(self.shape[0]):
+                result_row: list[int | float] = [0] * cols
+                for k, value in self.row(i):
+                    result_row = [
+                        s + value * y for s, y in zip(result_row, other_rows[k])
+                    ]
+                result.append(result_row)
+            return Matrix(*result, storage=other.storage_kind)
+
+        entries: list[dict[int, int | float]] = []
+        for i in range(self.shape[0]):
+            row: dict[int, int | float] = {}
+            for k, value in self.row(i):
+                for j, other_value in other.row(k):
+                    row[j] = row.get(j, 0) + value * other_value
+            entries.append(row)
+        return SparseMatrix._from_row_dicts(entries, (self.shape[0], other.shape[1]))
+
+    def __rmul__(self, other: Matrix):
+        """Multiplies a dense matrix on the left by this matrix"""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if other.shape[1] != self.shape[0]:
+            raise ValueError("Matrices must have the same dimensions")
+
+        result = []
+        for row in other.rows():
+            result_row: list[int | float] = [0] * self.shape[1]
+            for k, value in enumerate(row):
+                if value != 0:
+                    for j, other_value in self.row(k):
+                        result_row[j] += value * other_value
+            result.append(result_row)
+        return Matrix(*result, storage=other.storage_kind)
+
+    def _multiply_vector(self, vector: Vector | FrozenVector) -> Vector:
+        """Multiplies the matrix by a column vector"""
+        values = list(vector.values)
+        if len(values) != self.shape[1]:
+            raise ValueError("Vector length must match the number of columns")
+        return Vector(
+            *(
+                sum(value * values[j] for j, value in self.row(i))
+                for i in range(self.shape[0])
+            )
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if the matrix is equal to a sparse or a dense matrix"""
+        if isinstance(other, Matrix):
+            other = SparseMatrix.from_dense(other)
+        if not isinstance(other, SparseMatrix):
+            raise NotImplementedError("Can only compare matrices with other matrices")
+
+        return (
+            self.shape == other.shape
+            and self.indptr == other.indptr
+            and self.indices == other.indices
+            and self.data == other.data
+        )
+
+    def __repr__(self) -> str:
+        """Returns a representation of the matrix"""
+        return f"SparseMatrix(shape={self.shape}, nnz={self.nnz})"
@@ -0,0 +1,183 @@
+from __future__ import annotations
+from typing import Literal, Sequence
+
+Rows = Sequence[Sequence[int | float]]
+MultiplicationMethod = Literal["auto", "naive", "blocked", "strassen"]
+
+
+def multiply_naive(a: Rows, b: Rows, cols: int) -> list[list[int | float]]:
+    """Textbook triple loop, walks `b` column by column"""
+    inner = len(b)
+    return [
+        [sum(row[k] * b[k][j] for k in range(inner)) for j in range(cols)] for row in a
+    ]
+
+
+def multiply_blocked(
+    a: Rows, b: Rows, cols: int, block_size: int = 128
+) -> list[list[int | float]]:
+    """Tiled multiplication in i-k-j order
+
+    For every tile of `block_size` rows of `b` and `block_size` columns, each row of `a`
+    accumulates its partial products into a slice of the result row, so `b` is read row by
+    row and a tile stays hot while all rows of `a` pass over it. Products are summed in the
+    same order as in the naive kernel, so the results are identical.
+    """
+    inner = len(b)
+    result: list[list[int | float]] = [[0] * cols for _ in range(len(a))]
+
+    for k_start in range(0, inner, block_size):
+        k_end = min(k_start + block_size, inner)
+        for j_start in range(0, cols, block_size):
+            j_end = min(j_start + block_size, cols)
+            tile = [b[k][j_start:j_end] for k in range(k_start, k_end)]
+
+            for row, result_row in zip(a, result):
+                accumulator = result_row[j_start:j_end]
+                for x, tile_row in zip(row[k_start:k_end], tile):
+                    accumulator = [s + x * y for s, y in zip(accumulator, tile_row)]
+                result_row[j_start:j_end] = accumulator
+
+    return result
+
+
+def _block(
+    rows: Rows, row_start: int, col_start: int, height: int, width: int
+) -> list[list[int | float]]:
+    """Copies a block of the given size, padding it with zeros outside of `rows`"""
+    block: list[list[int | float]] = []
+    for i in range(row_start, row_start + height):
+        if i < len(rows):
+            row = list(rows[i][col_start : col_start + width])
+            row.extend([0] * (width - len(row)))
+        else:
+            row = [0] * width
+        block.append(row)
+    return block
+
+
+def _add(a: Rows, b: Rows) -> list[list[int | float]]:
+    """Adds two blocks of the same size"""
+    return [[x + y for x, y in zip(row, other)] for row, other in zip(a, b)]
+
+
+def _sub(a: Rows, b: Rows) -> list[list[int | float]]:
+    """Subtracts two blocks of the same size"""
+    return [[x - y for x, y in zip(row, other)] for row, other in zip(a, b)]
+
+
+def multiply_strassen(
+    a: Rows, b: Rows, cols: int, threshold: int = 128, block_size: int = 128
+) -> list[list[int | float]]:
+    """Recursive Strassen multiplication
+
+    Every level replaces 8 half-size products with 7. Odd dimensions are padded with zeros.
+    Once any dimension drops to `threshold` or below the blocked kernel takes over.
+    For floats the result may differ from the naive kernel by rounding.
+    """
+    n, inner = len(a), len(b)
+    if min(n, inner, cols) <= threshold:
+        return multiply_blocked(a, b, cols, block_size)
+
+    h, m, w = (n + 1) // 2, (inner + 1) // 2, (cols + 1) // 2
+    a11, a12 = _block(a, 0, 0, h, m), _block(a, 0, m, h, m)
+    a21, a22 = _block(a, h, 0, h, m), _block(a, h, m, h, m)
+    b11, b12 = _block(b, 0, 0, m, w), _block(b, 0, w, m, w)
+    b21, b22 = _block(b, m, 0, m, w), _block(b, m, w, m, w)
+
+    def multiply(x: Rows, y: Rows) -> list[list[int | float]]:
+        return multiply_strassen(x, y, w, threshold, block_size)
+
+    p1 = multiply(_add(a11, a22), _add(b11, b22))
+    p2 = multiply(_add(a21, a22), b11)
+    p3 = multiply(a11, _sub(b12, b22))
+    p4 = multiply(a22, _sub(b21, b11))
+    p5 = multiply(_add(a11, a12), b22)
+    p6 = multiply(_sub(a21, a11), _add(b11, b12))
+    p7 = multiply(_sub(a12, a22), _add(b21, b22))
+
+    c11 = _add(_sub(_add(p1, p4), p5), p7)
+    c12 = _add(p3, p5)
+    c21 = _add(p2, p4)
+    c22 = _add(_add(_sub(p1, p2), p3), p6)
+
+    top = [left + right for left, right in zip(c11, c12)]
+    bottom = [left + right for left, right in zip(c21, c22)]
+    return [row[:cols] for row in (top + bottom)[:n]]
+
+
+def choose_method(
+    rows: int, inner: int, cols: int, strassen_threshold: int = 128
+) -> MultiplicationMethod:
+    """Picks a kernel by the shape of the product
+
+    Strassen pays off only when all three dimensions are large and close to each other,
+    otherwise padding and extra additions eat the saved multiplications.
+    """
+    smallest, largest = min(rows, inner, cols), max(rows, inner, cols)
+    if smallest > strassen_threshold and largest <= 2 * smallest:
+        return "strassen"
+    return "blocked"
+
+
+def multiply(
+    a: Rows,
+    b: Rows,
+    cols: int,
+    method: MultiplicationMethod = "auto",
+    block_size: int = 128,
+    strassen_threshold: int = 128,
+) -> list[list[int | float]]:
+    """Multiplies two matrices given as row sequences with the selected kernel
+
+    Args:
+        a (Rows): rows of the left matrix
+        b (Rows): rows of the right matrix
+        cols (int): number of columns of the right matrix
+        method (MultiplicationMethod, optional): kernel to use. Defaults to "auto" (chosen by shape).
+        block_size (int, optional): tile size of the blocked kernel. Defaults to 128.
+        strassen_threshold (int, optional): size below which Strassen recursion stops. Defaults to 128.
+
+    Returns:
+        list[list[int | float]]: rows of the product
+    """
+    if method == "auto":
+        method = choose_method(len(a), len(b), cols, strassen_threshold)
+
+    if method == "naive":
+        return multiply_naive(a, b, cols)
+    if method == "blocked":
+        return multiply_blocked(a, b, cols, block_size)
+    if method == "strassen":
+        return multiply_strassen(a, b, cols, strassen_threshold, block_size)
+    raise ValueError(f"Unknown multiplication method: {method}")
+
+
+def chain_order(dims: Sequence[int]) -> tuple[int, list[list[int]]]:
+    """Finds the cheapest parenthesization of a matrix chain by dynamic programming
+
+    Args:
+        dims (Sequence[int]): matrix `i` of the chain has shape (dims[i], dims[i + 1])
+
+    Returns:
+        tuple[int, list[list[int]]]: number of scalar multiplications of the best order and
+            a table where split[i][j] is the index `k` such that the product of matrices
+            i..j is best computed as (i..k) * (k + 1..j)
+    """
+    count = len(dims) - 1
+    cost = [[0] * count for _ in range(count)]
+    split = [[0] * count for _ in range(count)]
+
+    for length in range(2, count + 1):
+        for i in range(count - length + 1):
+            j = i + length - 1
+            cost[i][j] = -1
+            for k in range(i, j):
+                candidate = (
+                    cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+                )
+                if cost[i][j] < 0 or candidate < cost[i][j]:
+                    cost[i][j] = candidate
+                    split[i][j] = k
+
+    return (cost[0][count - 1] if count else 0), split
@@ -0,0 +1,299 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from operator import add
+from typing import TYPE_CHECKING, Iterator, Sequence
+
+from .kernels import chain_order
+from .storage import infer_typecode, promote_typecodes
+
+if TYPE_CHECKING:
+    from .index import Matrix
+
+
+class Expression(ABC):
+    """Node of a lazy matrix expression tree"""
+
+    @property
+    @abstractmethod
+    def shape(self) -> tuple[int, int]:
+        """Number of rows and columns of the expression result"""
+
+
+@dataclass
+class Leaf(Expression):
+    """Concrete matrix, optionally read transposed (by swapping indices, without copying)"""
+
+    matrix: Matrix
+    transposed: bool = False
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        rows, cols = self.matrix.shape
+        return (cols, rows) if self.transposed else (rows, cols)
+
+
+@dataclass
+class Sum(Expression):
+    """Elementwise sum of any number of terms"""
+
+    terms: list[Expression]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.terms[0].shape
+
+
+@dataclass
+class Product(Expression):
+    """Chain of matrix products"""
+
+    factors: list[Expression]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.factors[0].shape[0], self.factors[-1].shape[1]
+
+
+@dataclass
+class Transpose(Expression):
+    """Transposition of a subexpression"""
+
+    operand: Expression
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        rows, cols = self.operand.shape
+        return cols, rows
+
+
+def optimize(expression: Expression, transposed: bool = False) -> Expression:
+    """Rewrites an expression into an equivalent one that is cheaper to evaluate
+
+    Transpositions are pushed down to the leaves, where they become index swaps
+    ((A + B)^T = A^T + B^T, (AB)^T = B^T A^T, (A^T)^T = A), and nested sums and
+    products are flattened into n-ary nodes, so they can be fused and reordered.
+    """
+    if isinstance(expression, Leaf):
+        return Leaf(expression.matrix, expression.transposed != transposed)
+    if isinstance(expression, Transpose):
+        return optimize(expression.operand, not transposed)
+
+    if isinstance(expression, Sum):
+        terms: list[Expression] = []
+        for term in expression.terms:
+            optimized = optimize(term, transposed)
+            terms.extend(optimized.terms if isinstance(optimized, Sum) else [optimized])
+        return Sum(terms)
+
+    if isinstance(expression, Product):
+        factors: list[Expression] = []
+        ordered = expression.factors[::-1] if transposed else expression.factors
+        for factor in ordered:
+            optimized = optimize(factor, transposed)
+            if isinstance(optimized, Product):
+                factors.extend(optimized.factors)
+            else:
+                factors.append(optimized)
+        return Product(factors)
+
+    raise TypeError(f"Unknown expression: {expression!r}")
+
+
+def evaluate(expression: Expression) -> Matrix:
+    """Optimizes and evaluates an expression into a new matrix"""
+    optimized = optimize(expression)
+    leaf = _evaluate(optimized)
+    matrix = leaf.matrix.transpose() if leaf.transposed else leaf.matrix
+    # An expression that reduces to an operand must not return it (or a view of it)
+    if any(leaf.matrix is source.matrix for source in _leaves(optimized)):
+        if matrix._shares_elements(leaf.matrix):
+            matrix = matrix.copy()
+    return matrix
+
+
+def _leaves(expression: Expression) -> Iterator[Leaf]:
+    """Iterates over the leaves of an expression"""
+    if isinstance(expression, Leaf):
+        yield expression
+    elif isinstance(expression, Sum):
+        for term in expression.terms:
+            yield from _leaves(term)
+    elif isinstance(expression, Product):
+        for factor in expression.factors:
+            yield from _leaves(factor)
+    elif isinstance(expression, Transpose):
+        yield from _leaves(expression.operand)
+
+
+def _evaluate(expression: Expression) -> Leaf:
+    """Evaluates an optimized expression, leaving a transposed leaf as it is"""
+    if isinstance(expression, Leaf):
+        return expression
+    if isinstance(expression, Sum):
+        return Leaf(_fused_sum([_evaluate(term) for term in expression.terms]))
+    if isinstance(expression, Product):
+        factors = [_evaluate(factor) for factor in expression.factors]
+        dims = [factors[0].shape[0]] + [factor.shape[1] for factor in factors]
+        _, split = chain_order(dims)
+        return _evaluate_chain(factors, split, 0, len(factors) - 1)
+    raise TypeError(f"Unknown expression: {expression!r}")
+
+
+def _result_typecode(leaves: list[Leaf]) -> str | None:
+    """Typecode of a result computed from the leaves, None if all of them use list storage"""
+    if all(leaf.matrix.storage is None for leaf in leaves):
+        return None
+    return promote_typecodes(
+        *(
+            leaf.matrix.storage.typecode
+            if leaf.matrix.storage is not None
+            else infer_typecode(x for row in leaf.matrix.rows() for x in row)
+            for leaf in leaves
+        )
+    )
+
+
+def _rows(leaf: Leaf) -> Sequence[Sequence[int | float]]:
+    """Returns the rows of a leaf, reading columns of the matrix for a transposed leaf
+
+    Array-backed matrices are read through strided column views, without copying.
+    """
+    matrix = leaf.matrix
+    if not leaf.transposed:
+        return matrix.rows()
+    if matrix.storage is not None:
+        return matrix.storage.transposed().rows()
+    return [list(column) for column in zip(*matrix.rows())]
+
+
+def _fused_sum(terms: list[Leaf]) -> Matrix:
+    """Adds all terms in a single pass, without intermediate matrices"""
+    rows, cols = terms[0].shape
+    for term in terms[1:]:
+        if term.shape != (rows, cols):
+            raise ValueError("Matrices must have the same dimensions")
+
+    term_rows = [_rows(term) for term in terms]
+
+    def result_row(i: int) -> list[int | float]:
+        accumulator = list(term_rows[0][i])
+        for rows_of_term in term_rows[1:]:
+            accumulator = list(map(add, accumulator, rows_of_term[i]))
+        return accumulator
+
+    matrix = terms[0].matrix
+    return matrix._from_rows(
+        (result_row(i) for i in range(rows)), (rows, cols), _result_typecode(terms)
+    )
+
+
+def _evaluate_chain(
+    factors: list[Leaf], split: list[list[int]], start: int, end: int
+) -> Leaf:
+    """Multiplies factors[start..end] in the order given by the split table"""
+    if start == end:
+        return factors[start]
+    middle = split[start][end]
+    left = _evaluate_chain(factors, split, start, middle)
+    right = _evaluate_chain(factors, split, middle + 1, end)
+    return _multiply(left, right)
+
+
+def _multiply(left: Leaf, right: Leaf) -> Leaf:
+    """Multiplies two leaves, reading transposed operands by index instead of copying them"""
+    if left.shape[1] != right.shape[0]:
+        raise ValueError("Matrices must have the same dimensions")
+
+    a, b = left.matrix, right.matrix
+    if not left.transposed and not right.transposed:
+        return Leaf(a.multiply(b))
+    if left.transposed and right.transposed:
+        # A^T B^T = (B A)^T
+        return Leaf(b.multiply(a), transposed=True)
+
+    rows, cols = left.shape[0], right.shape[1]
+    typecode = _result_typecode([left, right])
+    if right.transposed:
+        # (A B^T)[i][j] is the dot product of row i of A and row j of B
+        b_rows = b.rows()
+        result = (
+            [sum(x * y for x, y in zip(a_row, b_row)) for b_row in b_rows]
+            for a_row in a.rows()
+        )
+        return Leaf(a._from_rows(result, (rows, cols), typecode))
+
+    # A^T B is the sum over k of outer products of row k of A and row k of B
+    accumulator: list[list[int | float]] = [[0] * cols for _ in range(rows)]
+    for a_row, b_row in zip(a.rows(), b.rows()):
+        for i, x in enumerate(a_row):
+            accumulator[i] = [s + x * y for s, y in zip(accumulator[i], b_row)]
+    return Leaf(a._from_rows(accumulator, (rows, cols), typecode))
+
+
+class LazyMatrix:
+    """Matrix expression that is built by +, * and transpose() and evaluated on demand
+
+    Evaluation pushes transpositions down to the operands, where they are read by swapping
+    indices, adds all terms of a sum in one pass and multiplies chains of products in the
+    cheapest order.
+
+    Example of usage:
+    >>> a, b, c = Matrix([1, 2], [3, 4]), Matrix([5, 6], [7, 8]), Matrix([1, 0], [0, 1])
+    >>> expression = (a.lazy() + b) * c.lazy().transpose() # nothing is computed yet
+    >>> expression.evaluate() # returns Matrix([6, 8], [10, 12])
+    """
+
+    def __init__(self, expression: Expression):
+        """Initializes a lazy matrix with the given expression tree"""
+        self.expression = expression
+
+    @staticmethod
+    def _wrap(value: LazyMatrix | Matrix) -> Expression:
+        """Returns the expression of a lazy matrix or a leaf for a concrete one"""
+        if isinstance(value, LazyMatrix):
+            return value.expression
+        return Leaf(value)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Number of rows and columns of the result"""
+        return self.expression.shape
+
+    def __add__(self, other: LazyMatrix | Matrix) -> LazyMatrix:
+        """Adds a matrix to the expression"""
+        operand = self._wrap(other)
+        if self.shape != operand.shape:
+            raise ValueError("Matrices must have the same dimensions")
+        return LazyMatrix(Sum([self.expression, operand]))
+
+    def __radd__(self, other: Matrix) -> LazyMatrix:
+        """Adds the expression to a concrete matrix on the left"""
+        return LazyMatrix(Leaf(other)) + self
+
+    def __mul__(self, other: LazyMatrix | Matrix) -> LazyMatrix:
+        """Multiplies the expression by a matrix"""
+        operand = self._wrap(other)
+        if self.shape[1] != operand.shape[0]:
+            raise ValueError("Matrices must have the same dimensions")
+        return LazyMatrix(Product([self.expression, operand]))
+
+    def __rmul__(self, other: Matrix) -> LazyMatrix:
+        """Multiplies a concrete matrix on the left by the expression"""
+        return LazyMatrix(Leaf(other)) * self
+
+    def transpose(self) -> LazyMatrix:
+        """Transposes the expression"""
+        return LazyMatrix(Transpose(self.expression))
+
+    def optimized(self) -> Expression:
+        """Returns the rewritten expression tree that evaluate() will compute"""
+        return optimize(self.expression)
+
+    def evaluate(self) -> Matrix:
+        """Computes the expression"""
+        return evaluate(self.expression)
+
+    def __repr__(self) -> str:
+        """Returns a representation of the expression"""
+        return f"LazyMatrix({self.expression!r})"
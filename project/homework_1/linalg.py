@@ -0,0 +1,166 @@
+from __future__ import annotations
+from array import array
+from typing import Sequence
+import math
+import sys
+
+from . import index
+
+
+class LUFactorization:
+    """LU factorization with partial pivoting: P A = L U
+
+    L (unit lower triangular) and U (upper triangular) are kept together in one n x n
+    table, and the row permutation P as a list. Factorizing costs O(n^3) once, after that
+    every right-hand side is solved by forward and back substitution in O(n^2).
+
+    Example of usage:
+    >>> factorization = Matrix([4, 3], [6, 3]).lu()
+    >>> factorization.solve(Vector(10, 12)) # returns Vector(1.0, 2.0)
+    >>> factorization.solve(Matrix([10, 7], [12, 9])) # one solution per column
+    >>> factorization.det() # returns -6.0
+    >>> factorization.inverse() # returns Matrix([-0.5, 0.5], [1.0, -0.666...])
+    """
+
+    def __init__(self, matrix: index.Matrix):
+        """Factorizes a square matrix
+
+        Raises:
+            ValueError: if the matrix is not square
+        """
+        size, cols = matrix.shape
+        if size != cols:
+            raise ValueError("Only square matrices can be factorized")
+
+        self.matrix = matrix
+        self.version = matrix.version
+        self.size = size
+        self.elements = [tuple(row) for row in matrix.rows()]
+        self.factors = [[float(x) for x in row] for row in self.elements]
+        self.permutation = list(range(size))
+        self.sign = 1
+        self.singular = False
+
+        # A pivot this small relative to its original column is a rounding error of an
+        # exact zero. Scaling per column keeps badly scaled nonsingular matrices regular.
+        tolerances = [
+            sys.float_info.epsilon * size * max(abs(row[k]) for row in self.factors)
+            for k in range(size)
+        ]
+
+        factors = self.factors
+        for k in range(size):
+            pivot_row = max(range(k, size), key=lambda i: abs(factors[i][k]))
+            if abs(factors[pivot_row][k]) <= tolerances[k]:
+                self.singular = True
+                continue
+            if pivot_row != k:
+                factors[k], factors[pivot_row] = factors[pivot_row], factors[k]
+                self.permutation[k], self.permutation[pivot_row] = (
+                    self.permutation[pivot_row],
+                    self.permutation[k],
+                )
+                self.sign = -self.sign
+
+            pivot_values = factors[k]
+            pivot_tail = pivot_values[k + 1 :]
+            for row in factors[k + 1 :]:
+                factor = row[k] / pivot_values[k]
+                row[k] = factor
+                if factor:
+                    row[k + 1 :] = [
+                        x - factor * y for x, y in zip(row[k + 1 :], pivot_tail)
+                    ]
+
+    def matches(self, matrix: index.Matrix) -> bool:
+        """Checks if the matrix still has the elements that were factorized, in O(n^2)"""
+        return matrix.version == self.version and all(
+            tuple(row) == elements
+            for row, elements in zip(matrix.rows(), self.elements)
+        )
+
+    def det(self) -> float:
+        """Calculates the determinant of the matrix from the diagonal of U"""
+        if self.singular:
+            return 0.0
+        return self.sign * math.prod(self.factors[i][i] for i in range(self.size))
+
+    def _check_solvable(self) -> None:
+        """Raises ValueError if the matrix is singular"""
+        if self.singular:
+            raise ValueError("Matrix is singular")
+
+    def _solve_vector(self, values: Sequence[int | float]) -> list[float]:
+        """Solves A x = b for one right-hand side"""
+        if len(values) != self.size:
+            raise ValueError("Right-hand side length does not match the matrix")
+        factors = self.factors
+        x = [float(values[p]) for p in self.permutation]
+
+        for i in range(self.size):
+            row = factors[i]
+            x[i] -= sum(row[j] * x[j] for j in range(i))
+        for i in reversed(range(self.size)):
+            row = factors[i]
+            x[i] = (x[i] - sum(row[j] * x[j] for j in range(i + 1, self.size))) / row[i]
+        return x
+
+    def _solve_rows(self, rows: Sequence[Sequence[int | float]]) -> list[list[float]]:
+        """Solves A X = B for all columns of B at once, updating whole rows of B"""
+        if len(rows) != self.size:
+            raise ValueError("Right-hand side rows do not match the matrix")
+        factors = self.factors
+        x = [[float(value) for value in rows[p]] for p in self.permutation]
+
+        for i in range(self.size):
+            row = factors[i]
+            for j in range(i):
+                if row[j]:
+                    x[i] = [s - row[j] * y for s, y in zip(x[i], x[j])]
+        for i in reversed(range(self.size)):
+            row = factors[i]
+            for j in range(i + 1, self.size):
+                if row[j]:
+                    x[i] = [s - row[j] * y for s, y in zip(x[i], x[j])]
+            x[i] = [s / row[i] for s in x[i]]
+        return x
+
+    def solve(self, b: index.Vector | index.Matrix) -> index.Vector | index.Matrix:
+        """Solves A x = b
+
+        Args:
+            b (Vector | Matrix): a single right-hand side, or a matrix whose columns are
+                a batch of right-hand sides
+
+        Raises:
+            ValueError: if the matrix is singular or the shapes do not match
+
+        Returns:
+            Vector | Matrix: the solution, of the same kind and storage as `b`
+        """
+        self._check_solvable()
+        if isinstance(b, index.Matrix):
+            typecode = "d" if b.storage is not None else None
+            return b._from_rows(self._solve_rows(b.rows()), b.shape, typecode)
+
+        values = list(b.values)
+        solution = self._solve_vector(values)
+        if isinstance(b.values, (array, memoryview)):
+            return index.Vector(*solution, storage="array")
+        return index.Vector(*solution)
+
+    def inverse(self) -> index.Matrix:
+        """Calculates the inverse matrix by solving for every column of the identity
+
+        Raises:
+            ValueError: if the matrix is singular
+        """
+        self._check_solvable()
+        identity = [[float(i == j) for j in range(self.size)] for i in range(self.size)]
+        typecode = "d" if self.matrix.storage is not None else None
+        shape = (self.size, self.size)
+        return self.matrix._from_rows(self._solve_rows(identity), shape, typecode)
+
+    def __repr__(self) -> str:
+        """Returns a representation of the factorization"""
+        return f"LUFactorization(size={self.size}, singular={self.singular})"
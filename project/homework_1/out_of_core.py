@@ -0,0 +1,146 @@
+from __future__ import annotations
+from array import array
+from operator import add
+from typing import Literal
+import mmap
+import os
+
+from .index import Matrix
+from .kernels import multiply_blocked
+from .storage import ArrayStorage, infer_typecode, promote_typecodes
+
+MappingMode = Literal["r", "r+", "w+"]
+
+
+def open_mapped(
+    path: str | os.PathLike,
+    shape: tuple[int, int],
+    typecode: str = "d",
+    mode: MappingMode = "r",
+) -> Matrix:
+    """Opens a matrix stored in a file as raw row-major elements, without loading it into RAM
+
+    The file is memory-mapped, so the OS pages elements in on access and evicts them under
+    memory pressure. Matrix operations work on the result as on any array-backed matrix.
+
+    Args:
+        path (str | os.PathLike): file with rows * cols elements in native byte order
+        shape (tuple[int, int]): number of rows and columns
+        typecode (str, optional): `array` typecode of the elements. Defaults to "d" (float64).
+        mode (MappingMode, optional): "r" read-only, "r+" read-write, "w+" create (or
+            truncate) a zero-filled file. Defaults to "r".
+
+    Returns:
+        Matrix: matrix backed by the mapped file
+    """
+    return Matrix.from_storage(_map(path, shape, typecode, mode))
+
+
+def _map(
+    path: str | os.PathLike, shape: tuple[int, int], typecode: str, mode: MappingMode
+) -> ArrayStorage:
+    """Maps a file of raw elements into a storage"""
+    nbytes = shape[0] * shape[1] * array(typecode).itemsize
+    if nbytes == 0:
+        raise ValueError("Mapped matrices must not be empty")
+
+    access = mmap.ACCESS_READ if mode == "r" else mmap.ACCESS_WRITE
+    with open(path, {"r": "rb", "r+": "r+b", "w+": "w+b"}[mode]) as file:
+        if mode == "w+":
+            file.truncate(nbytes)
+        elif os.fstat(file.fileno()).st_size != nbytes:
+            raise ValueError(f"File size does not match shape {shape}")
+        mapping = mmap.mmap(file.fileno(), nbytes, access=access)
+
+    return ArrayStorage(typecode, shape, mapping)
+
+
+def flush(matrix: Matrix) -> None:
+    """Writes changes of a mapped matrix back to its file"""
+    if matrix.storage is not None and isinstance(matrix.storage.buffer, mmap.mmap):
+        matrix.storage.buffer.flush()
+
+
+def add_tiled(
+    a: Matrix,
+    b: Matrix,
+    out_path: str | os.PathLike,
+    tile_rows: int = 1024,
+) -> Matrix:
+    """Adds two matrices row block by row block, streaming the result into a mapped file
+
+    Only `tile_rows` rows of each operand are touched at a time, so operands and result
+    may be larger than RAM.
+    """
+    if a.shape != b.shape:
+        raise ValueError("Matrices must have the same dimensions")
+
+    typecode = promote_typecodes(*_typecodes(a, b))
+    result = _map(out_path, a.shape, typecode, mode="w+")
+
+    for start in range(0, a.shape[0], tile_rows):
+        end = min(start + tile_rows, a.shape[0])
+        a_rows, b_rows = a[start:end].rows(), b[start:end].rows()
+        for i, (a_row, b_row) in enumerate(zip(a_rows, b_rows), start):
+            result.row(i)[:] = array(typecode, map(add, a_row, b_row))
+
+    out = Matrix.from_storage(result)
+    flush(out)
+    return out
+
+
+def multiply_tiled(
+    a: Matrix,
+    b: Matrix,
+    out_path: str | os.PathLike,
+    tile: int = 256,
+) -> Matrix:
+    """Multiplies two matrices tile by tile, streaming the result into a mapped file
+
+    Every `tile` x `tile` block of the result is accumulated in memory from the matching
+    row block of `a` and column block of `b` and then written out, so memory use is
+    O(tile^2) regardless of the matrix sizes.
+    """
+    rows, inner = a.shape
+    if inner != b.shape[0]:
+        raise ValueError("Matrices must have the same dimensions")
+    cols = b.shape[1]
+
+    typecode = promote_typecodes(*_typecodes(a, b))
+    result = _map(out_path, (rows, cols), typecode, mode="w+")
+
+    for i_start in range(0, rows, tile):
+        i_end = min(i_start + tile, rows)
+        for j_start in range(0, cols, tile):
+            j_end = min(j_start + tile, cols)
+            accumulator: list[list[int | float]] = [
+                [0] * (j_end - j_start) for _ in range(i_end - i_start)
+            ]
+
+            for k_start in range(0, inner, tile):
+                k_end = min(k_start + tile, inner)
+                a_tile = a[i_start:i_end, k_start:k_end].rows()
+                b_tile = b[k_start:k_end, j_start:j_end].rows()
+                partial = multiply_blocked(a_tile, b_tile, j_end - j_start, tile)
+                accumulator = [
+                    [s + x for s, x in zip(row, partial_row)]
+                    for row, partial_row in zip(accumulator, partial)
+                ]
+
+            block = result.sliced(slice(i_start, i_end), slice(j_start, j_end))
+            for i, row in enumerate(accumulator):
+                block.row(i)[:] = array(typecode, row)
+
+    out = Matrix.from_storage(result)
+    flush(out)
+    return out
+
+
+def _typecodes(*matrices: Matrix) -> list[str]:
+    """Typecodes of the operands, inferred from the values for list-backed matrices"""
+    return [
+        m.storage.typecode
+        if m.storage is not None
+        else infer_typecode(x for row in m.rows() for x in row)
+        for m in matrices
+    ]
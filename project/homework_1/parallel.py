@@ -0,0 +1,138 @@
+from __future__ import annotations
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Iterable
+import os
+
+from .kernels import Rows, multiply_blocked
+from .storage import ArrayStorage, infer_typecode
+
+# Operands of the current product, attached once per worker process by `_attach`
+_operands: dict[str, Any] = {}
+
+INT64_MAX = 2**63 - 1
+
+
+def fits_int64(a: Rows, b: Rows) -> bool:
+    """Checks if the product of two integer matrices can be computed in int64 without overflow
+
+    An element of the product is a sum of len(b) products, so its magnitude is at most
+    len(b) * max|a| * max|b|. Operands with floats give a float64 product and always fit.
+    """
+    largest = []
+    for operand in (a, b):
+        magnitude = 0
+        for row in operand:
+            for x in row:
+                if not isinstance(x, int):
+                    return True
+                magnitude = max(magnitude, abs(x))
+        largest.append(magnitude)
+    return len(b) * largest[0] * largest[1] <= INT64_MAX
+
+
+def _typed_view(block: shared_memory.SharedMemory, typecode: str) -> memoryview:
+    """Views a shared memory block as an array of the given typecode"""
+    return block.buf.cast(typecode)  # type: ignore[union-attr, call-overload]
+
+
+def _share(typecode: str, size: int, values: Iterable[int | float] | None = None):
+    """Allocates a shared memory block for `size` elements, optionally filling it"""
+    itemsize = array(typecode).itemsize
+    block = shared_memory.SharedMemory(create=True, size=max(size * itemsize, 1))
+    if values is not None and size:
+        _typed_view(block, typecode)[:size] = array(typecode, values)
+    return block
+
+
+def _attach(
+    names: tuple[str, str, str], shape: tuple[int, int, int], typecode: str
+) -> None:
+    """Worker initializer: attaches to the operand blocks by name instead of unpickling them"""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    _operands["blocks"] = blocks
+    _operands["views"] = [_typed_view(block, typecode) for block in blocks]
+    _operands["shape"] = shape
+    _operands["typecode"] = typecode
+
+
+def _multiply_block(start: int, end: int, block_size: int) -> None:
+    """Computes rows [start, end) of the product and writes them into the result block"""
+    a, b, c = _operands["views"]
+    rows, inner, cols = _operands["shape"]
+    a_rows = [a[i * inner : (i + 1) * inner] for i in range(start, end)]
+    b_rows = [b[k * cols : (k + 1) * cols] for k in range(inner)]
+
+    result = multiply_blocked(a_rows, b_rows, cols, block_size)
+    c[start * cols : end * cols] = array(
+        _operands["typecode"], (x for row in result for x in row)
+    )
+
+
+def multiply_parallel(
+    a: Rows,
+    b: Rows,
+    cols: int,
+    workers: int | None = None,
+    typecode: str | None = None,
+    block_size: int = 128,
+) -> ArrayStorage:
+    """Multiplies two matrices in a process pool
+
+    Operands are copied once into `multiprocessing.shared_memory` blocks, every worker attaches
+    to them by name and computes a contiguous block of result rows straight into a shared
+    result block, so neither operands nor results are pickled.
+
+    Args:
+        a (Rows): rows of the left matrix
+        b (Rows): rows of the right matrix
+        cols (int): number of columns of the right matrix
+        workers (int | None, optional): number of processes. Defaults to the number of CPUs.
+        typecode (str | None, optional): element typecode. Defaults to 'q' for ints, 'd' otherwise.
+        block_size (int, optional): tile size of the blocked kernel inside workers. Defaults to 128.
+
+    Raises:
+        OverflowError: if integer operands are inferred as 'q' but the product does not fit in int64
+
+    Returns:
+        ArrayStorage: the product in row-major order
+    """
+    rows, inner = len(a), len(b)
+    workers = workers or os.cpu_count() or 1
+    if typecode is None:
+        typecode = infer_typecode(
+            x for operand in (a, b) for row in operand for x in row
+        )
+        if typecode == "q" and not fits_int64(a, b):
+            raise OverflowError("Integer product does not fit in int64")
+
+    blocks = [
+        _share(typecode, rows * inner, (x for row in a for x in row)),
+        _share(typecode, inner * cols, (x for row in b for x in row)),
+        _share(typecode, rows * cols),
+    ]
+    try:
+        names = (blocks[0].name, blocks[1].name, blocks[2].name)
+        chunk = max(1, -(-rows // workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach,
+            initargs=(names, (rows, inner, cols), typecode),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _multiply_block, start, min(start + chunk, rows), block_size
+                )
+                for start in range(0, rows, chunk)
+            ]
+            for future in futures:
+                future.result()
+
+        result = array(typecode)
+        result.frombytes(blocks[2].buf[: rows * cols * result.itemsize])
+        return ArrayStorage(typecode, (rows, cols), result)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
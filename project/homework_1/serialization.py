@@ -0,0 +1,131 @@
+"""Binary format for matrices and vectors
+
+A file is a fixed header followed by raw elements. All integers are little-endian:
+
+    offset  size      field
+    0       4         magic b"HWLA"
+    4       1         format version, currently 1
+    5       1         element type as an ASCII `array` typecode:
+                      'i' int32, 'q' int64, 'f' float32, 'd' float64
+    6       1         number of dimensions: 1 for a vector, 2 for a matrix
+    7       1         reserved, always 0
+    8       8 * ndim  shape, one uint64 per dimension
+    8 + 8 * ndim      elements in row-major order, little-endian
+
+The header length is a multiple of 8, so the elements are aligned for every element
+type, and a file can be memory-mapped and used in place without parsing or copying.
+"""
+from __future__ import annotations
+from array import array
+from typing import Any, BinaryIO, Iterable
+import math
+import mmap as mmap_module
+import os
+import struct
+import sys
+
+MAGIC = b"HWLA"
+VERSION = 1
+ITEMSIZES = {"i": 4, "q": 8, "f": 4, "d": 8}
+
+_PREFIX = struct.Struct("<4sBcBx")
+
+
+def write(
+    path: str | os.PathLike,
+    typecode: str,
+    shape: tuple[int, ...],
+    rows: Iterable[Iterable[int | float]],
+) -> None:
+    """Writes a header and then the elements, given as rows in row-major order
+
+    Contiguous memoryviews of the right type are written as they are, other rows are
+    packed into an array first. The data goes to a temporary file next to `path`, which
+    replaces `path` only once everything is written, so a failed write (e.g. too few or
+    too many elements) leaves no partial file behind.
+    """
+    if ITEMSIZES.get(typecode) != array(typecode).itemsize:
+        raise ValueError(f"Typecode {typecode!r} cannot be saved")
+
+    temporary = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as file:
+            file.write(_PREFIX.pack(MAGIC, VERSION, typecode.encode(), len(shape)))
+            file.write(struct.pack(f"<{len(shape)}Q", *shape))
+            written = 0
+            for row in rows:
+                written += _write_row(file, typecode, row)
+        if written != math.prod(shape):
+            raise ValueError("Number of elements does not match the shape")
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _write_row(file: BinaryIO, typecode: str, row: Iterable[int | float]) -> int:
+    """Writes the elements of one row in little-endian order, returns their number"""
+    if (
+        sys.byteorder == "little"
+        and isinstance(row, memoryview)
+        and row.contiguous
+        and row.format == typecode
+    ):
+        file.write(row)
+        return len(row)
+
+    packed = array(typecode, row)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    file.write(packed.tobytes())
+    return len(packed)
+
+
+def read(
+    path: str | os.PathLike, mmap: bool = False
+) -> tuple[str, tuple[int, ...], Any, int]:
+    """Reads a file written by `write`
+
+    Args:
+        path (str | os.PathLike): file to read
+        mmap (bool, optional): map the file read-only instead of reading it, so loading
+            takes the same time for any size and pages are read on access. On big-endian
+            hosts the elements have to be byteswapped, so the file is read anyway.
+            Defaults to False.
+
+    Raises:
+        ValueError: if the file is not in this format or its size does not match the header
+
+    Returns:
+        tuple[str, tuple[int, ...], Any, int]: typecode, shape, buffer with the elements
+            and the index of the first element in the buffer
+    """
+    with open(path, "rb") as file:
+        prefix = file.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size:
+            raise ValueError("File is too short to be a matrix or vector file")
+        magic, version, typecode_byte, ndim = _PREFIX.unpack(prefix)
+        typecode = typecode_byte.decode("ascii", "replace")
+        if magic != MAGIC:
+            raise ValueError("File is not a matrix or vector file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported format version: {version}")
+        if typecode not in ITEMSIZES:
+            raise ValueError(f"Unsupported element type: {typecode!r}")
+
+        shape = struct.unpack(f"<{ndim}Q", file.read(8 * ndim))
+        header_size = _PREFIX.size + 8 * ndim
+        nbytes = math.prod(shape) * ITEMSIZES[typecode]
+        if os.fstat(file.fileno()).st_size != header_size + nbytes:
+            raise ValueError(f"File size does not match shape {shape}")
+
+        if mmap and sys.byteorder == "little":
+            mapping = mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ)
+            return typecode, shape, mapping, header_size // ITEMSIZES[typecode]
+
+        elements = array(typecode)
+        elements.frombytes(file.read(nbytes))
+        if sys.byteorder == "big":
+            elements.byteswap()
+        return typecode, shape, elements, 0
@@ -0,0 +1,251 @@
+from __future__ import annotations
+from array import array
+from typing import Any, Iterable, Iterator, Literal
+import math
+
+DType = Literal["int32", "int64", "float32", "float64"]
+
+DTYPES: dict[str, str] = {"int32": "i", "int64": "q", "float32": "f", "float64": "d"}
+
+
+def dtype_typecode(dtype: str) -> str:
+    """Returns the `array` typecode for a dtype name
+
+    Raises:
+        ValueError: if the dtype is unknown
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"Unknown dtype: {dtype}")
+    return DTYPES[dtype]
+
+
+def typecode_dtype(typecode: str) -> str:
+    """Returns the dtype name for an `array` typecode (the typecode itself if it has no name)"""
+    for dtype, dtype_code in DTYPES.items():
+        if dtype_code == typecode:
+            return dtype
+    return typecode
+
+
+def infer_typecode(values: Iterable[int | float]) -> str:
+    """Picks an array typecode for the values: 'q' (int64) if all values are ints, otherwise 'd' (float64)"""
+    for value in values:
+        if not isinstance(value, int):
+            return "d"
+    return "q"
+
+
+def promote_typecodes(*typecodes: str) -> str:
+    """Picks the typecode of a result computed from operands with the given typecodes
+
+    Operands of one type keep it (float32 + float32 is float32), integers of different
+    widths give int64, and anything mixed with a float gives float64 (int32 + float32 is
+    float64, as float32 cannot hold every int32 exactly).
+    """
+    if all(typecode == typecodes[0] for typecode in typecodes):
+        return typecodes[0]
+    if all(typecode in "bBhHiIlLqQ" for typecode in typecodes):
+        return "q"
+    return "d"
+
+
+def contiguous_strides(shape: tuple[int, ...]) -> tuple[int, ...]:
+    """Calculates row-major strides (in elements, not bytes) for the given shape"""
+    strides = []
+    step = 1
+    for dimension in reversed(shape):
+        strides.append(step)
+        step *= dimension
+    return tuple(reversed(strides))
+
+
+class ArrayStorage:
+    """Contiguous storage for matrix elements: one typed buffer plus shape, strides and offset
+
+    Elements live unboxed in a single buffer (an `array.array` by default), so a matrix of
+    floats costs 8 bytes per element instead of a separate Python float object per element.
+    Strides and offset are measured in elements.
+
+    Example of usage:
+    >>> storage = ArrayStorage.from_rows([[1, 2], [3, 4]])
+    >>> storage.shape # (2, 2)
+    >>> storage[1, 0] # 3
+    >>> storage.memoryview().tolist() # [[1, 2], [3, 4]]
+
+    Views share the buffer and only change shape, strides and offset:
+    >>> storage.transposed().tolist() # [[1, 3], [2, 4]]
+    >>> storage.sliced(slice(None), slice(1, 2)).tolist() # [[2], [4]]
+    """
+
+    def __init__(
+        self,
+        typecode: str,
+        shape: tuple[int, ...],
+        buffer: Any = None,
+        strides: tuple[int, ...] | None = None,
+        offset: int = 0,
+        base: ArrayStorage | None = None,
+    ):
+        """Initializes storage over the given buffer (or a zero-filled one)
+
+        Args:
+            typecode (str): `array` typecode of the elements, e.g. 'd' or 'q'
+            shape (tuple[int, ...]): number of elements along every dimension
+            buffer (Any, optional): any object supporting the buffer protocol. Defaults to a new zero-filled array.
+            strides (tuple[int, ...] | None, optional): element strides. Defaults to row-major strides.
+            offset (int, optional): index of the first element in the buffer. Defaults to 0.
+            base (ArrayStorage | None, optional): storage this one is a view of. Defaults to None.
+        """
+        self.typecode = typecode
+        self.shape = tuple(shape)
+        self.strides = (
+            strides if strides is not None else contiguous_strides(self.shape)
+        )
+        self.offset = offset
+        self.base = base
+        self._version = 0
+
+        if buffer is None:
+            buffer = array(typecode, bytes(array(typecode).itemsize * self.size))
+        self.buffer = buffer
+        self.data = memoryview(buffer).cast("B").cast(typecode)  # type: ignore[call-overload]
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Iterable[int | float]], typecode: str | None = None
+    ) -> ArrayStorage:
+        """Packs a sequence of rows into a new row-major storage"""
+        materialized = [list(row) for row in rows]
+        cols = len(materialized[0]) if materialized else 0
+        for row in materialized:
+            if len(row) != cols:
+                raise ValueError("All rows must have the same length")
+
+        if typecode is None:
+            typecode = infer_typecode(x for row in materialized for x in row)
+        buffer = array(typecode, (x for row in materialized for x in row))
+        return cls(typecode, (len(materialized), cols), buffer)
+
+    @classmethod
+    def from_flat(
+        cls, typecode: str, shape: tuple[int, ...], values: Iterable[int | float]
+    ) -> ArrayStorage:
+        """Creates a row-major storage from values listed in row-major order"""
+        buffer = array(typecode, values)
+        if len(buffer) != math.prod(shape):
+            raise ValueError("Number of values does not match the shape")
+        return cls(typecode, shape, buffer)
+
+    @property
+    def size(self) -> int:
+        """Total number of elements"""
+        return math.prod(self.shape)
+
+    @property
+    def itemsize(self) -> int:
+        """Size of one element in bytes"""
+        return self.data.itemsize
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes taken by the elements"""
+        return self.size * self.itemsize
+
+    @property
+    def version(self) -> int:
+        """Counter of changes to the elements, shared by a storage and all of its views"""
+        root = self.base if self.base is not None else self
+        return root._version
+
+    def mark_modified(self) -> None:
+        """Bumps the version after elements were written, e.g. through a memoryview"""
+        root = self.base if self.base is not None else self
+        root._version += 1
+
+    def is_contiguous(self) -> bool:
+        """Checks if elements are laid out in row-major order without gaps"""
+        return self.strides == contiguous_strides(self.shape)
+
+    def __getitem__(self, index: tuple[int, ...]) -> int | float:
+        """Returns a single element by its multi-dimensional index"""
+        position = self.offset
+        for i, stride in zip(index, self.strides):
+            position += i * stride
+        return self.data[position]
+
+    def __setitem__(self, index: tuple[int, ...], value: int | float):
+        """Writes a single element by its multi-dimensional index"""
+        position = self.offset
+        for i, stride in zip(index, self.strides):
+            position += i * stride
+        self.data[position] = value
+        self.mark_modified()
+
+    def row(self, i: int) -> memoryview:
+        """Returns row `i` of a 2D storage as a zero-copy memoryview"""
+        cols, step = self.shape[1], self.strides[1]
+        start = self.offset + i * self.strides[0]
+        if cols == 0:
+            return self.data[0:0]
+        stop = start + (cols - 1) * step + (1 if step > 0 else -1)
+        return self.data[start : stop if stop >= 0 else None : step]
+
+    def rows(self) -> list[memoryview]:
+        """Returns all rows of a 2D storage as zero-copy memoryviews"""
+        return [self.row(i) for i in range(self.shape[0])]
+
+    def flat(self) -> Iterator[int | float]:
+        """Iterates over all elements in row-major order"""
+        if self.is_contiguous():
+            yield from self.data[self.offset : self.offset + self.size]
+        else:
+            for i in range(self.shape[0]):
+                yield from self.row(i)
+
+    def memoryview(self) -> memoryview:
+        """Exposes the elements as a memoryview with the storage shape
+
+        Raises:
+            BufferError: if the storage is not contiguous
+        """
+        if not self.is_contiguous():
+            raise BufferError("Only contiguous storage can be exposed as a memoryview")
+        flat = self.data[self.offset : self.offset + self.size]
+        if len(self.shape) == 1 or 0 in self.shape:
+            return flat
+        return flat.cast("B").cast(self.typecode, self.shape)
+
+    def _view(self, shape: tuple[int, ...], strides: tuple[int, ...], offset: int):
+        """Creates a storage that shares the buffer with this one"""
+        base = self.base if self.base is not None else self
+        return ArrayStorage(self.typecode, shape, self.buffer, strides, offset, base)
+
+    def transposed(self) -> ArrayStorage:
+        """Returns a transposed view: O(1), only shape and strides are swapped"""
+        return self._view(self.shape[::-1], self.strides[::-1], self.offset)
+
+    def sliced(self, *index: slice) -> ArrayStorage:
+        """Returns a view of a sub-block, one slice per dimension (steps are supported)"""
+        shape, strides, offset = [], [], self.offset
+        for dimension, stride, item in zip(self.shape, self.strides, index):
+            start, stop, step = item.indices(dimension)
+            shape.append(len(range(start, stop, step)))
+            strides.append(stride * step)
+            offset += start * stride
+        return self._view(tuple(shape), tuple(strides), offset)
+
+    def tolist(self) -> list[list[int | float]]:
+        """Copies a 2D storage into a list of row lists"""
+        return [list(row) for row in self.rows()]
+
+    def copy(self) -> ArrayStorage:
+        """Returns a contiguous copy of the storage"""
+        return ArrayStorage.from_flat(self.typecode, self.shape, self.flat())
+
+    def __len__(self) -> int:
+        """Returns the size of the first dimension"""
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        """Returns a representation of the storage"""
+        return f"ArrayStorage(typecode={self.typecode!r}, shape={self.shape})"
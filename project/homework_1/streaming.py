@@ -0,0 +1,169 @@
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+from operator import mul
+from queue import Full, Queue
+from typing import IO, Iterable, Iterator, Sequence
+import csv
+import os
+import threading
+
+from . import backend
+from .index import Matrix, Vector
+from .kernels import multiply_blocked
+
+Row = Sequence[int | float]
+
+
+@dataclass
+class _Failure:
+    """Exception raised by the reader thread, re-raised in the consumer"""
+
+    error: BaseException
+
+
+_DONE = object()
+
+
+def chunks(
+    rows: Iterable[Row], chunk_size: int = 1024, prefetch: int = 2
+) -> Iterator[list[Row]]:
+    """Groups rows into lists of at most `chunk_size` rows
+
+    With `prefetch` > 0 the rows are read by a background thread that stays up to `prefetch`
+    chunks ahead, so reading (file I/O, parsing) overlaps with computing on the previous
+    chunk. At most `prefetch` + 2 chunks are held in memory at any time.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive")
+    iterator = iter(rows)
+    if prefetch < 1:
+        while chunk := list(islice(iterator, chunk_size)):
+            yield chunk
+        return
+
+    queue: Queue = Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item: object) -> None:
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def read() -> None:
+        try:
+            while chunk := list(islice(iterator, chunk_size)):
+                put(chunk)
+                if stop.is_set():
+                    return
+        except BaseException as error:
+            put(_Failure(error))
+        put(_DONE)
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    try:
+        while (item := queue.get()) is not _DONE:
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        reader.join()
+
+
+def multiply_vector(
+    rows: Iterable[Row],
+    vector: Vector | Sequence[int | float],
+    chunk_size: int = 1024,
+    prefetch: int = 2,
+) -> Iterator[int | float]:
+    """Multiplies a streamed matrix by a vector, yielding one element of M * v per row
+
+    Memory use does not depend on the number of rows, so the matrix may be larger than RAM.
+
+    Example of usage:
+    >>> rows = ([i, i + 1] for i in range(3))
+    >>> list(multiply_vector(rows, Vector(1, 2))) # returns [2, 5, 8]
+    """
+    values = tuple(vector.values if isinstance(vector, Vector) else vector)
+    for chunk in chunks(rows, chunk_size, prefetch):
+        for row in chunk:
+            if len(row) != len(values):
+                raise ValueError("Row length does not match vector length")
+        if backend.use_numpy():
+            numpy = backend.numpy
+            product = backend.exact(
+                "matmul", numpy.asarray(chunk), backend.as_ndarray(values)
+            )
+            yield from product.tolist()
+        else:
+            yield from (sum(map(mul, row, values)) for row in chunk)
+
+
+def multiply_matrix(
+    rows: Iterable[Row],
+    other: Matrix,
+    chunk_size: int = 1024,
+    prefetch: int = 2,
+) -> Iterator[list[int | float]]:
+    """Multiplies a streamed matrix by a matrix, yielding rows of the product one by one
+
+    Each chunk of rows is multiplied by `other` with the blocked kernel, so `other` is kept
+    in memory and the streamed operand is not.
+    """
+    inner, cols = other.shape
+    other_rows = other.rows()
+    for chunk in chunks(rows, chunk_size, prefetch):
+        for row in chunk:
+            if len(row) != inner:
+                raise ValueError("Matrices must have the same dimensions")
+        if backend.use_numpy():
+            product = backend.exact(
+                "matmul", backend.numpy.asarray(chunk), other._to_numpy()
+            )
+            yield from product.tolist()
+        else:
+            yield from multiply_blocked(chunk, other_rows, cols, other.block_size)
+
+
+def read_csv_rows(
+    source: str | os.PathLike | IO[str], delimiter: str = ","
+) -> Iterator[list[float]]:
+    """Reads rows of numbers from a CSV file (a path or an open text file) one at a time"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="") as file:
+            yield from read_csv_rows(file, delimiter)
+        return
+    for record in csv.reader(source, delimiter=delimiter):
+        if record:
+            yield [float(value) for value in record]
+
+
+def read_binary_rows(
+    source: str | os.PathLike | IO[bytes],
+    cols: int,
+    typecode: str = "d",
+    rows_per_read: int = 1024,
+) -> Iterator[array]:
+    """Reads rows from a file of raw row-major elements in native byte order
+
+    The file is read `rows_per_read` rows at a time, and every row is yielded as an `array`.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from read_binary_rows(file, cols, typecode, rows_per_read)
+        return
+
+    row_bytes = cols * array(typecode).itemsize
+    while data := source.read(row_bytes * rows_per_read):
+        if len(data) % row_bytes:
+            raise ValueError("File ends in the middle of a row")
+        block = array(typecode)
+        block.frombytes(data)
+        for start in range(0, len(block), cols):
+            yield block[start : start + cols]
@@ -0,0 +1,170 @@
+from __future__ import annotations
+from array import array
+from operator import mul
+from typing import Iterable, Iterator, Sequence
+import heapq
+import math
+
+from . import backend
+from .index import Vector
+
+
+class VectorBatch:
+    """Collection of equal-length vectors stored together for bulk similarity queries
+
+    All vectors live in one flat float64 buffer, and their norms are computed once on insert,
+    so comparing a query with every stored vector costs one pass over the buffer and the
+    query norm is computed once per call instead of once per pair.
+
+    Example of usage:
+    >>> batch = VectorBatch([Vector(1, 0), Vector(0, 1), Vector(1, 1)])
+    >>> batch.dots(Vector(1, 2)) # returns [1.0, 2.0, 3.0]
+    >>> batch.angles(Vector(1, 0)) # returns [0.0, 90.0, 45.0]
+    >>> batch.top_k(Vector(1, 0), 2) # returns [(0, 1.0), (2, 0.707...)]
+    """
+
+    def __init__(
+        self,
+        vectors: Iterable[Vector | Iterable[int | float]] = (),
+        dimension: int | None = None,
+    ):
+        """Initializes a batch with the given vectors (all of them must have the same length)"""
+        self.dimension = dimension
+        self.values = array("d")
+        self.norms = array("d")
+        self.extend(vectors)
+
+    def append(self, vector: Vector | Iterable[int | float]) -> int:
+        """Adds a vector and returns its index in the batch"""
+        values = array("d", vector.values if isinstance(vector, Vector) else vector)
+        if self.dimension is None:
+            self.dimension = len(values)
+        if len(values) != self.dimension:
+            raise ValueError(
+                f"Vector length {len(values)} does not match batch dimension {self.dimension}"
+            )
+
+        self.values.extend(values)
+        self.norms.append(math.sqrt(sum(map(mul, values, values))))
+        return len(self.norms) - 1
+
+    def extend(self, vectors: Iterable[Vector | Iterable[int | float]]) -> None:
+        """Adds several vectors"""
+        for vector in vectors:
+            self.append(vector)
+
+    def __len__(self) -> int:
+        """Returns the number of vectors in the batch"""
+        return len(self.norms)
+
+    def _row(self, i: int) -> memoryview:
+        """Returns vector `i` as a zero-copy memoryview"""
+        dimension = self.dimension or 0
+        return memoryview(self.values)[i * dimension : (i + 1) * dimension]
+
+    def __getitem__(self, i: int) -> Vector:
+        """Returns vector `i` as a new array-backed Vector"""
+        if not -len(self) <= i < len(self):
+            raise IndexError("VectorBatch index out of range")
+        return Vector(*self._row(i % len(self)), storage="array")
+
+    def __iter__(self) -> Iterator[Vector]:
+        """Iterates over the stored vectors"""
+        for i in range(len(self)):
+            yield self[i]
+
+    def _query(self, query: Vector | Iterable[int | float]) -> array:
+        """Converts a query into a float64 array of the batch dimension"""
+        values = array("d", query.values if isinstance(query, Vector) else query)
+        if self.dimension is not None and len(values) != self.dimension:
+            raise ValueError("Query length does not match batch dimension")
+        return values
+
+    def _matrix(self):
+        """Wraps the buffer into an (n, dimension) ndarray without copying"""
+        numpy = backend.numpy
+        return numpy.frombuffer(self.values, dtype=numpy.float64).reshape(
+            len(self), self.dimension or 0
+        )
+
+    def dots(
+        self,
+        query: Vector | Iterable[int | float],
+        indices: Sequence[int] | None = None,
+    ) -> list[float]:
+        """Calculates scalar products of the query with every stored vector (or only with `indices`)"""
+        values = self._query(query)
+        if backend.use_numpy():
+            matrix = self._matrix()
+            if indices is not None:
+                matrix = matrix[list(indices)]
+            return (matrix @ backend.numpy.asarray(values)).tolist()
+        if indices is None:
+            indices = range(len(self))
+        return [sum(map(mul, self._row(i), values)) for i in indices]
+
+    def cosine_similarities(
+        self,
+        query: Vector | Iterable[int | float],
+        indices: Sequence[int] | None = None,
+    ) -> list[float]:
+        """Calculates cosine similarities of the query with every stored vector (or only with `indices`)
+
+        Zero vectors have no direction, their similarity is NaN.
+
+        Raises:
+            ValueError: if the query is a zero vector
+        """
+        values = self._query(query)
+        query_norm = math.sqrt(sum(map(mul, values, values)))
+        if query_norm == 0:
+            raise ValueError("Query must not be a zero vector")
+        if backend.use_numpy():
+            numpy = backend.numpy
+            # Without indices the buffers are used in place, selecting rows would copy them
+            matrix = self._matrix()
+            norms = numpy.frombuffer(self.norms, dtype=numpy.float64)
+            if indices is not None:
+                selected = list(indices)
+                matrix, norms = matrix[selected], norms[selected]
+            norms = norms * query_norm
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                similarities = (matrix @ numpy.asarray(values)) / norms
+            similarities[norms == 0] = math.nan
+            return numpy.clip(similarities, -1.0, 1.0).tolist()
+
+        if indices is None:
+            indices = range(len(self))
+        return [
+            max(-1.0, min(1.0, dot / (norm * query_norm))) if norm else math.nan
+            for dot, norm in zip(
+                self.dots(values, indices), (self.norms[i] for i in indices)
+            )
+        ]
+
+    def angles(self, query: Vector | Iterable[int | float]) -> list[float]:
+        """Calculates angles in degrees between the query and every stored vector"""
+        return [
+            math.nan if math.isnan(similarity) else math.degrees(math.acos(similarity))
+            for similarity in self.cosine_similarities(query)
+        ]
+
+    def top_k(
+        self, query: Vector | Iterable[int | float], k: int
+    ) -> list[tuple[int, float]]:
+        """Finds `k` stored vectors most similar to the query (i.e. with the smallest angles)
+
+        Returns:
+            list[tuple[int, float]]: (index, cosine similarity) pairs, most similar first
+        """
+        similarities = self.cosine_similarities(query)
+        candidates = (
+            (i, similarity)
+            for i, similarity in enumerate(similarities)
+            if not math.isnan(similarity)
+        )
+        return heapq.nlargest(k, candidates, key=lambda pair: pair[1])
+
+    def __repr__(self) -> str:
+        """Returns a representation of the batch"""
+        return f"VectorBatch(size={len(self)}, dimension={self.dimension})"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Generic, Iterator, Literal, Optional, TypeVar, Protocol
+from operator import itemgetter
+from typing import Generic, Iterable, Iterator, Literal, Optional, TypeVar, Protocol
 
 
 class Comparable(Protocol):
@@ -20,17 +21,21 @@ T = TypeVar("T", bound=Comparable)
 U = TypeVar("U")
 
 
-@dataclass
+@dataclass(slots=True)
 class Node(Generic[T, U]):
     """Data Strucure for a node in Binary Search Tree
 
     Generic (<some comparatible type>, <value type>): Custom type for the key and value
+
+    Nodes are slotted (no per-instance `__dict__`), which keeps them several times smaller.
+    Every node also stores the number of nodes in its subtree, used for order statistics.
     """
 
     key: T
     value: U
     left: Optional[Node] = None
     right: Optional[Node] = None
+    size: int = 1
 
     def __str__(self):
         """Returns a string representation of the node"""
@@ -41,6 +46,24 @@ class Node(Generic[T, U]):
         return f"Node({self.key})"
 
 
+def sorted_unique(pairs: Iterable[tuple[T, U]]) -> list[tuple[T, U]]:
+    """Sorts (key, value) pairs by key, keeping only the last value of a repeated key"""
+    unique: list[tuple[T, U]] = []
+    for pair in sorted(pairs, key=itemgetter(0)):
+        if unique and unique[-1][0] == pair[0]:
+            unique[-1] = pair
+        else:
+            unique.append(pair)
+    return unique
+
+
+def check_ascending(pairs: list[tuple[T, U]]) -> None:
+    """Raises ValueError if the keys of the pairs are not strictly ascending"""
+    for i in range(1, len(pairs)):
+        if not pairs[i - 1][0] < pairs[i][0]:
+            raise ValueError("Keys must be in strictly ascending order")
+
+
 class BinarySearchTree(Generic[T, U]):
     """
     Class that represents a binary search tree \n
@@ -76,18 +99,30 @@ class BinarySearchTree(Generic[T, U]):
             Node[T, U]: node that was inserted with set key and value
         """
         node: Node[T, U] | None = self.root if root == "root" else root
+        new_node = self._new_node(key, value)
 
         if node is None:
-            node = Node(key, value)
-        elif key < node.key:
-            node.left = self.insert(key, value, node.left)
-        else:
-            node.right = self.insert(key, value, node.right)
+            if root == "root":
+                self.root = new_node
+            return new_node
+
+        parent = node
+        while True:
+            parent.size += 1
+            if key < parent.key:
+                if parent.left is None:
+                    parent.left = new_node
+                    return node
+                parent = parent.left
+            else:
+                if parent.right is None:
+                    parent.right = new_node
+                    return node
+                parent = parent.right
 
-        if root == "root":
-            self.root = node
-
-        return node
+    def _new_node(self, key: T, value: U) -> Node[T, U]:
+        """Creates a node for a new key (subclasses store extra data in nodes)"""
+        return Node(key, value)
 
     def search(
         self, key: T, root: Node[T, U] | None | Literal["root"] = "root"
@@ -103,13 +138,9 @@ class BinarySearchTree(Generic[T, U]):
         """
         node: Node[T, U] | None = self.root if root == "root" else root
 
-        if node is None or key == node.key:
-            return node
-
-        if key < node.key:
-            return self.search(key, node.left)
-        else:
-            return self.search(key, node.right)
+        while node is not None and key != node.key:
+            node = node.left if key < node.key else node.right
+        return node
 
     def update(
         self, key: T, newValue: U, root: Node[T, U] | None | Literal["root"] = "root"
@@ -129,10 +160,9 @@ class BinarySearchTree(Generic[T, U]):
         if node is None:
             raise ValueError("Tree is empty")
 
-        if node.left == None:
-            return node
-
-        return self.min(node.left)
+        while node.left is not None:
+            node = node.left
+        return node
 
     def max(self, root: Node[T, U] | None | Literal["root"] = "root") -> Node[T, U]:
         """
@@ -152,10 +182,49 @@ class BinarySearchTree(Generic[T, U]):
         if node is None:
             raise ValueError("Tree is empty")
 
-        if node.right == None:
-            return node
+        while node.right is not None:
+            node = node.right
+        return node
 
-        return self.max(node.right)
+    def get(self, key: T, default: U | None = None) -> U | None:
+        """
+        Returns the value attached to the key, or `default` if there is no such key.
+
+        Unlike search, only the value is returned, so calls through a manager proxy do not
+        have to pickle the found node together with its whole subtree.
+        """
+        node = self.search(key)
+        return default if node is None else node.value
+
+    def contains(self, key: T) -> bool:
+        """Checks if the tree contains a node with the given key"""
+        return self.search(key) is not None
+
+    def put(self, key: T, value: U) -> bool:
+        """
+        Updates the value of the key if it is in the tree, inserts a new node otherwise.
+
+        Returns:
+            bool: True if a new node was inserted, False if an existing one was updated.
+        """
+        node = self.search(key)
+        if node is not None:
+            node.value = value
+            return False
+        self.insert(key, value)
+        return True
+
+    def remove(self, key: T) -> bool:
+        """
+        Deletes the node with the given key, like delete, but returns only whether it existed.
+
+        Returns:
+            bool: True if a node was deleted, False if there was no such key.
+        """
+        if self.search(key) is None:
+            return False
+        self.delete(key)
+        return True
 
     def delete(self, key: T) -> Node[T, U] | None:
         """
@@ -187,31 +256,150 @@ class BinarySearchTree(Generic[T, U]):
         """
         node: Node[T, U] | None = self.root if root == "root" else root
 
-        if node is None:
+        path, current = self._removal_path(key, node)
+        if current is None:
             return node
 
-        if key < node.key:
-            node.left = self._delete_node(key, node.left)
-        elif key > node.key:
-            node.right = self._delete_node(key, node.right)
-        elif node.left != None and node.right != None:
-            node.key = self.min(node.right).key
-            node.right = self._delete_node(node.key, node.right)
+        child = current.left if current.left is not None else current.right
+        if not path:
+            return child
+        parent = path[-1]
+        if parent.left is current:
+            parent.left = child
         else:
-            if node.left != None:
+            parent.right = child
+        return node
+
+    def _removal_path(
+        self, key: T, node: Node[T, U] | None
+    ) -> tuple[list[Node[T, U]], Node[T, U] | None]:
+        """
+        Finds the node to unlink when deleting `key` from the subtree of `node`.
+
+        A node with two children takes over the key and value of its in-order successor,
+        which has no left child and is unlinked instead. Subtree sizes along the path are
+        decreased by one.
+
+        Returns:
+            tuple[list[Node[T, U]], Node[T, U] | None]: ancestors of the node to unlink,
+                from `node` down to its parent, and the node itself (None if `key` is not found)
+        """
+        path: list[Node[T, U]] = []
+        current = node
+        while current is not None and key != current.key:
+            path.append(current)
+            current = current.left if key < current.key else current.right
+        if current is None:
+            return path, None
+
+        if current.left is not None and current.right is not None:
+            path.append(current)
+            successor = current.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            current.key, current.value = successor.key, successor.value
+            current = successor
+
+        for ancestor in path:
+            ancestor.size -= 1
+        return path, current
+
+    @staticmethod
+    def _size(node: Node[T, U] | None) -> int:
+        """Returns the number of nodes in a subtree, 0 for an empty one"""
+        return node.size if node is not None else 0
+
+    def range(self, lo: T, hi: T) -> Iterator[Node[T, U]]:
+        """
+        Iterates over the nodes with lo <= key < hi in ascending key order.
+
+        Subtrees outside of the range are skipped, so this takes O(log n + k) for k nodes.
+
+        Args:
+            lo (T): Smallest key to include.
+            hi (T): Key to stop before.
+
+        Yields:
+            Iterator[Node[T, U]]: Nodes in the range.
+        """
+        stack: list[Node[T, U]] = []
+        node = self.root
+        while True:
+            while node is not None:
+                if node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if not node.key < hi:
+                return
+            yield node
+            node = node.right
+
+    def floor(self, key: T) -> Node[T, U] | None:
+        """Returns the node with the largest key <= `key`, None if there is no such node"""
+        node, found = self.root, None
+        while node is not None:
+            if key < node.key:
                 node = node.left
-            elif node.right != None:
+            else:
+                found, node = node, node.right
+        return found
+
+    def ceiling(self, key: T) -> Node[T, U] | None:
+        """Returns the node with the smallest key >= `key`, None if there is no such node"""
+        node, found = self.root, None
+        while node is not None:
+            if node.key < key:
+                node = node.right
+            else:
+                found, node = node, node.left
+        return found
+
+    def rank(self, key: T) -> int:
+        """Returns the number of keys in the tree that are smaller than `key`, in O(height)"""
+        node, smaller = self.root, 0
+        while node is not None:
+            if node.key < key:
+                smaller += self._size(node.left) + 1
                 node = node.right
             else:
-                node = None
+                node = node.left
+        return smaller
 
-        return node
+    def select(self, k: int) -> Node[T, U]:
+        """
+        Returns the node with the k-th smallest key (counting from 0), in O(height).
+
+        Raises:
+            IndexError: If k is not in range(len(tree)).
+        """
+        if not 0 <= k < len(self):
+            raise IndexError("Tree index out of range")
+        node = self.root
+        while node is not None:
+            left_size = self._size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node
+            else:
+                k -= left_size + 1
+                node = node.right
+        raise IndexError("Tree index out of range")
 
     def forward_iterator(
         self, root: Node[T, U] | None | Literal["root"] = "root"
     ) -> Iterator[Node[T, U]]:
         """
-        Returns an iterator that traverses the tree in forward order (pre-order traversal).
+        Returns an iterator that traverses the tree in forward order (in-order traversal, ascending keys).
+
+        Nodes are produced lazily with an explicit stack of at most height nodes, so nothing is
+        materialized and stopping early is cheap.
 
         Args:
             root (Node[T, U] | None | Literal["root"], optional):
@@ -220,19 +408,22 @@ class BinarySearchTree(Generic[T, U]):
         Yields:
             Iterator[Node[T, U]]: Nodes in forward traversal order.
         """
-        node: Node[T, U] | None = self.root if root == "root" else root
-        if node is not None:
+        return self._in_order(self.root if root == "root" else root, reverse=False)
+
+    def _in_order(self, node: Node[T, U] | None, reverse: bool) -> Iterator[Node[T, U]]:
+        """In-order traversal of a subtree, in descending key order if `reverse` is set"""
+        stack: list[Node[T, U]] = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            node = stack.pop()
             yield node
-            while node.left is not None:
-                node = node.left
-                yield node
-            while node.right is not None:
-                node = node.right
-                yield node
+            node = node.left if reverse else node.right
 
     def forward_list(self) -> list[Node[T, U]]:
         """
-        Returns a list that traverses the tree in forward order (pre-order traversal).
+        Returns a list of the tree nodes in forward order (in-order traversal, ascending keys).
 
         Returns:
             list[Node[T, U]]: Nodes in forward traversal order.
@@ -240,19 +431,102 @@ class BinarySearchTree(Generic[T, U]):
         """
         return list(self.forward_iterator())
 
-    def backward_iterator(self) -> Iterator[Node[T, U]]:
+    def backward_iterator(
+        self, root: Node[T, U] | None | Literal["root"] = "root"
+    ) -> Iterator[Node[T, U]]:
         """
-        Returns an iterator that traverses the tree in backward order (reverse of forward iterator).
+        Returns an iterator that traverses the tree in backward order (reverse in-order traversal, descending keys).
+
+        Like forward_iterator, it is lazy and keeps at most height nodes on its stack.
 
         Yields:
             Iterator[Node[T, U]]: Nodes in backward traversal order.
         """
-        nodes = []
-        for node in self.forward_iterator():
-            nodes.append(node)
+        return self._in_order(self.root if root == "root" else root, reverse=True)
 
-        for node in nodes[::-1]:
-            yield node
+    def value_chunks(
+        self, size: int = 1024, reverse: bool = False
+    ) -> Iterator[list[U]]:
+        """
+        Streams the node values in key order, grouped into lists of up to `size` values.
+
+        Through a manager proxy every chunk costs one round trip, instead of one per node
+        (iterating nodes) or one copy of the whole tree (forward_list).
+
+        Args:
+            size (int, optional): Maximum number of values per chunk. Defaults to 1024.
+            reverse (bool, optional): Stream in descending key order. Defaults to False.
+
+        Yields:
+            Iterator[list[U]]: Consecutive chunks of values.
+        """
+        chunk: list[U] = []
+        for node in self._in_order(self.root, reverse):
+            chunk.append(node.value)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def clear(self) -> None:
+        """Removes all nodes from the tree"""
+        self.root = None
+
+    @classmethod
+    def from_sorted(cls, pairs: Iterable[tuple[T, U]]) -> BinarySearchTree[T, U]:
+        """
+        Builds a perfectly balanced tree from (key, value) pairs in ascending key order.
+
+        Every pair becomes one node and no comparisons are made while linking them, so the
+        build takes O(n) instead of n inserts (O(n^2) for sorted keys in an unbalanced tree).
+
+        Args:
+            pairs (Iterable[tuple[T, U]]): Pairs with strictly ascending keys.
+
+        Raises:
+            ValueError: If the keys are not strictly ascending.
+
+        Returns:
+            BinarySearchTree[T, U]: New tree of the class this is called on.
+        """
+        items = list(pairs)
+        check_ascending(items)
+        tree = cls()
+        tree.root = tree._build(items, 0, len(items))
+        return tree
+
+    def bulk_load(self, pairs: Iterable[tuple[T, U]]) -> None:
+        """
+        Replaces the contents of the tree with (key, value) pairs given in any order.
+
+        The pairs are sorted once and linked into a balanced tree, so the whole load is a
+        single O(n log n) call. If a key is repeated, its last value is kept.
+
+        Args:
+            pairs (Iterable[tuple[T, U]]): Pairs to store.
+        """
+        items = sorted_unique(pairs)
+        self.root = self._build(items, 0, len(items))
+
+    def _build(self, items: list[tuple[T, U]], lo: int, hi: int) -> Node[T, U] | None:
+        """Links items[lo:hi] into a balanced subtree rooted at the middle item"""
+        if lo >= hi:
+            return None
+        middle = (lo + hi) // 2
+        node = self._new_node(*items[middle])
+        node.left = self._build(items, lo, middle)
+        node.right = self._build(items, middle + 1, hi)
+        self._update(node)
+        return node
+
+    def _update(self, node: Node[T, U]) -> None:
+        """Recalculates the size of a node from its children"""
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the tree, in O(1) from the size of the root"""
+        return self._size(self.root)
 
     def __eq__(self, value: object) -> bool:
         """
@@ -301,3 +575,172 @@ class BinarySearchTree(Generic[T, U]):
             Iterator[Node[T, U]]: Backward iterator over the tree nodes.
         """
         return self.backward_iterator()
+
+
+@dataclass(slots=True, repr=False)
+class AVLNode(Node[T, U]):
+    """Node of an AVL tree, additionally stores the height of its subtree"""
+
+    height: int = 1
+
+
+class AVLTree(BinarySearchTree[T, U]):
+    """
+    Self-balancing binary search tree (AVL tree) with the same API as BinarySearchTree. \n
+    After every insert and delete the heights of the two subtrees of any node differ by at
+    most one, so the height stays below 1.45 * log2(n) and insert, search, update, delete,
+    min and max are O(log n) even for keys inserted in sorted order.
+
+    Example usage:
+    >>> tree = AVLTree()
+    >>> for key in range(1, 8):
+    ...     tree.insert(key, key) # a plain BinarySearchTree would become a list
+    >>> tree.root # returns Node(4)
+    >>> tree.root.height # returns 3
+    """
+
+    def insert(
+        self, key: T, value: U, root: Node[T, U] | None | Literal["root"] = "root"
+    ) -> Node[T, U]:
+        """Inserts a new node with (key, value) to the tree and rebalances it
+
+        Args:
+            key (T): key in a bst
+            value (U): value that is attached to the key
+            root (Node[T, U] | None | Literal["root"], optional): Start node (mostly for internal purposes). Defaults to "root".
+
+        Returns:
+            Node[T, U]: root of the (sub)tree after insertion
+        """
+        node: Node[T, U] | None = self.root if root == "root" else root
+        new_node = self._new_node(key, value)
+
+        path: list[Node[T, U]] = []
+        current = node
+        while current is not None:
+            current.size += 1
+            path.append(current)
+            current = current.left if key < current.key else current.right
+
+        if not path:
+            node = new_node
+        else:
+            parent = path[-1]
+            if key < parent.key:
+                parent.left = new_node
+            else:
+                parent.right = new_node
+            node = self._rebalance_path(path)
+
+        if root == "root":
+            self.root = node
+
+        return node
+
+    def _new_node(self, key: T, value: U) -> Node[T, U]:
+        """Creates a leaf node of height 1"""
+        return AVLNode(key, value)
+
+    def _delete_node(
+        self, key: T, root: Node[T, U] | None | Literal["root"] = "root"
+    ) -> Node[T, U] | None:
+        """
+        Internal helper method to delete a node by key from the tree and rebalance it.
+
+        Args:
+            key (T): The key of the node to delete.
+            root (Node[T, U] | None | Literal["root"], optional):
+                Node to start from (default is the root).
+
+        Returns:
+            Node[T, U] | None: Updated subtree root after deletion.
+        """
+        node: Node[T, U] | None = self.root if root == "root" else root
+
+        path, current = self._removal_path(key, node)
+        if current is None:
+            return node
+
+        child = current.left if current.left is not None else current.right
+        if not path:
+            return child
+        parent = path[-1]
+        if parent.left is current:
+            parent.left = child
+        else:
+            parent.right = child
+        return self._rebalance_path(path)
+
+    def _rebalance_path(self, path: list[Node[T, U]]) -> Node[T, U]:
+        """Rebalances the nodes on a root-to-leaf path after a change below its last node
+
+        Walks up from the bottom and stops as soon as a subtree keeps its root and height,
+        since nothing above it can be affected then.
+
+        Returns:
+            Node[T, U]: root of the subtree that starts at path[0]
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            height = self._height(node)
+            balanced = self._rebalance(node)
+            if i == 0:
+                return balanced
+            if balanced is node and self._height(node) == height:
+                return path[0]
+            parent = path[i - 1]
+            if parent.left is node:
+                parent.left = balanced
+            else:
+                parent.right = balanced
+        return path[0]
+
+    @staticmethod
+    def _height(node: Node[T, U] | None) -> int:
+        """Returns the height of a subtree, 0 for an empty one"""
+        return node.height if isinstance(node, AVLNode) else 0
+
+    def _update(self, node: Node[T, U]) -> None:
+        """Recalculates the height and size of a node from its children"""
+        super()._update(node)
+        if isinstance(node, AVLNode):
+            node.height = 1 + max(self._height(node.left), self._height(node.right))
+
+    def _rotate_left(self, node: Node[T, U]) -> Node[T, U]:
+        """Rotates a subtree to the left, its right child becomes the new subtree root"""
+        pivot = node.right
+        assert pivot is not None
+        node.right, pivot.left = pivot.left, node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node: Node[T, U]) -> Node[T, U]:
+        """Rotates a subtree to the right, its left child becomes the new subtree root"""
+        pivot = node.left
+        assert pivot is not None
+        node.left, pivot.right = pivot.right, node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rebalance(self, node: Node[T, U]) -> Node[T, U]:
+        """Restores the AVL property of a subtree whose children are balanced
+
+        Returns:
+            Node[T, U]: root of the balanced subtree
+        """
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+
+        if balance > 1:
+            assert node.left is not None
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            assert node.right is not None
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
@@ -0,0 +1,583 @@
+"""Disk-backed B+-tree
+
+The tree lives in one file of fixed-size pages, accessed through mmap:
+
+    page 0       header: magic b"HWBT", format version, page size, root page, first and
+                 last leaf pages, number of entries, head of the free page list and the
+                 number of pages (all integers little-endian)
+    other pages  kind byte, payload length (uint32) and the payload: a pickled node, or
+                 the next free page for pages in the free list
+
+Leaves hold sorted keys with their values and are linked in both directions, so iteration
+reads leaves one after another. Internal nodes hold separator keys and child page numbers.
+A node is split when its encoding no longer fits in a page, so the fan-out follows the size
+of keys and values: hundreds of integer keys per page, which keeps the tree a few levels
+deep. Underfull nodes are not merged, a node is freed only when it becomes empty.
+
+Pages are pickled, so only open files you trust.
+"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Generic, Iterator
+import mmap
+import os
+import pickle
+import struct
+
+from .binary_search_tree import Node, T, U
+
+MAGIC = b"HWBT"
+VERSION = 1
+NIL = -1
+
+LEAF = 1
+INTERNAL = 2
+FREE = 3
+
+_HEADER = struct.Struct("<4sB3xI6q")
+_PAGE = struct.Struct("<BI")
+_NEXT_FREE = struct.Struct("<q")
+
+
+@dataclass(slots=True)
+class _Leaf:
+    """Leaf page: sorted keys, their values and the neighbouring leaves"""
+
+    keys: list = field(default_factory=list)
+    values: list = field(default_factory=list)
+    prev: int = NIL
+    next: int = NIL
+
+
+@dataclass(slots=True)
+class _Internal:
+    """Internal page: children[i] holds keys in [keys[i - 1], keys[i])"""
+
+    keys: list
+    children: list[int]
+
+
+class BPlusTree(Generic[T, U]):
+    """
+    B+-tree stored in a file, for key sets that do not fit in memory. \\n
+    Decoded pages are kept in a bounded LRU cache, changed pages are written back to the
+    file when they are evicted or on flush, and the tree can be reopened from the file later.
+
+    Changes are durable only after flush() or close() (a tree that is garbage collected
+    without being closed is closed then). The header is written last by flush(), so it never
+    points to pages that were not written. After an unclean exit between flushes, pages
+    evicted since the last flush may not match the header, and reading such a file may fail
+    with ValueError.
+    Keys must be unique: inserting an existing key replaces its value.
+
+    The API matches BinarySearchTree, but nodes returned by search, min, max and iteration are
+    detached copies holding only the key and the value.
+
+    Example usage:
+    >>> with BPlusTree("index.db") as tree:
+    ...     tree.insert(2, "b")
+    ...     tree.insert(1, "a")
+    ...     tree.get(1) # returns "a"
+    >>> BPlusTree("index.db").get(2) # returns "b"
+    """
+
+    def __init__(
+        self, path: str | os.PathLike, page_size: int = 4096, cache_pages: int = 256
+    ) -> None:
+        """
+        Opens the tree stored in `path`, or creates an empty one if the file is empty or missing.
+
+        Args:
+            path (str | os.PathLike): File with the pages.
+            page_size (int, optional): Size of a page in bytes for a new file, an existing file
+                keeps its own page size. Defaults to 4096.
+            cache_pages (int, optional): Maximum number of decoded pages kept in memory.
+                Defaults to 256.
+
+        Raises:
+            ValueError: If the file is not a B+-tree file, or the arguments are out of range.
+        """
+        if page_size < 512:
+            raise ValueError("Page size must be at least 512 bytes")
+        if cache_pages < 1:
+            raise ValueError("Page cache must hold at least one page")
+        self.cache_pages = cache_pages
+        self.cache: OrderedDict[int, _Leaf | _Internal] = OrderedDict()
+        self.dirty: set[int] = set()
+        self.closed = False
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self.file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            try:
+                self._read_header()
+            except ValueError:
+                self.file.close()
+                raise
+            self.mmap = mmap.mmap(self.file.fileno(), 0)
+        else:
+            self.page_size = page_size
+            self.file.truncate(16 * page_size)
+            self.mmap = mmap.mmap(self.file.fileno(), 0)
+            self._reset()
+
+    def _read_header(self) -> None:
+        """Reads the tree parameters from page 0"""
+        data = self.file.read(_HEADER.size)
+        if len(data) != _HEADER.size:
+            raise ValueError("File is too short to be a B+-tree file")
+        magic, version, self.page_size, *fields = _HEADER.unpack(data)
+        if magic != MAGIC:
+            raise ValueError("File is not a B+-tree file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported format version: {version}")
+        self.root, self.first, self.last, self.count, self.free, self.pages = fields
+
+    def _write_header(self) -> None:
+        """Writes the tree parameters to page 0"""
+        self.mmap[: _HEADER.size] = _HEADER.pack(
+            MAGIC,
+            VERSION,
+            self.page_size,
+            self.root,
+            self.first,
+            self.last,
+            self.count,
+            self.free,
+            self.pages,
+        )
+
+    def _reset(self) -> None:
+        """Makes the tree empty: a single empty leaf as the root and no free pages"""
+        self.cache.clear()
+        self.dirty.clear()
+        self.pages, self.free, self.count = 1, NIL, 0
+        self.root = self.first = self.last = self._allocate()
+        self._mark(self.root, _Leaf())
+        self.flush()
+
+    @property
+    def capacity(self) -> int:
+        """Maximum size of a page payload in bytes"""
+        return self.page_size - _PAGE.size
+
+    @staticmethod
+    def _encode(node: _Leaf | _Internal) -> bytes:
+        """Pickles a node into a page payload"""
+        if isinstance(node, _Leaf):
+            fields: tuple = (node.keys, node.values, node.prev, node.next)
+        else:
+            fields = (node.keys, node.children)
+        return pickle.dumps(fields, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _write_page(self, page: int, node: _Leaf | _Internal) -> None:
+        """Writes a node to its page in the file"""
+        payload = self._encode(node)
+        offset = page * self.page_size
+        kind = LEAF if isinstance(node, _Leaf) else INTERNAL
+        self.mmap[offset : offset + _PAGE.size] = _PAGE.pack(kind, len(payload))
+        self.mmap[offset + _PAGE.size : offset + _PAGE.size + len(payload)] = payload
+
+    def _load(self, page: int) -> _Leaf | _Internal:
+        """Returns the node stored in a page, reading and decoding it on a cache miss"""
+        node = self.cache.get(page)
+        if node is not None:
+            self.cache.move_to_end(page)
+            return node
+
+        offset = page * self.page_size
+        try:
+            if not 0 < page < self.pages:
+                raise ValueError("page out of range")
+            kind, length = _PAGE.unpack_from(self.mmap, offset)
+            if kind not in (LEAF, INTERNAL) or length > self.capacity:
+                raise ValueError("no node header")
+            start = offset + _PAGE.size
+            fields = pickle.loads(self.mmap[start : start + length])
+            node = _Leaf(*fields) if kind == LEAF else _Internal(*fields)
+        except Exception as error:
+            # Also reached after an unclean exit, when the header is older than the pages
+            raise ValueError(f"Page {page} does not hold a valid node") from error
+        self.cache[page] = node
+        self._shrink_cache()
+        return node
+
+    def _mark(self, page: int, node: _Leaf | _Internal) -> None:
+        """Stores a changed node in the cache, it is written to the file on eviction or flush"""
+        self.cache[page] = node
+        self.cache.move_to_end(page)
+        self.dirty.add(page)
+        self._shrink_cache()
+
+    def _shrink_cache(self) -> None:
+        """Evicts least recently used pages until the cache fits its bound"""
+        while len(self.cache) > self.cache_pages:
+            page, node = self.cache.popitem(last=False)
+            if page in self.dirty:
+                self.dirty.remove(page)
+                self._write_page(page, node)
+
+    def _allocate(self) -> int:
+        """Returns an unused page, taken from the free list or appended to the file"""
+        if self.free != NIL:
+            page = self.free
+            offset = page * self.page_size + _PAGE.size
+            (self.free,) = _NEXT_FREE.unpack_from(self.mmap, offset)
+            return page
+
+        page = self.pages
+        self.pages += 1
+        if self.pages * self.page_size > len(self.mmap):
+            # Grow the file geometrically, so appending n pages remaps O(log n) times
+            self.mmap.flush()
+            self.mmap.close()
+            self.file.truncate(2 * self.pages * self.page_size)
+            self.mmap = mmap.mmap(self.file.fileno(), 0)
+        return page
+
+    def _release(self, page: int) -> None:
+        """Puts a page of a removed node into the free list"""
+        self.cache.pop(page, None)
+        self.dirty.discard(page)
+        offset = page * self.page_size
+        self.mmap[offset : offset + _PAGE.size] = _PAGE.pack(FREE, _NEXT_FREE.size)
+        _NEXT_FREE.pack_into(self.mmap, offset + _PAGE.size, self.free)
+        self.free = page
+
+    def _check_entry(self, key: T, value: U) -> None:
+        """Raises ValueError if an entry is too large for the tree to split around it"""
+        if len(self._encode(_Leaf([key], [value]))) > self.capacity:
+            raise ValueError("Entry does not fit in a page")
+        if len(self._encode(_Internal([key], [0, 0]))) > self.capacity // 4:
+            raise ValueError("Key must fit in a quarter of a page")
+
+    def _descend(self, key: T) -> tuple[list[tuple[int, _Internal, int]], int, _Leaf]:
+        """
+        Finds the leaf where `key` belongs.
+
+        Returns:
+            tuple: (page, node, child index) of every internal node on the way, the page
+                of the leaf and the leaf itself
+        """
+        path: list[tuple[int, _Internal, int]] = []
+        page = self.root
+        node = self._load(page)
+        while isinstance(node, _Internal):
+            index = bisect_right(node.keys, key)
+            path.append((page, node, index))
+            page = node.children[index]
+            node = self._load(page)
+        return path, page, node
+
+    def _fit(self, node: _Leaf | _Internal) -> list[tuple[Any, _Leaf | _Internal]]:
+        """
+        Splits a node that does not fit in a page into halves, recursively.
+
+        Returns:
+            list[tuple[Any, _Leaf | _Internal]]: The pieces in key order, each with the
+                smallest key of its subtree (None for the first piece).
+        """
+        if len(node.keys) < 2 or len(self._encode(node)) <= self.capacity:
+            return [(None, node)]
+        middle = len(node.keys) // 2
+        separator = node.keys[middle]
+        left: _Leaf | _Internal
+        right: _Leaf | _Internal
+        if isinstance(node, _Leaf):
+            left = _Leaf(node.keys[:middle], node.values[:middle])
+            right = _Leaf(node.keys[middle:], node.values[middle:])
+        else:
+            left = _Internal(node.keys[:middle], node.children[: middle + 1])
+            right = _Internal(node.keys[middle + 1 :], node.children[middle + 1 :])
+        right_pieces = self._fit(right)
+        right_pieces[0] = (separator, right_pieces[0][1])
+        return self._fit(left) + right_pieces
+
+    def _store(
+        self,
+        path: list[tuple[int, _Internal, int]],
+        page: int,
+        node: _Leaf | _Internal,
+    ) -> None:
+        """Writes back a changed node, splitting it and its ancestors if they overflow"""
+        pieces = self._fit(node)
+        if len(pieces) == 1:
+            self._mark(page, node)
+            return
+
+        pages = [page] + [self._allocate() for _ in pieces[1:]]
+        nodes = [piece for _, piece in pieces]
+        if isinstance(node, _Leaf):
+            self._link_leaves(node, pages, nodes)
+        for piece_page, piece in zip(pages, nodes):
+            self._mark(piece_page, piece)
+
+        separators = [separator for separator, _ in pieces[1:]]
+        if not path:
+            self.root = self._allocate()
+            self._store([], self.root, _Internal(separators, pages))
+            return
+        parent_page, parent, index = path.pop()
+        parent.keys[index:index] = separators
+        parent.children[index + 1 : index + 1] = pages[1:]
+        self._store(path, parent_page, parent)
+
+    def _link_leaves(self, leaf: _Leaf, pages: list[int], nodes: list) -> None:
+        """Links the leaves a leaf was split into in place of it"""
+        nodes[0].prev, nodes[-1].next = leaf.prev, leaf.next
+        for i in range(1, len(nodes)):
+            nodes[i - 1].next, nodes[i].prev = pages[i], pages[i - 1]
+        if leaf.next == NIL:
+            self.last = pages[-1]
+        else:
+            following = self._load(leaf.next)
+            assert isinstance(following, _Leaf)
+            following.prev = pages[-1]
+            self._mark(leaf.next, following)
+
+    def _unlink_leaf(self, page: int, leaf: _Leaf) -> None:
+        """Removes an empty leaf from the list of leaves and frees its page"""
+        if leaf.prev == NIL:
+            self.first = leaf.next
+        else:
+            previous = self._load(leaf.prev)
+            assert isinstance(previous, _Leaf)
+            previous.next = leaf.next
+            self._mark(leaf.prev, previous)
+        if leaf.next == NIL:
+            self.last = leaf.prev
+        else:
+            following = self._load(leaf.next)
+            assert isinstance(following, _Leaf)
+            following.prev = leaf.prev
+            self._mark(leaf.next, following)
+        self._release(page)
+
+    def _remove_child(self, path: list[tuple[int, _Internal, int]]) -> None:
+        """Removes the child at the end of `path` (already freed) from its parent"""
+        page, node, index = path.pop()
+        del node.children[index]
+        if node.keys:
+            del node.keys[max(index - 1, 0)]
+        if not node.children and path:
+            self._release(page)
+            self._remove_child(path)
+            return
+        self._mark(page, node)
+
+        # A root with a single child is replaced by the child, so the tree gets shallower
+        root = self._load(self.root)
+        while isinstance(root, _Internal) and len(root.children) == 1:
+            self._release(self.root)
+            self.root = root.children[0]
+            root = self._load(self.root)
+
+    def insert(self, key: T, value: U) -> Node[T, U]:
+        """Inserts (key, value) to the tree, replacing the value of an existing key"""
+        self.put(key, value)
+        return Node(key, value)
+
+    def put(self, key: T, value: U) -> bool:
+        """Updates the value of the key or inserts a new entry, True if an entry was inserted"""
+        self._check_entry(key, value)
+        path, page, leaf = self._descend(key)
+        index = bisect_left(leaf.keys, key)
+        inserted = index == len(leaf.keys) or leaf.keys[index] != key
+        if inserted:
+            leaf.keys.insert(index, key)
+            leaf.values.insert(index, value)
+            self.count += 1
+        else:
+            leaf.values[index] = value
+        self._store(path, page, leaf)
+        return inserted
+
+    def _find(self, key: T) -> tuple[_Leaf, int]:
+        """Returns the leaf where `key` belongs and the index of the key in it, or -1"""
+        _, _, leaf = self._descend(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf, index
+        return leaf, -1
+
+    def search(self, key: T) -> Node[T, U] | None:
+        """Searches for an element in the tree, returns a detached copy of the found node"""
+        leaf, index = self._find(key)
+        return None if index < 0 else Node(key, leaf.values[index])
+
+    def get(self, key: T, default: U | None = None) -> U | None:
+        """Returns the value attached to the key, or `default` if there is no such key"""
+        leaf, index = self._find(key)
+        return default if index < 0 else leaf.values[index]
+
+    def contains(self, key: T) -> bool:
+        """Checks if the tree contains an entry with the given key"""
+        return self._find(key)[1] >= 0
+
+    def update(self, key: T, newValue: U) -> Node[T, U]:
+        """Updates the value of the entry with the given key in the tree"""
+        if not self.contains(key):
+            raise ValueError("Node not found")
+        self.put(key, newValue)
+        return Node(key, newValue)
+
+    def remove(self, key: T) -> bool:
+        """Deletes the entry with the given key, True if it existed"""
+        path, page, leaf = self._descend(key)
+        index = bisect_left(leaf.keys, key)
+        if index == len(leaf.keys) or leaf.keys[index] != key:
+            return False
+        del leaf.keys[index]
+        del leaf.values[index]
+        self.count -= 1
+        if leaf.keys or not path:
+            self._mark(page, leaf)
+        else:
+            self._unlink_leaf(page, leaf)
+            self._remove_child(path)
+        return True
+
+    def delete(self, key: T) -> None:
+        """Deletes the entry with the given key from the tree, if it exists"""
+        self.remove(key)
+
+    def min(self) -> Node[T, U]:
+        """Returns a copy of the entry with the smallest key"""
+        if not self.count:
+            raise ValueError("Tree is empty")
+        leaf = self._load(self.first)
+        return Node(leaf.keys[0], leaf.values[0])  # type: ignore[union-attr]
+
+    def max(self) -> Node[T, U]:
+        """Returns a copy of the entry with the largest key"""
+        if not self.count:
+            raise ValueError("Tree is empty")
+        leaf = self._load(self.last)
+        return Node(leaf.keys[-1], leaf.values[-1])  # type: ignore[union-attr]
+
+    def _leaves(self, page: int, reverse: bool = False) -> Iterator[_Leaf]:
+        """Iterates over snapshots of the leaves, starting from `page`"""
+        while page != NIL:
+            leaf = self._load(page)
+            assert isinstance(leaf, _Leaf)
+            yield _Leaf(list(leaf.keys), list(leaf.values))
+            page = leaf.prev if reverse else leaf.next
+
+    def forward_iterator(self) -> Iterator[Node[T, U]]:
+        """Iterates over copies of the entries in ascending key order"""
+        for leaf in self._leaves(self.first):
+            for key, value in zip(leaf.keys, leaf.values):
+                yield Node(key, value)
+
+    def backward_iterator(self) -> Iterator[Node[T, U]]:
+        """Iterates over copies of the entries in descending key order"""
+        for leaf in self._leaves(self.last, reverse=True):
+            for key, value in zip(reversed(leaf.keys), reversed(leaf.values)):
+                yield Node(key, value)
+
+    def range(self, lo: T, hi: T) -> Iterator[Node[T, U]]:
+        """Iterates over copies of the entries with lo <= key < hi in ascending key order"""
+        _, page, _ = self._descend(lo)
+        for leaf in self._leaves(page):
+            for key, value in zip(leaf.keys, leaf.values):
+                if not key < hi:
+                    return
+                if not key < lo:
+                    yield Node(key, value)
+
+    def value_chunks(
+        self, size: int = 1024, reverse: bool = False
+    ) -> Iterator[list[U]]:
+        """Streams the values in key order, grouped into lists of up to `size` values"""
+        nodes = self.backward_iterator() if reverse else self.forward_iterator()
+        chunk: list[U] = []
+        for node in nodes:
+            chunk.append(node.value)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def forward_list(self) -> list[Node[T, U]]:
+        """Returns copies of the entries in ascending key order"""
+        return list(self.forward_iterator())
+
+    def clear(self) -> None:
+        """Removes all entries from the tree and shrinks the file"""
+        self.mmap.close()
+        self.file.truncate(16 * self.page_size)
+        self.mmap = mmap.mmap(self.file.fileno(), 0)
+        self._reset()
+
+    def flush(self) -> None:
+        """Writes changed pages and then the header to the file, making all changes durable"""
+        for page in sorted(self.dirty):
+            self._write_page(page, self.cache[page])
+        self.dirty.clear()
+        self._write_header()
+        self.mmap.flush()
+
+    def close(self) -> None:
+        """Flushes the tree and closes the file, the tree cannot be used afterwards"""
+        if self.closed:
+            return
+        self.flush()
+        self.mmap.close()
+        self.file.close()
+        self.closed = True
+
+    def __enter__(self) -> BPlusTree[T, U]:
+        """Returns the tree itself"""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the tree"""
+        self.close()
+
+    def __del__(self):
+        """Flushes a tree that was not closed explicitly"""
+        if hasattr(self, "mmap") and not self.closed:
+            self.close()
+
+    def __len__(self) -> int:
+        """Returns the number of entries in the tree"""
+        return self.count
+
+    def height(self) -> int:
+        """Returns the number of pages read by a lookup, i.e. the number of levels"""
+        levels, node = 1, self._load(self.root)
+        while isinstance(node, _Internal):
+            levels += 1
+            node = self._load(node.children[0])
+        return levels
+
+    def __eq__(self, value: object) -> bool:
+        """Checks if two trees contain the same keys with the same values"""
+        if not isinstance(value, BPlusTree):
+            return False
+        return len(self) == len(value) and all(
+            (a.key, a.value) == (b.key, b.value)
+            for a, b in zip(self.forward_iterator(), value.forward_iterator())
+        )
+
+    def equals(self, value: object) -> bool:
+        """Mirror of __eq__ (for calls through a manager proxy)"""
+        return self == value
+
+    def __iter__(self) -> Iterator[Node[T, U]]:
+        """Iterates over the entries in ascending key order"""
+        return self.forward_iterator()
+
+    def __reversed__(self) -> Iterator[Node[T, U]]:
+        """Iterates over the entries in descending key order"""
+        return self.backward_iterator()
+
+    def __repr__(self) -> str:
+        """Returns a representation of the tree"""
+        return (
+            f"BPlusTree(size={len(self)}, pages={self.pages}, "
+            f"page_size={self.page_size}, cache_pages={self.cache_pages})"
+        )
@@ -1,22 +1,115 @@
-from multiprocessing.managers import BaseManager
+from multiprocessing.managers import BaseManager, IteratorProxy  # type: ignore[attr-defined]
+from array import array
+from itertools import zip_longest
 from typing import Any, Iterator, MutableMapping
 
-from .binary_search_tree import BinarySearchTree
+from .binary_search_tree import AVLTree, BinarySearchTree
+from .node_pool import PooledBinarySearchTree
 from collections import namedtuple
 
 
 KeyValuePair = namedtuple("KeyValuePair", ["key", "value"])
 
 
+class PooledEntryTree(PooledBinarySearchTree[int, KeyValuePair]):
+    """
+    Pooled tree for HashTable entries, keyed by the hash of the entry key. \n
+    Hashes are kept in a typed int64 array, and the key and the value of an entry go to two
+    parallel lists instead of a KeyValuePair per node, so an entry costs five 8-byte slots.
+    KeyValuePair objects are created only when entries are read.
+    """
+
+    empty_key = 0
+
+    def __init__(self) -> None:
+        """Initializes an empty tree"""
+        self.entry_keys: list[Any] = []
+        super().__init__()
+        self.node_keys = array("q")
+
+    def _set_keys(self, keys: list[int]) -> None:
+        """Replaces all hashes, hash `i` belongs to node `i`"""
+        self.node_keys = array("q", keys)
+
+    def _append_slot(self) -> None:
+        """Adds an empty slot at the end of every array"""
+        super()._append_slot()
+        self.entry_keys.append(None)
+
+    def _value(self, index: int) -> KeyValuePair:
+        """Builds the entry of node `index`"""
+        return KeyValuePair(self.entry_keys[index], self.node_values[index])
+
+    def _set_value(self, index: int, value: KeyValuePair | None) -> None:
+        """Splits an entry into the parallel lists (None when the slot is freed)"""
+        if value is None:
+            self.entry_keys[index] = self.node_values[index] = None
+        else:
+            self.entry_keys[index], self.node_values[index] = value
+
+    def _set_values(self, values: list[KeyValuePair]) -> None:
+        """Replaces all entries, entry `i` belongs to node `i`"""
+        self.entry_keys = [key for key, _ in values]
+        self.node_values = [value for _, value in values]
+
+
+EXPOSED_METHODS = [
+    "insert",
+    "search",
+    "delete",
+    "update",
+    "get",
+    "contains",
+    "put",
+    "remove",
+    "bulk_load",
+    "keys",
+    "forward_list",
+    "value_chunks",
+    "clear",
+    "__len__",
+    "equals",
+]
+
+# Generators returned by these methods stay in the manager process and are iterated remotely
+METHOD_TO_TYPEID = {"value_chunks": "Iterator"}
+
+
 class BSTManager(BaseManager):
     def BinarySearchTree(self) -> BinarySearchTree:
         return BinarySearchTree()
 
+    def AVLTree(self) -> AVLTree:
+        return AVLTree()
+
+    def PooledBinarySearchTree(self) -> PooledBinarySearchTree:
+        return PooledBinarySearchTree()
+
+    def PooledEntryTree(self) -> PooledEntryTree:
+        return PooledEntryTree()
+
 
+BSTManager.register("Iterator", proxytype=IteratorProxy, create_method=False)
 BSTManager.register(
     "BinarySearchTree",
     BinarySearchTree,
-    exposed=["insert", "search", "delete", "update", "keys", "forward_list", "equals"],
+    exposed=EXPOSED_METHODS,
+    method_to_typeid=METHOD_TO_TYPEID,
+)
+BSTManager.register(
+    "AVLTree", AVLTree, exposed=EXPOSED_METHODS, method_to_typeid=METHOD_TO_TYPEID
+)
+BSTManager.register(
+    "PooledBinarySearchTree",
+    PooledBinarySearchTree,
+    exposed=EXPOSED_METHODS,
+    method_to_typeid=METHOD_TO_TYPEID,
+)
+BSTManager.register(
+    "PooledEntryTree",
+    PooledEntryTree,
+    exposed=EXPOSED_METHODS,
+    method_to_typeid=METHOD_TO_TYPEID,
 )
 
 
@@ -34,21 +127,47 @@ class HashTable(MutableMapping):
     False
     """
 
-    def __init__(self, initial_elements: list[tuple[Any, Any]] = []):
+    def __init__(
+        self,
+        initial_elements: list[tuple[Any, Any]] = [],
+        balanced: bool = False,
+        compact: bool = False,
+    ):
         """
         Initializes the HashTable.
 
         Args:
             initial_elements (list[tuple[Any, Any]], optional): List of (key, value) pairs to initialize the table with.
+            balanced (bool, optional): Store entries in a self-balancing AVLTree, so every operation is O(log n)
+                even for sequential integer keys (which hash to themselves). Defaults to False.
+            compact (bool, optional): Store entries in a PooledEntryTree (parallel arrays instead of node
+                objects and KeyValuePairs), which takes several times less memory per entry. Defaults to False.
 
-        The initial elements will be inserted into the hash table.
+        The initial elements are loaded in bulk. If a key is repeated, its last value is kept.
         """
+        if balanced and compact:
+            raise ValueError("Compact storage is not balanced, choose one of them")
         self.manager = BSTManager()
         self.manager.start()
-        self.bst: BinarySearchTree[int, KeyValuePair] = self.manager.BinarySearchTree()
+        self.bst: (
+            BinarySearchTree[int, KeyValuePair]
+            | PooledBinarySearchTree[int, KeyValuePair]
+        )
+        if balanced:
+            self.bst = self.manager.AVLTree()
+        elif compact:
+            self.bst = self.manager.PooledEntryTree()
+        else:
+            self.bst = self.manager.BinarySearchTree()
 
-        for key, value in initial_elements:
-            self[key] = value
+        if initial_elements:
+            # One manager call that sorts the entries and builds a balanced tree
+            self.bst.bulk_load(
+                [
+                    (hash(key), KeyValuePair(key, value))
+                    for key, value in initial_elements
+                ]
+            )
 
     def __getitem__(self, key: Any) -> Any | None:
         """
@@ -66,10 +185,10 @@ class HashTable(MutableMapping):
         Example:
             >>> table['example']
         """
-        found = self.bst.search(hash(key))
+        found = self.bst.get(hash(key))
         if found is None:
             raise KeyError(key)
-        return found.value.value
+        return found.value
 
     def __setitem__(self, key: Any, value: Any):
         """
@@ -82,10 +201,7 @@ class HashTable(MutableMapping):
         Example:
             >>> table['example'] = 1
         """
-        if key in self:
-            self.bst.update(hash(key), KeyValuePair(key, value))
-        else:
-            self.bst.insert(hash(key), KeyValuePair(key, value))
+        self.bst.put(hash(key), KeyValuePair(key, value))
 
     def __delitem__(self, key: Any):
         """
@@ -101,7 +217,18 @@ class HashTable(MutableMapping):
             >>> del table['example']
         """
 
-        self.bst.delete(hash(key))
+        if not self.bst.remove(hash(key)):
+            raise KeyError(key)
+
+    def _entries(self) -> Iterator[KeyValuePair]:
+        """
+        Streams the entries in hash order, fetching them from the manager in chunks.
+
+        Only one chunk is held at a time. As with dict, the table should not be modified
+        while the iteration is in progress.
+        """
+        for chunk in self.bst.value_chunks():
+            yield from chunk
 
     def __iter__(self) -> Iterator[KeyValuePair]:
         """
@@ -110,8 +237,7 @@ class HashTable(MutableMapping):
         Yields:
             Iterator[KeyValuePair]: KeyValuePair objects of entries in the table.
         """
-        for element in self.bst.forward_list():
-            yield element.value
+        return self._entries()
 
     def __len__(self) -> int:
         """
@@ -120,7 +246,7 @@ class HashTable(MutableMapping):
         Returns:
             int: Count of elements.
         """
-        return len(self.bst.forward_list())
+        return len(self.bst)
 
     def __contains__(self, key: Any) -> bool:
         """
@@ -132,7 +258,7 @@ class HashTable(MutableMapping):
         Returns:
             bool: True if key exists, else False.
         """
-        return self.bst.search(hash(key)) is not None
+        return self.bst.contains(hash(key))
 
     def __eq__(self, other: object) -> bool:
         """
@@ -142,12 +268,18 @@ class HashTable(MutableMapping):
             other (object): Other object to compare.
 
         Returns:
-            bool: True if both are HashTable and have equal BST structures.
+            bool: True if both are HashTable and have the same entries in the same order.
         """
         if not isinstance(other, HashTable):
             return False
 
-        return self.bst.forward_list() == other.bst.forward_list()
+        missing = object()
+        return all(
+            a == b
+            for a, b in zip_longest(
+                self._entries(), other._entries(), fillvalue=missing
+            )
+        )
 
     def keys(self):
         """
@@ -156,8 +288,8 @@ class HashTable(MutableMapping):
         Yields:
             Iterator[Any]: Keys stored in the hash table.
         """
-        for key_value_pair in self.bst.forward_list():
-            yield key_value_pair.value.key
+        for key_value_pair in self._entries():
+            yield key_value_pair.key
 
     def values(self):
         """
@@ -166,8 +298,8 @@ class HashTable(MutableMapping):
         Yields:
             Iterator[Any]: Values stored in the hash table.
         """
-        for key_value_pair in self.bst.forward_list():
-            yield key_value_pair.value.value
+        for key_value_pair in self._entries():
+            yield key_value_pair.value
 
     def items(self):
         """
@@ -176,16 +308,16 @@ class HashTable(MutableMapping):
         Yields:
             Iterator[tuple[Any, Any]]: Key-value pairs stored in the hash table.
         """
-        for key_value_pair in self.bst.forward_list():
-            yield (key_value_pair.value.key, key_value_pair.value.value)
+        for key_value_pair in self._entries():
+            yield (key_value_pair.key, key_value_pair.value)
 
     def clear(self):
         """
         Clears all elements from the hash table.
         Resets the internal binary search tree and size to zero.
         """
-        for key in self.keys():
-            del self[key]
+        self.bst.clear()
 
     def __del__(self):
-        self.manager.shutdown()
+        if hasattr(self, "manager"):
+            self.manager.shutdown()
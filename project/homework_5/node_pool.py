@@ -0,0 +1,308 @@
+from __future__ import annotations
+from array import array
+from typing import Any, Generic, Iterable, Iterator, MutableSequence
+
+from .binary_search_tree import Node, T, U, check_ascending, sorted_unique
+
+NIL = -1
+
+
+class PooledBinarySearchTree(Generic[T, U]):
+    """
+    Binary search tree stored as a struct of arrays instead of linked node objects. \\n
+    Node `i` is described by node_keys[i], node_values[i], left[i] and right[i], where children are
+    integer indices in typed arrays (-1 for no child). An entry costs two list slots and two
+    8-byte integers instead of a separate node object, and slots of deleted nodes are reused.
+
+    The API matches BinarySearchTree, but nodes returned by search, min, max and iteration are
+    detached copies holding only the key and the value: changing them does not change the tree,
+    use update or put for that.
+
+    Example usage:
+    >>> tree = PooledBinarySearchTree()
+    >>> tree.insert(2, "b")
+    >>> tree.insert(1, "a")
+    >>> tree.search(1) # returns Node(1)
+    >>> tree.get(1) # returns "a"
+    >>> [node.key for node in tree] # returns [1, 2]
+    """
+
+    # Stored in the key slots of free nodes, so that freed keys can be garbage collected
+    empty_key: Any = None
+
+    def __init__(self) -> None:
+        """Initializes an empty tree"""
+        self.node_keys: MutableSequence[Any] = []
+        self.node_values: list[U | None] = []
+        self.left = array("q")
+        self.right = array("q")
+        self.root_index = NIL
+        self.free: list[int] = []
+        self.count = 0
+
+    def _allocate(self, key: T, value: U) -> int:
+        """Stores a new leaf node, reusing a free slot if there is one"""
+        self.count += 1
+        if self.free:
+            index = self.free.pop()
+            self.left[index] = self.right[index] = NIL
+        else:
+            index = len(self.node_keys)
+            self._append_slot()
+        self.node_keys[index] = key
+        self._set_value(index, value)
+        return index
+
+    def _append_slot(self) -> None:
+        """Adds an empty slot at the end of every array"""
+        self.node_keys.append(self.empty_key)
+        self.node_values.append(None)
+        self.left.append(NIL)
+        self.right.append(NIL)
+
+    def _release(self, index: int) -> None:
+        """Frees the slot of a deleted node"""
+        self.count -= 1
+        self.node_keys[index] = self.empty_key
+        self._set_value(index, None)
+        self.free.append(index)
+
+    def _set_keys(self, keys: list[T]) -> None:
+        """Replaces all keys, key `i` belongs to node `i`"""
+        self.node_keys = list(keys)
+
+    def _value(self, index: int) -> U:
+        """Returns the value of node `index`"""
+        return self.node_values[index]  # type: ignore[return-value]
+
+    def _set_value(self, index: int, value: U | None) -> None:
+        """Stores the value of node `index` (None when the slot is freed)"""
+        self.node_values[index] = value
+
+    def _set_values(self, values: list[U]) -> None:
+        """Replaces all values, value `i` belongs to node `i`"""
+        self.node_values = list(values)
+
+    def _node(self, index: int) -> Node[T, U] | None:
+        """Returns a detached copy of node `index`"""
+        if index == NIL:
+            return None
+        return Node(self.node_keys[index], self._value(index))  # type: ignore[arg-type]
+
+    def _find(self, key: T) -> int:
+        """Returns the index of the node with the given key, or NIL"""
+        keys, left, right = self.node_keys, self.left, self.right
+        index = self.root_index
+        while index != NIL:
+            node_key = keys[index]
+            if key == node_key:
+                return index
+            index = left[index] if key < node_key else right[index]  # type: ignore[operator]
+        return NIL
+
+    @property
+    def root(self) -> Node[T, U] | None:
+        """Detached copy of the root node, None for an empty tree"""
+        return self._node(self.root_index)
+
+    def insert(self, key: T, value: U) -> Node[T, U]:
+        """Inserts a new node with (key, value) to the tree and returns a copy of it"""
+        new_index = self._allocate(key, value)
+        if self.root_index == NIL:
+            self.root_index = new_index
+            return Node(key, value)
+
+        keys, left, right = self.node_keys, self.left, self.right
+        index = self.root_index
+        while True:
+            children = left if key < keys[index] else right  # type: ignore[operator]
+            if children[index] == NIL:
+                children[index] = new_index
+                return Node(key, value)
+            index = children[index]
+
+    def search(self, key: T) -> Node[T, U] | None:
+        """Searches for an element in the tree, returns a detached copy of the found node"""
+        return self._node(self._find(key))
+
+    def update(self, key: T, newValue: U) -> Node[T, U]:
+        """Updates the value of the node with the given key in the tree"""
+        index = self._find(key)
+        if index == NIL:
+            raise ValueError("Node not found")
+        self._set_value(index, newValue)
+        return Node(key, newValue)
+
+    def get(self, key: T, default: U | None = None) -> U | None:
+        """Returns the value attached to the key, or `default` if there is no such key"""
+        index = self._find(key)
+        return default if index == NIL else self._value(index)
+
+    def contains(self, key: T) -> bool:
+        """Checks if the tree contains a node with the given key"""
+        return self._find(key) != NIL
+
+    def put(self, key: T, value: U) -> bool:
+        """Updates the value of the key or inserts a new node, True if a node was inserted"""
+        index = self._find(key)
+        if index != NIL:
+            self._set_value(index, value)
+            return False
+        self.insert(key, value)
+        return True
+
+    def _extreme(self, children: array) -> int:
+        """Follows `children` links from the root to the last node"""
+        if self.root_index == NIL:
+            raise ValueError("Tree is empty")
+        index = self.root_index
+        while children[index] != NIL:
+            index = children[index]
+        return index
+
+    def min(self) -> Node[T, U]:
+        """Returns a copy of the minimum node in the tree"""
+        return self._node(self._extreme(self.left))  # type: ignore[return-value]
+
+    def max(self) -> Node[T, U]:
+        """Returns a copy of the maximum node in the tree"""
+        return self._node(self._extreme(self.right))  # type: ignore[return-value]
+
+    def remove(self, key: T) -> bool:
+        """Deletes the node with the given key, True if it existed"""
+        keys, left, right = self.node_keys, self.left, self.right
+        parent, index = NIL, self.root_index
+        while index != NIL and key != keys[index]:
+            parent = index
+            index = left[index] if key < keys[index] else right[index]  # type: ignore[operator]
+        if index == NIL:
+            return False
+
+        if left[index] != NIL and right[index] != NIL:
+            # Move the in-order successor (which has no left child) into this slot
+            successor_parent, successor = index, right[index]
+            while left[successor] != NIL:
+                successor_parent, successor = successor, left[successor]
+            keys[index] = keys[successor]
+            self._set_value(index, self._value(successor))
+            parent, index = successor_parent, successor
+
+        child = left[index] if left[index] != NIL else right[index]
+        if parent == NIL:
+            self.root_index = child
+        elif left[parent] == index:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._release(index)
+        return True
+
+    def delete(self, key: T) -> Node[T, U] | None:
+        """Deletes the node with the given key, returns a copy of the new root"""
+        self.remove(key)
+        return self.root
+
+    def _in_order(self, first: array, second: array) -> Iterator[Node[T, U]]:
+        """In-order traversal with an explicit stack, `first` children are visited first"""
+        stack: list[int] = []
+        index = self.root_index
+        while stack or index != NIL:
+            while index != NIL:
+                stack.append(index)
+                index = first[index]
+            index = stack.pop()
+            yield Node(self.node_keys[index], self._value(index))  # type: ignore[arg-type]
+            index = second[index]
+
+    def forward_iterator(self) -> Iterator[Node[T, U]]:
+        """Iterates over copies of the nodes in ascending key order"""
+        return self._in_order(self.left, self.right)
+
+    def backward_iterator(self) -> Iterator[Node[T, U]]:
+        """Iterates over copies of the nodes in descending key order"""
+        return self._in_order(self.right, self.left)
+
+    def value_chunks(
+        self, size: int = 1024, reverse: bool = False
+    ) -> Iterator[list[U]]:
+        """Streams the values in key order, grouped into lists of up to `size` values"""
+        nodes = self.backward_iterator() if reverse else self.forward_iterator()
+        chunk: list[U] = []
+        for node in nodes:
+            chunk.append(node.value)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def clear(self) -> None:
+        """Removes all nodes from the tree and releases the arrays"""
+        self._set_keys([])
+        self._set_values([])
+        self.left, self.right = array("q"), array("q")
+        self.root_index = NIL
+        self.free = []
+        self.count = 0
+
+    @classmethod
+    def from_sorted(cls, pairs: Iterable[tuple[T, U]]) -> PooledBinarySearchTree[T, U]:
+        """Builds a perfectly balanced tree from pairs with strictly ascending keys, in O(n)"""
+        items = list(pairs)
+        check_ascending(items)
+        tree = cls()
+        tree._build(items)
+        return tree
+
+    def bulk_load(self, pairs: Iterable[tuple[T, U]]) -> None:
+        """Replaces the contents with pairs in any order, the last value of a repeated key wins"""
+        self._build(sorted_unique(pairs))
+
+    def _build(self, items: list[tuple[T, U]]) -> None:
+        """Stores sorted items so that node `i` is item `i`, and links them into a balanced tree"""
+        count = len(items)
+        self._set_keys([key for key, _ in items])
+        self._set_values([value for _, value in items])
+        self.left = array("q", [NIL]) * count
+        self.right = array("q", [NIL]) * count
+        self.free = []
+        self.count = count
+        self.root_index = self._link(0, count)
+
+    def _link(self, lo: int, hi: int) -> int:
+        """Links nodes lo..hi-1 into a balanced subtree, returns the index of its root"""
+        if lo >= hi:
+            return NIL
+        middle = (lo + hi) // 2
+        self.left[middle] = self._link(lo, middle)
+        self.right[middle] = self._link(middle + 1, hi)
+        return middle
+
+    def forward_list(self) -> list[Node[T, U]]:
+        """Returns copies of the nodes in ascending key order"""
+        return list(self.forward_iterator())
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the tree"""
+        return self.count
+
+    def __eq__(self, value: object) -> bool:
+        """Checks if two pooled trees contain the same keys with the same values"""
+        if not isinstance(value, PooledBinarySearchTree):
+            return False
+        return len(self) == len(value) and all(
+            (a.key, a.value) == (b.key, b.value)
+            for a, b in zip(self.forward_iterator(), value.forward_iterator())
+        )
+
+    def equals(self, value: object) -> bool:
+        """Mirror of __eq__ (for calls through a manager proxy)"""
+        return self == value
+
+    def __iter__(self) -> Iterator[Node[T, U]]:
+        """Iterates over the nodes in ascending key order"""
+        return self.forward_iterator()
+
+    def __reversed__(self) -> Iterator[Node[T, U]]:
+        """Iterates over the nodes in descending key order"""
+        return self.backward_iterator()
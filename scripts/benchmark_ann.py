@@ -0,0 +1,78 @@
+"""Recall vs latency of project.homework_1.ann.AngleIndex compared with an exact scan
+
+Usage:
+    python scripts/benchmark_ann.py
+    python scripts/benchmark_ann.py --size 20000 --dimension 64 --k 10
+"""
+import argparse
+import random
+import sys
+import time
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.homework_1.ann import AngleIndex  # noqa: E402
+from project.homework_1.index import Vector  # noqa: E402
+from project.homework_1.vector_batch import VectorBatch  # noqa: E402
+
+CONFIGURATIONS = [
+    # (tables, bits, probes)
+    (4, 12, 0),
+    (8, 12, 0),
+    (8, 12, 4),
+    (16, 10, 0),
+    (16, 10, 4),
+    (32, 10, 4),
+    (32, 8, 2),
+]
+
+
+def random_vectors(
+    count: int, dimension: int, generator: random.Random
+) -> list[Vector]:
+    """Vectors with normally distributed coordinates, i.e. uniformly spread directions"""
+    return [
+        Vector(*(generator.gauss(0, 1) for _ in range(dimension))) for _ in range(count)
+    ]
+
+
+def main():
+    """Measures recall@k and mean query time for every configuration"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=5_000, help="indexed vectors")
+    parser.add_argument("--dimension", type=int, default=32, help="vector length")
+    parser.add_argument("--queries", type=int, default=50, help="number of queries")
+    parser.add_argument("--k", type=int, default=10, help="neighbours per query")
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    vectors = random_vectors(args.size, args.dimension, generator)
+    queries = random_vectors(args.queries, args.dimension, generator)
+
+    exact = VectorBatch(vectors)
+    start = time.perf_counter()
+    truth = [{i for i, _ in exact.top_k(query, args.k)} for query in queries]
+    scan_time = (time.perf_counter() - start) / len(queries)
+    print(f"{'configuration':<28} {'recall':>7} {'query, ms':>10} {'speedup':>8}")
+    print(f"{'exact scan':<28} {1:>7.3f} {scan_time * 1000:>10.3f} {1:>8.1f}")
+
+    for tables, bits, probes in CONFIGURATIONS:
+        index = AngleIndex(args.dimension, tables, bits, probes, seed=0)
+        index.extend(vectors)
+        hits = 0
+        start = time.perf_counter()
+        for query, expected in zip(queries, truth):
+            found = {i for i, _ in index.query(query, args.k)}
+            hits += len(found & expected)
+        query_time = (time.perf_counter() - start) / len(queries)
+        name = f"tables={tables} bits={bits} probes={probes}"
+        print(
+            f"{name:<28} {hits / (args.k * len(queries)):>7.3f} "
+            f"{query_time * 1000:>10.3f} {scan_time / query_time:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmarks for project.homework_1.index with regression checks against a stored baseline
+
+Usage:
+    python scripts/benchmark_linear_algebra.py                  # run and compare with baseline
+    python scripts/benchmark_linear_algebra.py --save-baseline  # run and overwrite baseline
+    python scripts/benchmark_linear_algebra.py --output results.json --tolerance 0.25
+
+Exits with code 1 if any benchmark is slower than the baseline by more than the tolerance.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from typing import Callable
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.homework_1.index import Matrix, Vector  # noqa: E402
+
+MATRIX_SIZES = [16, 64, 128]
+VECTOR_SIZES = [1_000, 100_000]
+DENSITIES = [1.0, 0.1]
+
+
+def random_values(count: int, density: float, generator: random.Random) -> list[float]:
+    """Random floats where only `density` of the values are nonzero"""
+    return [
+        generator.random() if generator.random() < density else 0.0
+        for _ in range(count)
+    ]
+
+
+def random_matrix(size: int, density: float, generator: random.Random) -> Matrix:
+    """Random square matrix where only `density` of the elements are nonzero"""
+    return Matrix(*(random_values(size, density, generator) for _ in range(size)))
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """Best time of a single call in seconds, out of `repeat` runs of at least 0.2 s each"""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_benchmarks(repeat: int) -> dict[str, float]:
+    """Times every operation over the grid of sizes and densities"""
+    generator = random.Random(0)
+    results: dict[str, float] = {}
+
+    for size in VECTOR_SIZES:
+        for density in DENSITIES:
+            vec1 = Vector(*random_values(size, density, generator))
+            vec2 = Vector(*random_values(size, density, generator))
+            key = f"n={size}/density={density}"
+            results[f"vector_dot/{key}"] = measure(lambda: vec1 * vec2, repeat)
+            results[f"vector_length/{key}"] = measure(vec1.length, repeat)
+            results[f"vector_angle/{key}"] = measure(lambda: vec1.angle(vec2), repeat)
+
+    for size in MATRIX_SIZES:
+        for density in DENSITIES:
+            mat1 = random_matrix(size, density, generator)
+            mat2 = random_matrix(size, density, generator)
+            copy = Matrix(*(list(row) for row in mat1.values))
+            key = f"n={size}/density={density}"
+            results[f"matrix_add/{key}"] = measure(lambda: mat1 + mat2, repeat)
+            results[f"matrix_mul/{key}"] = measure(lambda: mat1 * mat2, repeat)
+            results[f"matrix_transpose/{key}"] = measure(mat1.transpose, repeat)
+            results[f"matrix_eq/{key}"] = measure(lambda: mat1 == copy, repeat)
+
+    return results
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> list[str]:
+    """Prints a comparison table and returns names of benchmarks that regressed"""
+    regressions = []
+    print(f"{'benchmark':<45} {'baseline, s':>12} {'current, s':>12} {'ratio':>7}")
+    for name, seconds in results.items():
+        if name not in baseline:
+            print(f"{name:<45} {'-':>12} {seconds:>12.6f} {'new':>7}")
+            continue
+        ratio = seconds / baseline[name] if baseline[name] else float("inf")
+        mark = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            mark = "  <-- regression"
+        print(
+            f"{name:<45} {baseline[name]:>12.6f} {seconds:>12.6f} {ratio:>7.2f}{mark}"
+        )
+    return regressions
+
+
+def main():
+    """Runs the benchmarks, then saves them as the baseline or compares with it"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark")
+    parser.add_argument("--output", help="file to write results to (JSON)")
+    parser.add_argument(
+        "--baseline",
+        default=str(shared.BENCHMARK_BASELINE),
+        help="baseline file to compare with (JSON)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="allowed slowdown relative to the baseline, 0.5 means 50%%",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="overwrite the baseline"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeat)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
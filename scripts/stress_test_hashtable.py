@@ -23,4 +23,4 @@ def deploy_deletes(table: HashTable, start: int, end: int):
 
 def main():
     initial_data = [(i, f"value_{i}") for i in range(5_000_000)]
-    table = HashTable(initial_data)
+    table = HashTable(initial_data, balanced=True)
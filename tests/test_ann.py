@@ -0,0 +1,87 @@
+import random
+import pytest
+from project.homework_1.ann import AngleIndex
+from project.homework_1.index import FrozenVector, Vector
+from project.homework_1.vector_batch import VectorBatch
+
+
+def random_vectors(count, dimension, seed=0):
+    generator = random.Random(seed)
+    return [
+        Vector(*(generator.gauss(0, 1) for _ in range(dimension))) for _ in range(count)
+    ]
+
+
+def test_ann_finds_itself():
+    vectors = random_vectors(200, 8)
+    index = AngleIndex(8, tables=4, bits=6, seed=1)
+    index.extend(vectors)
+    assert len(index) == 200
+    for i in (0, 57, 199):
+        (found, angle), *_ = index.query(vectors[i], 1)
+        assert found == i
+        assert angle == pytest.approx(0, abs=1e-6)
+
+
+def test_ann_default_recall():
+    vectors = random_vectors(1000, 16)
+    queries = random_vectors(20, 16, seed=1)
+    index = AngleIndex(16, seed=0)
+    index.extend(vectors)
+    exact = VectorBatch(vectors)
+    hits = 0
+    for query in queries:
+        expected = {i for i, _ in exact.top_k(query, 10)}
+        hits += len({i for i, _ in index.query(query, 10)} & expected)
+    assert hits / 200 >= 0.9
+
+
+def test_ann_angles_are_exact_and_sorted():
+    vectors = random_vectors(100, 5)
+    index = AngleIndex(5, tables=6, bits=3, seed=2)
+    index.extend(vectors)
+    query = Vector(1, 2, 3, 4, 5)
+    result = index.query(query, 10)
+    angles = [angle for _, angle in result]
+    assert angles == sorted(angles)
+    for i, angle in result:
+        assert angle == pytest.approx(vectors[i].angle(query))
+
+
+def test_ann_recall_improves_with_probes():
+    vectors = random_vectors(500, 16)
+    queries = random_vectors(20, 16, seed=1)
+    exact = VectorBatch(vectors)
+    index = AngleIndex(16, tables=4, bits=10, seed=3)
+    index.extend(vectors)
+
+    def recall(probes):
+        hits = 0
+        for query in queries:
+            truth = {i for i, _ in exact.top_k(query, 5)}
+            hits += len(truth & {i for i, _ in index.query(query, 5, probes=probes)})
+        return hits / (5 * len(queries))
+
+    assert recall(10) >= recall(0)
+    assert recall(10) > 0.5
+    assert len(index.candidates(queries[0], probes=0)) < len(vectors)
+
+
+def test_ann_incremental_insert_and_zero_vectors():
+    index = AngleIndex(2, tables=2, bits=2, seed=0)
+    assert index.query(Vector(1, 0), 3) == []
+    index.add(Vector(0, 0))
+    index.add(Vector(1, 0))
+    assert index.query(Vector(1, 0), 3) == [(1, 0.0)]
+    assert index.add([2, 0.1]) == 2
+    assert [i for i, _ in index.query(Vector(1, 0), 3)] == [1, 2]
+    with pytest.raises(ValueError):
+        index.add(Vector(1, 2, 3))
+    with pytest.raises(ValueError):
+        AngleIndex(2, tables=0)
+
+
+def test_index_accepts_frozen_vectors():
+    index = AngleIndex(dimension=2, tables=4, bits=2, seed=0)
+    index.extend([FrozenVector(1, 0), FrozenVector(0, 1)])
+    assert index.query(FrozenVector(1, 0.01), 1)[0][0] == 0
@@ -0,0 +1,108 @@
+import pytest
+from project.homework_1 import backend
+from project.homework_1.index import Matrix, Vector
+
+
+@pytest.fixture
+def numpy_backend():
+    pytest.importorskip("numpy")
+    backend.set_backend("numpy")
+    yield
+    backend.set_backend("python")
+
+
+def test_default_backend():
+    assert backend.get_backend() == "python"
+
+
+def test_auto_backend():
+    expected = "numpy" if backend.numpy_available() else "python"
+    assert backend.set_backend("auto") == expected
+    backend.set_backend("python")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        backend.set_backend("fortran")  # type: ignore[arg-type]
+
+
+def test_numpy_backend_without_numpy(monkeypatch):
+    monkeypatch.setattr(backend, "numpy", None)
+    with pytest.raises(ImportError):
+        backend.set_backend("numpy")
+    assert backend.get_backend() == "python"
+
+
+def test_numpy_vector(numpy_backend):
+    vec1 = Vector(1, 2, 3)
+    vec2 = Vector(4, 5, 6)
+    assert vec1 * vec2 == 32
+    assert isinstance(vec1 * vec2, int)
+    assert Vector(3, 4, storage="array").length() == 5
+    assert Vector(1, 0, 0).angle(Vector(0, 1, 0)) == 90
+
+
+def test_numpy_matrix(numpy_backend):
+    mat1 = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
+    mat2 = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9], storage="array")
+    product = mat1 * mat1
+    assert isinstance(product, Matrix)
+    assert product.storage is None
+    assert product.values == [[30, 36, 42], [66, 81, 96], [102, 126, 150]]
+    assert (mat2 + mat2).storage is not None
+    assert mat2 + mat2 == Matrix([2, 4, 6], [8, 10, 12], [14, 16, 18])
+    assert mat2.transpose() == Matrix([1, 4, 7], [2, 5, 8], [3, 6, 9])
+    assert mat1 != Matrix([1, 2], [3, 4])
+
+
+def test_numpy_matrix_shape_check(numpy_backend):
+    with pytest.raises(ValueError):
+        Matrix([1, 2]) + Matrix([1], [2])
+
+
+@pytest.fixture(params=["python", "numpy"])
+def any_backend(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    backend.set_backend(request.param)
+    yield request.param
+    backend.set_backend("python")
+
+
+def test_fixed_width_overflow_raises(any_backend):
+    def big():
+        return Matrix([2**30, 2**30], [2**30, 2**30], dtype="int32")
+
+    with pytest.raises(OverflowError):
+        big() + big()
+    with pytest.raises(OverflowError):
+        big() * big()
+    with pytest.raises(OverflowError):
+        big() ** 2
+    with pytest.raises(OverflowError):
+        big().add(big(), out=big())
+    with pytest.raises(OverflowError):
+        big().multiply(big(), out=big())
+    mat = big()
+    with pytest.raises(OverflowError):
+        mat += big()
+    with pytest.raises(OverflowError):
+        mat *= big()
+
+
+def test_results_that_fit_do_not_overflow(any_backend):
+    small = Matrix([2**30, -(2**30)], [1, 2], dtype="int32")
+    total = small + Matrix([2**30 - 1, -(2**30)], [0, 0], dtype="int32")
+    assert total == Matrix([2**31 - 1, -(2**31)], [1, 2])
+    product = small * Matrix([1, 0], [0, 1], dtype="int32")
+    assert product == small
+    assert product.dtype == "int32"
+    wide = Matrix([2**31], [0], dtype="int64")
+    assert wide * Matrix([2**31], dtype="int64") == Matrix([2**62], [0])
+
+
+def test_integer_products_are_exact(any_backend):
+    vec = Vector(2**30, 2**30, dtype="int32")
+    assert vec * vec == 2**61
+    big = Matrix([2**62, 2**62])
+    assert (big * Matrix([2], [2])).values == [[2**64]]
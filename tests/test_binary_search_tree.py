@@ -1,4 +1,6 @@
-from project.homework_5.binary_search_tree import BinarySearchTree
+import random
+import pytest
+from project.homework_5.binary_search_tree import AVLTree, BinarySearchTree
 
 
 def test_binary_search_tree_initialization():
@@ -119,3 +121,238 @@ def test_delete_all_nodes():
     assert bst.search(1) is None
     assert bst.search(3) is None
     assert bst.search(2) is None
+
+
+def check_avl(node):
+    """Returns the height of a subtree, checking ordering, stored heights and balance"""
+    if node is None:
+        return 0
+    if node.left is not None:
+        assert node.left.key < node.key
+    if node.right is not None:
+        assert node.right.key >= node.key
+    left, right = check_avl(node.left), check_avl(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+def test_avl_sequential_inserts_stay_balanced():
+    tree = AVLTree()
+    for key in range(1, 1024):
+        tree.insert(key, key)
+    assert check_avl(tree.root) == 10
+    assert tree.min().key == 1
+    assert tree.max().key == 1023
+    assert tree.search(500).value == 500
+    assert tree.search(2000) is None
+
+
+def test_avl_random_operations():
+    generator = random.Random(0)
+    tree = AVLTree()
+    expected = {}
+    for _ in range(2000):
+        key = generator.randrange(300)
+        if generator.random() < 0.6:
+            if tree.put(key, -key):
+                expected[key] = -key
+        elif key in expected:
+            tree.delete(key)
+            del expected[key]
+        check_avl(tree.root)
+    for key in range(300):
+        assert tree.get(key) == expected.get(key)
+
+
+def test_avl_update_and_delete():
+    tree = AVLTree()
+    for key in [5, 3, 8, 1, 4, 7, 9]:
+        tree.insert(key, str(key))
+    tree.update(4, "four")
+    assert tree.search(4).value == "four"
+    tree.delete(5)
+    assert tree.search(5) is None
+    assert tree.get(7) == "7"
+    assert tree.get(4) == "four"
+    check_avl(tree.root)
+
+
+def test_tree_value_helpers():
+    bst = BinarySearchTree()
+    assert bst.put(1, "a")
+    assert not bst.put(1, "b")
+    assert bst.get(1) == "b"
+    assert bst.get(2, "default") == "default"
+    assert bst.contains(1)
+    assert bst.remove(1)
+    assert not bst.remove(1)
+    assert not bst.contains(1)
+
+
+def test_deep_tree_has_no_recursion_limit():
+    bst = BinarySearchTree()
+    for key in range(3000):
+        bst.insert(key, key)
+    assert bst.search(2999).value == 2999
+    assert bst.min().key == 0
+    assert bst.max().key == 2999
+    bst.update(2500, -1)
+    assert bst.get(2500) == -1
+    bst.delete(2999)
+    assert bst.max().key == 2998
+
+
+def test_delete_node_with_two_children_keeps_values():
+    for tree in (BinarySearchTree(), AVLTree()):
+        for key in [50, 30, 70, 20, 40, 60, 80, 65]:
+            tree.insert(key, f"value_{key}")
+        tree.delete(50)
+        tree.delete(30)
+        for key in [20, 40, 60, 65, 70, 80]:
+            assert tree.get(key) == f"value_{key}"
+        assert tree.get(50) is None
+
+
+def test_random_operations_match_dict():
+    generator = random.Random(1)
+    for tree in (BinarySearchTree(), AVLTree()):
+        expected = {}
+        for _ in range(3000):
+            key = generator.randrange(500)
+            if generator.random() < 0.55:
+                tree.put(key, key * 2)
+                expected[key] = key * 2
+            else:
+                assert tree.remove(key) == (key in expected)
+                expected.pop(key, None)
+        for key in range(500):
+            assert tree.get(key) == expected.get(key)
+        if expected:
+            assert tree.min().key == min(expected)
+            assert tree.max().key == max(expected)
+
+
+def test_in_order_iterators_visit_every_node():
+    for tree in (BinarySearchTree(), AVLTree()):
+        keys = [50, 30, 70, 20, 40, 60, 80, 35, 45]
+        for key in keys:
+            tree.insert(key, -key)
+        assert [node.key for node in tree] == sorted(keys)
+        assert [node.key for node in reversed(tree)] == sorted(keys, reverse=True)
+        assert len(tree) == len(keys)
+        subtree = tree.forward_iterator(tree.search(30))
+        assert [node.key for node in subtree] == [20, 30, 35, 40, 45]
+
+
+def test_value_chunks():
+    tree = AVLTree()
+    for key in range(10):
+        tree.insert(key, key * 10)
+    assert list(tree.value_chunks(4)) == [[0, 10, 20, 30], [40, 50, 60, 70], [80, 90]]
+    assert next(tree.value_chunks(3, reverse=True)) == [90, 80, 70]
+    tree.clear()
+    assert list(tree.value_chunks()) == []
+    assert len(tree) == 0
+
+
+def check_sizes(node):
+    """Returns the number of nodes in a subtree, checking the stored subtree sizes"""
+    if node is None:
+        return 0
+    size = 1 + check_sizes(node.left) + check_sizes(node.right)
+    assert node.size == size
+    return size
+
+
+def test_subtree_sizes_after_random_operations():
+    generator = random.Random(2)
+    for tree in (BinarySearchTree(), AVLTree()):
+        expected = set()
+        for _ in range(2000):
+            key = generator.randrange(200)
+            if generator.random() < 0.6:
+                tree.put(key, key)
+                expected.add(key)
+            else:
+                tree.remove(key)
+                expected.discard(key)
+            assert len(tree) == len(expected)
+        assert check_sizes(tree.root) == len(expected)
+
+
+def test_order_statistics():
+    for tree in (BinarySearchTree(), AVLTree()):
+        keys = [50, 30, 70, 20, 40, 60, 80, 35, 45]
+        for key in keys:
+            tree.insert(key, str(key))
+        ordered = sorted(keys)
+
+        assert [node.key for node in tree.range(30, 60)] == [30, 35, 40, 45, 50]
+        assert [node.key for node in tree.range(31, 36)] == [35]
+        assert list(tree.range(90, 100)) == []
+        assert [node.key for node in tree.range(0, 100)] == ordered
+
+        assert tree.floor(44).key == 40
+        assert tree.floor(45).key == 45
+        assert tree.floor(10) is None
+        assert tree.ceiling(44).key == 45
+        assert tree.ceiling(81) is None
+
+        for i, key in enumerate(ordered):
+            assert tree.rank(key) == i
+            assert tree.select(i).key == key
+        assert tree.rank(100) == len(keys)
+        assert tree.rank(0) == 0
+
+        tree.delete(50)
+        assert tree.select(5).key == 60
+        assert tree.rank(60) == 5
+
+
+def test_select_out_of_range():
+    tree = AVLTree()
+    with pytest.raises(IndexError):
+        tree.select(0)
+    tree.insert(1, "a")
+    with pytest.raises(IndexError):
+        tree.select(1)
+    with pytest.raises(IndexError):
+        tree.select(-1)
+
+
+def test_from_sorted_builds_balanced_tree():
+    pairs = [(key, str(key)) for key in range(1023)]
+    tree = AVLTree.from_sorted(pairs)
+    assert isinstance(tree, AVLTree)
+    assert check_avl(tree.root) == 10
+    assert check_sizes(tree.root) == 1023
+    assert [(node.key, node.value) for node in tree] == pairs
+    tree.insert(2000, "new")
+    tree.delete(0)
+    check_avl(tree.root)
+    assert tree.select(0).key == 1
+
+    bst = BinarySearchTree.from_sorted(pairs[:100])
+    assert bst.get(42) == "42"
+    assert len(bst) == 100
+    assert len(BinarySearchTree.from_sorted([])) == 0
+
+
+def test_from_sorted_rejects_unsorted_keys():
+    with pytest.raises(ValueError):
+        BinarySearchTree.from_sorted([(2, "b"), (1, "a")])
+    with pytest.raises(ValueError):
+        AVLTree.from_sorted([(1, "a"), (1, "b")])
+
+
+def test_bulk_load_sorts_and_keeps_last_value():
+    for tree in (BinarySearchTree(), AVLTree()):
+        tree.insert(100, "old")
+        tree.bulk_load([(3, "c"), (1, "a"), (2, "b"), (1, "z")])
+        assert [(node.key, node.value) for node in tree] == [
+            (1, "z"),
+            (2, "b"),
+            (3, "c"),
+        ]
+        assert check_sizes(tree.root) == 3
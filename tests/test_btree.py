@@ -0,0 +1,178 @@
+import random
+import subprocess
+import sys
+import pytest
+from project.homework_5.btree import BPlusTree
+
+
+def test_btree_operations(tmp_path):
+    with BPlusTree(tmp_path / "tree.db") as tree:
+        assert len(tree) == 0
+        assert tree.search(1) is None
+        for key in [5, 3, 8, 1, 4]:
+            tree.insert(key, str(key))
+        assert len(tree) == 5
+        assert tree.search(4).value == "4"
+        assert tree.get(7, "missing") == "missing"
+        assert tree.contains(8)
+        tree.update(3, "three")
+        assert tree.get(3) == "three"
+        with pytest.raises(ValueError):
+            tree.update(10, "ten")
+        assert tree.min().key == 1
+        assert tree.max().key == 8
+        assert not tree.put(5, "five")
+        tree.delete(8)
+        assert not tree.remove(8)
+        assert [node.key for node in tree] == [1, 3, 4, 5]
+        assert [node.value for node in reversed(tree)] == ["five", "4", "three", "1"]
+
+
+def test_btree_empty_tree(tmp_path):
+    with BPlusTree(tmp_path / "tree.db") as tree:
+        with pytest.raises(ValueError):
+            tree.min()
+        with pytest.raises(ValueError):
+            tree.max()
+        assert list(tree) == []
+
+
+def test_btree_random_operations_match_dict(tmp_path):
+    generator = random.Random(3)
+    expected = {}
+    with BPlusTree(tmp_path / "tree.db", page_size=512, cache_pages=4) as tree:
+        for _ in range(5000):
+            key = generator.randrange(2000)
+            if generator.random() < 0.6:
+                tree.put(key, f"value_{key}" * generator.randrange(1, 4))
+                expected[key] = tree.get(key)
+            else:
+                assert tree.remove(key) == (key in expected)
+                expected.pop(key, None)
+        assert len(tree) == len(expected)
+        assert [(node.key, node.value) for node in tree] == sorted(expected.items())
+        assert [node.key for node in reversed(tree)] == sorted(expected, reverse=True)
+        assert tree.min().key == min(expected)
+        assert tree.max().key == max(expected)
+        assert tree.height() == 2
+        for key in expected:
+            tree.delete(key)
+        assert len(tree) == 0
+        assert list(tree) == []
+        assert tree.height() == 1
+
+
+def test_btree_survives_reopening(tmp_path):
+    path = tmp_path / "tree.db"
+    with BPlusTree(path, page_size=1024, cache_pages=8) as tree:
+        for key in range(3000):
+            tree.insert(key, key * key)
+        tree.delete(1500)
+    with BPlusTree(path) as tree:
+        assert tree.page_size == 1024
+        assert len(tree) == 2999
+        assert tree.get(2999) == 2999 * 2999
+        assert tree.get(1500) is None
+        assert [node.key for node in tree.range(1498, 1503)] == [1498, 1499, 1501, 1502]
+        tree.insert(1500, 0)
+    with BPlusTree(path) as tree:
+        assert tree.get(1500) == 0
+
+
+def test_btree_reuses_free_pages(tmp_path):
+    with BPlusTree(tmp_path / "tree.db", page_size=512) as tree:
+        for key in range(2000):
+            tree.insert(key, key)
+        pages = tree.pages
+        for key in range(2000):
+            tree.delete(key)
+        for key in range(2000):
+            tree.insert(key, key)
+        assert tree.pages == pages
+        tree.clear()
+        assert len(tree) == 0
+        assert tree.pages == 2
+
+
+def test_btree_value_chunks_and_equality(tmp_path):
+    with BPlusTree(tmp_path / "a.db") as a, BPlusTree(tmp_path / "b.db") as b:
+        for key in range(10):
+            a.insert(key, key * 10)
+            b.insert(9 - key, (9 - key) * 10)
+        assert list(a.value_chunks(4)) == [[0, 10, 20, 30], [40, 50, 60, 70], [80, 90]]
+        assert next(a.value_chunks(3, reverse=True)) == [90, 80, 70]
+        assert a == b
+        b.update(0, -1)
+        assert not a.equals(b)
+
+
+def test_btree_rejects_large_entries_and_other_files(tmp_path):
+    with BPlusTree(tmp_path / "tree.db", page_size=512) as tree:
+        with pytest.raises(ValueError):
+            tree.insert(1, "x" * 1000)
+        with pytest.raises(ValueError):
+            tree.insert("k" * 200, 1)
+        assert len(tree) == 0
+
+    path = tmp_path / "other.db"
+    path.write_bytes(b"not a tree" * 100)
+    with pytest.raises(ValueError):
+        BPlusTree(path)
+
+
+def test_btree_reopens_without_close(tmp_path):
+    path = tmp_path / "tree.db"
+    tree = BPlusTree(path, page_size=512, cache_pages=4)
+    for key in range(5000):
+        tree.insert(key, str(key))
+    del tree
+    with BPlusTree(path) as tree:
+        assert len(tree) == 5000
+        assert [node.key for node in tree] == list(range(5000))
+        assert tree.get(4321) == "4321"
+
+
+def run_and_exit(path, flush_after, inserts):
+    """Inserts keys in a child process that exits without closing the tree"""
+    script = f"""
+import os
+from project.homework_5.btree import BPlusTree
+tree = BPlusTree({str(path)!r}, page_size=512, cache_pages=8)
+for key in range({inserts}):
+    tree.insert(key, str(key))
+    if key + 1 == {flush_after}:
+        tree.flush()
+os._exit(0)
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_btree_unclean_exit_keeps_flushed_changes(tmp_path):
+    path = tmp_path / "tree.db"
+    run_and_exit(path, flush_after=20_000, inserts=20_000)
+    with BPlusTree(path) as tree:
+        assert len(tree) == 20_000
+        assert [node.key for node in tree] == list(range(20_000))
+
+
+def test_btree_unclean_exit_without_flush_fails_cleanly(tmp_path):
+    path = tmp_path / "tree.db"
+    run_and_exit(path, flush_after=0, inserts=20_000)
+    try:
+        with BPlusTree(path) as tree:
+            for node in tree:
+                assert node.value == str(node.key)
+    except ValueError:
+        pass
+
+
+def test_btree_corrupt_page_raises_value_error(tmp_path):
+    path = tmp_path / "tree.db"
+    with BPlusTree(path, page_size=512) as tree:
+        tree.insert(1, "a")
+    with open(path, "r+b") as file:
+        file.seek(512 + 5)
+        file.write(b"\xff" * 16)
+    with pytest.raises(ValueError):
+        with BPlusTree(path) as tree:
+            tree.get(1)
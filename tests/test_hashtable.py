@@ -1,4 +1,5 @@
 import time
+import pytest
 from project.homework_5.hashtable import HashTable
 import multiprocessing
 
@@ -120,6 +121,44 @@ def test_hashtable_initial_elements_with_duplicates():
     assert table[1] == 11
 
 
+def test_hashtable_initial_elements_are_bulk_loaded():
+    elements = [(i, f"value_{i}") for i in reversed(range(1000))]
+    for table in (HashTable(elements), HashTable(elements, compact=True)):
+        assert len(table) == 1000
+        assert table[0] == "value_0"
+        assert list(table.keys()) == list(range(1000))
+        table[1000] = "new"
+        del table[500]
+        assert len(table) == 1000
+
+
+def test_balanced_hashtable():
+    table = HashTable([(i, i * i) for i in range(200)], balanced=True)
+    assert table[150] == 22500
+    assert len(table) == 200
+    assert list(table.keys()) == list(range(200))
+    del table[150]
+    assert 150 not in table
+    table[150] = 0
+    assert table[150] == 0
+
+
+def test_hashtable_delete_missing_key():
+    table = HashTable()
+    with pytest.raises(KeyError):
+        del table[1]
+
+
+def test_hashtable_streams_in_chunks():
+    table = HashTable([(i, str(i)) for i in range(2500)], balanced=True)
+    assert len(table) == 2500
+    assert list(table.values()) == [str(i) for i in range(2500)]
+    keys = table.keys()
+    assert [next(keys) for _ in range(3)] == [0, 1, 2]
+    table.clear()
+    assert len(table) == 0
+
+
 def test_contains_in_hashtable():
     table = HashTable()
     table[1] = 5
@@ -0,0 +1,119 @@
+import pytest
+from project.homework_1 import backend
+from project.homework_1.index import Matrix, SparseMatrix
+
+
+@pytest.fixture(params=["list", "array"])
+def storage(request):
+    return request.param
+
+
+def test_iadd_keeps_elements(storage):
+    mat = Matrix([1, 2], [3, 4], storage=storage)
+    rows = mat.rows()
+    same = mat
+    mat += Matrix([1, 1], [1, 1])
+    assert mat is same
+    assert mat == Matrix([2, 3], [4, 5])
+    assert list(rows[0]) == [2, 3]
+
+
+def test_iadd_with_overlapping_operand(storage):
+    mat = Matrix([1, 2], [3, 4], storage=storage)
+    mat += mat.transpose()
+    assert mat == Matrix([2, 5], [5, 8])
+    mat += mat
+    assert mat == Matrix([4, 10], [10, 16])
+    mat.add(mat[::-1], out=mat)
+    assert mat == Matrix([14, 26], [14, 26])
+
+
+def test_iadd_sparse(storage):
+    mat = Matrix([1, 2], [3, 4], storage=storage)
+    mat += SparseMatrix.from_coo([1], [0], [10], (2, 2))
+    assert mat == Matrix([1, 2], [13, 4])
+
+
+def test_imul(storage):
+    mat = Matrix([1, 2], [3, 4], [5, 6], storage=storage)
+    expected = mat * Matrix([0, 1], [1, 1])
+    same = mat
+    mat *= Matrix([0, 1], [1, 1])
+    assert mat is same
+    assert mat == expected
+    with pytest.raises(ValueError):
+        mat *= Matrix([1, 2, 3], [4, 5, 6])
+
+
+def test_imul_by_itself(storage):
+    mat = Matrix([1, 2], [3, 4], storage=storage)
+    expected = mat * mat
+    mat *= mat
+    assert mat == expected
+
+
+def test_add_out(storage):
+    mat1 = Matrix([1, 2], [3, 4])
+    mat2 = Matrix([5, 6], [7, 8], storage="array")
+    out = Matrix([0, 0], [0, 0], storage=storage)
+    assert mat1.add(mat2, out=out) is out
+    assert out == mat1 + mat2
+    assert mat1.add(mat2) == mat1 + mat2
+    with pytest.raises(ValueError):
+        mat1.add(mat2, out=Matrix([0, 0]))
+
+
+def test_multiply_out(storage):
+    mat1 = Matrix([1, 2, 3], [4, 5, 6])
+    mat2 = Matrix([1, 0], [0, 1], [1, 1], storage=storage)
+    out = Matrix([9, 9], [9, 9], storage=storage)
+    scratch_rows = out.rows()
+    assert mat1.multiply(mat2, out=out) is out
+    assert out == mat1 * mat2
+    assert list(scratch_rows[1]) == [10, 11]
+    with pytest.raises(ValueError):
+        mat1.multiply(mat2, out=Matrix([0, 0, 0], [0, 0, 0]))
+    with pytest.raises(ValueError):
+        out.multiply(Matrix([1, 0], [0, 1]), out=out)
+
+
+def test_inplace_numpy_backend():
+    pytest.importorskip("numpy")
+    mat = Matrix([1, 2], [3, 4], storage="array")
+    out = Matrix([0, 0], [0, 0], storage="array")
+    backend.set_backend("numpy")
+    try:
+        mat.add(mat, out=out)
+        assert out == Matrix([2, 4], [6, 8])
+        mat.multiply(Matrix([0, 1], [1, 0]), out=out)
+        assert out == Matrix([2, 1], [4, 3])
+        mat *= Matrix([1, 1], [0, 1])
+        assert mat == Matrix([1, 3], [3, 7])
+    finally:
+        backend.set_backend("python")
+
+
+def test_list_matrices_sharing_rows_are_detected():
+    a = Matrix([1, 2], [3, 4])
+    with pytest.raises(ValueError):
+        a.multiply(a.copy(), out=Matrix(*a.values))
+    assert a == Matrix([1, 2], [3, 4])
+    shuffled = Matrix(*a.values[::-1])
+    a.add(shuffled, out=a)
+    assert a == Matrix([4, 6], [4, 6])
+
+
+def test_float_result_into_integer_matrix():
+    ints = Matrix([1, 2], [3, 4], dtype="int32")
+    floats = Matrix([0.5, 0.5], [0.5, 0.5], dtype="float64")
+    with pytest.raises(ValueError, match="int32"):
+        ints += floats
+    with pytest.raises(ValueError):
+        ints.add(Matrix([0.5, 1.0], [1.0, 1.0]), out=ints)
+    with pytest.raises(ValueError):
+        floats.multiply(floats, out=ints)
+    assert ints == Matrix([1, 2], [3, 4])
+    ints += Matrix([1, 1], [1, 1], dtype="int64")
+    assert ints == Matrix([2, 3], [4, 5])
+    floats += ints
+    assert floats == Matrix([2.5, 3.5], [4.5, 5.5])
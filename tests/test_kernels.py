@@ -0,0 +1,51 @@
+import random
+import pytest
+from project.homework_1.index import Matrix
+from project.homework_1.kernels import (
+    choose_method,
+    multiply,
+    multiply_blocked,
+    multiply_naive,
+    multiply_strassen,
+)
+
+
+def random_rows(rows, cols, seed):
+    generator = random.Random(seed)
+    return [[generator.randint(-9, 9) for _ in range(cols)] for _ in range(rows)]
+
+
+@pytest.mark.parametrize("shape", [(1, 1, 1), (3, 5, 2), (7, 4, 9), (10, 10, 10)])
+def test_blocked_matches_naive(shape):
+    rows, inner, cols = shape
+    a, b = random_rows(rows, inner, 1), random_rows(inner, cols, 2)
+    assert multiply_blocked(a, b, cols, block_size=3) == multiply_naive(a, b, cols)
+
+
+@pytest.mark.parametrize("shape", [(8, 8, 8), (9, 7, 11), (16, 5, 13)])
+def test_strassen_matches_naive(shape):
+    rows, inner, cols = shape
+    a, b = random_rows(rows, inner, 3), random_rows(inner, cols, 4)
+    assert multiply_strassen(a, b, cols, threshold=2) == multiply_naive(a, b, cols)
+
+
+def test_choose_method():
+    assert choose_method(300, 300, 300, strassen_threshold=128) == "strassen"
+    assert choose_method(300, 300, 10, strassen_threshold=128) == "blocked"
+    assert choose_method(100, 100, 100, strassen_threshold=128) == "blocked"
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        multiply([[1]], [[1]], 1, method="unknown")  # type: ignore[arg-type]
+
+
+def test_matrix_multiply_methods():
+    a, b = random_rows(6, 5, 5), random_rows(5, 7, 6)
+    expected = Matrix(*multiply_naive(a, b, 7))
+    mat1, mat2 = Matrix(*a), Matrix(*b)
+    mat1.strassen_threshold = 2
+    for method in ["naive", "blocked", "strassen", "auto"]:
+        assert mat1.multiply(mat2, method=method) == expected
+    mat1.multiplication = "strassen"
+    assert mat1 * mat2 == expected
@@ -0,0 +1,110 @@
+import pytest
+from project.homework_1.index import Matrix
+from project.homework_1.kernels import chain_order
+from project.homework_1.lazy import Expression, LazyMatrix, Leaf, Product, Sum, optimize
+
+
+def matrices():
+    a = Matrix([1, 2, 3], [4, 5, 6])
+    b = Matrix([6, 5, 4], [3, 2, 1])
+    c = Matrix([1, 0], [2, 1], [0, 3])
+    return a, b, c
+
+
+def test_chain_order():
+    cost, split = chain_order([10, 100, 5, 50])
+    assert cost == 7500
+    assert split[0][2] == 1
+    assert chain_order([2, 3])[0] == 0
+
+
+def test_lazy_is_deferred():
+    a, b, _ = matrices()
+    expression = a.lazy() + b
+    assert isinstance(expression, LazyMatrix)
+    assert expression.shape == (2, 3)
+
+
+def test_lazy_sum_and_product():
+    a, b, c = matrices()
+    assert ((a.lazy() + b) * c).evaluate() == (a + b) * c
+    assert (a + b.lazy() + a).evaluate() == a + b + a
+    assert (a * c.lazy()).evaluate() == a * c
+
+
+def test_lazy_transpose():
+    a, b, c = matrices()
+    assert ((a.lazy() + b) * a.lazy().transpose()).evaluate() == (a + b) * a.transpose()
+    assert (a.lazy().transpose() * b).evaluate() == a.transpose() * b
+    assert (c.lazy().transpose() * a.lazy().transpose()).evaluate() == (
+        a * c
+    ).transpose()
+    assert (a.lazy() * c).transpose().evaluate() == (a * c).transpose()
+    assert a.lazy().transpose().transpose().evaluate() == a
+
+
+def test_optimize_folds_transposes():
+    a, b, c = matrices()
+    optimized = ((a.lazy() + b) * c).transpose().optimized()
+    assert isinstance(optimized, Product)
+    assert optimized.factors[0] == Leaf(c, transposed=True)
+    assert isinstance(optimized.factors[1], Sum)
+    assert optimized.factors[1].terms == [
+        Leaf(a, transposed=True),
+        Leaf(b, transposed=True),
+    ]
+
+
+def test_optimize_flattens_chains():
+    a, _, c = matrices()
+    expression = (a.lazy() * c) * (a.lazy() * c)
+    optimized = optimize(expression.expression)
+    assert isinstance(optimized, Product)
+    assert len(optimized.factors) == 4
+    assert expression.evaluate() == (a * c) * (a * c)
+
+
+def test_lazy_array_storage():
+    a, b, c = matrices()
+    result = (a.as_storage("array").lazy() + b).evaluate()
+    assert result.storage is not None
+    assert result == a + b
+
+
+def test_lazy_dimension_check():
+    a, _, c = matrices()
+    with pytest.raises(ValueError):
+        a.lazy() + c
+    with pytest.raises(ValueError):
+        a.lazy() * a
+
+
+@pytest.mark.parametrize("storage", ["list", "array"])
+def test_lazy_leaf_result_is_a_copy(storage):
+    mat = Matrix([1, 2], [3, 4], storage=storage)
+    for result in (
+        mat.lazy().evaluate(),
+        mat.lazy().transpose().transpose().evaluate(),
+        mat.lazy().transpose().evaluate(),
+    ):
+        assert result is not mat
+        result += Matrix([10, 10], [10, 10])
+        assert mat == Matrix([1, 2], [3, 4])
+
+
+def test_expression_is_abstract():
+    with pytest.raises(TypeError):
+        Expression()
+
+
+@pytest.mark.parametrize("storage", ["list", "array"])
+def test_lazy_sum_reads_rows_once_per_leaf(storage, monkeypatch):
+    a = Matrix(*([i + j for j in range(20)] for i in range(20)), storage=storage)
+    expected = a + a.transpose() + a
+    calls = []
+    rows = Matrix.rows
+    monkeypatch.setattr(Matrix, "rows", lambda self: calls.append(self) or rows(self))
+    result = (a.lazy() + a.lazy().transpose() + a).evaluate()
+    monkeypatch.undo()
+    assert result == expected
+    assert len(calls) <= 3
@@ -0,0 +1,112 @@
+import random
+import pytest
+from project.homework_1.index import Matrix, Vector
+
+
+def assert_close(mat1, mat2):
+    for row1, row2 in zip(mat1.values, mat2.values):
+        assert row1 == pytest.approx(row2)
+
+
+def test_lu_solve():
+    mat = Matrix([2, 1, 1], [4, -6, 0], [-2, 7, 2])
+    solution = mat.lu().solve(Vector(5, -2, 9))
+    assert list(solution.values) == pytest.approx([1, 1, 2])
+    assert isinstance(solution.values, tuple)
+    array_solution = mat.lu().solve(Vector(5, -2, 9, storage="array"))
+    assert array_solution.dtype == "float64"
+
+    batch = Matrix([5, 4], [-2, -2], [9, 5])
+    solutions = mat.lu().solve(batch)
+    assert_close(mat * solutions, batch)
+    with pytest.raises(ValueError):
+        mat.lu().solve(Vector(1, 2))
+
+
+def test_lu_det_and_inverse():
+    mat = Matrix([0, 2], [3, 4])
+    factorization = mat.lu()
+    assert factorization.det() == pytest.approx(-6)
+    assert_close(mat * factorization.inverse(), Matrix([1, 0], [0, 1]))
+
+    generator = random.Random(0)
+    big = Matrix(*([generator.random() for _ in range(8)] for _ in range(8)))
+    assert_close(
+        big.lu().inverse() * big,
+        Matrix(*([float(i == j) for j in range(8)] for i in range(8))),
+    )
+    inverse = Matrix([2, 0], [0, 4], storage="array").lu().inverse()
+    assert inverse.dtype == "float64"
+    assert inverse == Matrix([0.5, 0.0], [0.0, 0.25])
+
+
+def test_lu_singular():
+    factorization = Matrix([1, 2], [2, 4]).lu()
+    assert factorization.singular
+    assert factorization.det() == 0
+    with pytest.raises(ValueError):
+        factorization.solve(Vector(1, 1))
+    with pytest.raises(ValueError):
+        factorization.inverse()
+    with pytest.raises(ValueError):
+        Matrix([1, 2, 3], [4, 5, 6]).lu()
+
+
+def test_lu_singular_with_rounding_errors():
+    factorization = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9]).lu()
+    assert factorization.singular
+    assert factorization.det() == 0
+    assert Matrix([0, 0], [0, 0]).lu().singular
+    assert not Matrix([1e-20, 0], [0, 1e-20]).lu().singular
+
+
+def test_lu_badly_scaled_matrix_is_regular():
+    factorization = Matrix([1e20, 0.0], [0.0, 1.0]).lu()
+    assert not factorization.singular
+    assert factorization.det() == 1e20
+    assert list(factorization.solve(Vector(1e20, 2.0)).values) == [1.0, 2.0]
+    assert (
+        not Matrix([1e-30, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1e30]).lu().singular
+    )
+
+
+@pytest.mark.parametrize("storage", ["list", "array"])
+def test_lu_cache_invalidation(storage):
+    mat = Matrix([2.0, 0.0], [0.0, 2.0], storage=storage)
+    factorization = mat.lu()
+    assert mat.lu() is factorization
+
+    mat[0, 0] = 4.0
+    assert mat.lu() is not factorization
+    assert mat.lu().det() == 8
+
+    factorization = mat.lu()
+    mat += Matrix([1.0, 0.0], [0.0, 1.0])
+    assert mat.lu().det() == 15
+
+    mat *= Matrix([1.0, 0.0], [0.0, 2.0])
+    assert mat.lu().det() == 30
+    mat.add(mat, out=mat)
+    assert mat.lu().det() == 120
+
+
+def test_lu_cache_sees_writes_through_views():
+    mat = Matrix([1.0, 0.0], [0.0, 1.0], storage="array")
+    assert mat.lu().det() == 1
+    view = mat.transpose()
+    view[1, 0] = 5.0
+    assert mat.lu().det() == 1
+    view[0, 0] = 3.0
+    assert mat.lu().det() == 3
+
+
+def test_lu_cache_sees_direct_writes():
+    mat = Matrix([4.0, 3.0], [6.0, 3.0])
+    assert mat.lu().det() == -6.0
+    mat.values[0][1] = -1.0
+    assert mat.lu().det() == 18.0
+
+    mat = Matrix([4.0, 3.0], [6.0, 3.0], storage="array")
+    assert mat.lu().det() == -6.0
+    mat.memoryview()[0, 1] = -1.0
+    assert mat.lu().det() == 18.0
@@ -0,0 +1,137 @@
+import random
+import tracemalloc
+import pytest
+from project.homework_5.binary_search_tree import BinarySearchTree, Node
+from project.homework_5.hashtable import HashTable, KeyValuePair, PooledEntryTree
+from project.homework_5.node_pool import PooledBinarySearchTree
+
+
+def test_node_is_slotted():
+    node = Node(1, "a")
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.extra = 1
+
+
+def test_pooled_tree_operations():
+    tree = PooledBinarySearchTree()
+    assert tree.root is None
+    for key in [5, 3, 8, 1, 4, 7, 9]:
+        tree.insert(key, str(key))
+    assert len(tree) == 7
+    assert tree.search(4).value == "4"
+    assert tree.search(6) is None
+    assert tree.min().key == 1
+    assert tree.max().key == 9
+    tree.update(4, "four")
+    assert tree.get(4) == "four"
+    with pytest.raises(ValueError):
+        tree.update(6, "six")
+
+    tree.delete(5)
+    assert tree.search(5) is None
+    assert [node.key for node in tree] == [1, 3, 4, 7, 8, 9]
+    assert [node.key for node in reversed(tree)] == [9, 8, 7, 4, 3, 1]
+    assert tree.get(7) == "7"
+
+
+def test_pooled_tree_reuses_slots():
+    tree = PooledBinarySearchTree()
+    for key in range(10):
+        tree.insert(key, key)
+    for key in range(5):
+        tree.delete(key)
+    for key in range(10, 15):
+        tree.insert(key, key)
+    assert len(tree.node_keys) == 10
+    assert [node.key for node in tree] == list(range(5, 15))
+
+
+def test_pooled_tree_matches_binary_search_tree():
+    generator = random.Random(2)
+    pooled, linked = PooledBinarySearchTree(), BinarySearchTree()
+    for _ in range(2000):
+        key = generator.randrange(300)
+        if generator.random() < 0.6:
+            assert pooled.put(key, -key) == linked.put(key, -key)
+        else:
+            assert pooled.remove(key) == linked.remove(key)
+    for key in range(300):
+        assert pooled.get(key) == linked.get(key)
+    assert pooled == pooled
+    with pytest.raises(ValueError):
+        PooledBinarySearchTree().min()
+
+
+def test_pooled_tree_uses_less_memory():
+    keys = list(range(20_000))
+    random.Random(0).shuffle(keys)
+
+    def memory_per_entry(tree):
+        tracemalloc.start()
+        for key in keys:
+            tree.insert(key, None)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size / len(keys)
+
+    linked = memory_per_entry(BinarySearchTree())
+    pooled = memory_per_entry(PooledBinarySearchTree())
+    assert pooled * 1.5 < linked
+
+
+def test_entry_tree_uses_less_memory_than_key_value_pairs():
+    keys = list(range(20_000))
+    random.Random(0).shuffle(keys)
+    values = [str(key) for key in keys]
+
+    def memory_per_entry(tree):
+        tracemalloc.start()
+        for key, value in zip(keys, values):
+            tree.put(hash(key), KeyValuePair(key, value))
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size / len(keys)
+
+    linked = memory_per_entry(BinarySearchTree())
+    pooled = memory_per_entry(PooledEntryTree())
+    assert pooled * 3 < linked
+
+
+def test_entry_tree_operations():
+    tree = PooledEntryTree()
+    tree.bulk_load(
+        [(hash("b"), KeyValuePair("b", 2)), (hash("a"), KeyValuePair("a", 1))]
+    )
+    tree.put(hash("c"), KeyValuePair("c", 3))
+    assert tree.get(hash("a")) == KeyValuePair("a", 1)
+    assert tree.remove(hash("b"))
+    tree.put(hash("d"), KeyValuePair("d", 4))
+    assert sorted(node.value for node in tree) == [("a", 1), ("c", 3), ("d", 4)]
+    assert list(tree.value_chunks())[0][0].key in {"a", "c", "d"}
+    tree.clear()
+    assert len(tree) == 0
+
+
+def test_compact_hashtable():
+    table = HashTable([(i, str(i)) for i in range(50)], compact=True)
+    assert table[10] == "10"
+    del table[10]
+    assert 10 not in table
+    assert list(table.keys()) == [i for i in range(50) if i != 10]
+    with pytest.raises(ValueError):
+        HashTable(balanced=True, compact=True)
+
+
+def test_pooled_tree_bulk_load():
+    tree = PooledBinarySearchTree.from_sorted([(key, -key) for key in range(100)])
+    assert len(tree) == 100
+    assert [node.key for node in tree] == list(range(100))
+    assert tree.get(57) == -57
+    tree.bulk_load([(5, "e"), (1, "a"), (5, "f")])
+    assert [(node.key, node.value) for node in tree] == [(1, "a"), (5, "f")]
+    tree.insert(3, "c")
+    assert tree.remove(5)
+    assert [node.key for node in tree] == [1, 3]
+    with pytest.raises(ValueError):
+        PooledBinarySearchTree.from_sorted([(1, "a"), (0, "b")])
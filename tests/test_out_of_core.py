@@ -0,0 +1,57 @@
+from array import array
+import pytest
+from project.homework_1.index import Matrix
+from project.homework_1.out_of_core import (
+    add_tiled,
+    flush,
+    multiply_tiled,
+    open_mapped,
+)
+
+
+def write_raw(path, typecode, values):
+    with open(path, "wb") as file:
+        array(typecode, values).tofile(file)
+
+
+def test_open_mapped(tmp_path):
+    path = tmp_path / "matrix.bin"
+    write_raw(path, "d", [1, 2, 3, 4, 5, 6])
+    mat = open_mapped(path, (2, 3))
+    assert mat == Matrix([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+    assert mat.transpose() * mat == Matrix([17, 22, 27], [22, 29, 36], [27, 36, 45])
+    with pytest.raises(ValueError):
+        open_mapped(path, (3, 3))
+
+
+def test_mapped_writes_reach_file(tmp_path):
+    path = tmp_path / "matrix.bin"
+    mat = open_mapped(path, (2, 2), "q", mode="w+")
+    mat[1, 0] = 7
+    flush(mat)
+    assert open_mapped(path, (2, 2), "q") == Matrix([0, 0], [7, 0])
+
+
+def test_add_tiled(tmp_path):
+    a = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9], storage="array")
+    b = Matrix([1, 1, 1], [2, 2, 2], [3, 3, 3])
+    result = add_tiled(a, b, tmp_path / "sum.bin", tile_rows=2)
+    assert result.storage.typecode == "q"
+    assert result == a + b
+    assert open_mapped(tmp_path / "sum.bin", (3, 3), "q") == a + b
+
+
+@pytest.mark.parametrize("tile", [1, 2, 3, 10])
+def test_multiply_tiled(tmp_path, tile):
+    a = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9], [1, 0, 1])
+    b = Matrix([1.5, 0], [0, 2], [1, 1])
+    result = multiply_tiled(a, b, tmp_path / "product.bin", tile=tile)
+    assert result.storage.typecode == "d"
+    assert result == a * b
+
+
+def test_multiply_tiled_mapped_operands(tmp_path):
+    write_raw(tmp_path / "a.bin", "q", range(12))
+    a = open_mapped(tmp_path / "a.bin", (3, 4), "q")
+    result = multiply_tiled(a, a.transpose(), tmp_path / "product.bin", tile=2)
+    assert result == a.as_storage("list") * a.as_storage("list").transpose()
@@ -0,0 +1,59 @@
+import random
+import pytest
+from project.homework_1 import index
+from project.homework_1.index import Matrix
+from project.homework_1.parallel import multiply_parallel
+
+
+def random_matrix(rows, cols, seed, storage="list"):
+    generator = random.Random(seed)
+    values = [[generator.randint(-9, 9) for _ in range(cols)] for _ in range(rows)]
+    return Matrix(*values, storage=storage)
+
+
+def test_multiply_parallel():
+    mat1, mat2 = random_matrix(9, 5, 1), random_matrix(5, 4, 2)
+    storage = multiply_parallel(mat1.rows(), mat2.rows(), 4, workers=2)
+    assert storage.typecode == "q"
+    assert storage.shape == (9, 4)
+    assert storage.tolist() == (mat1 * mat2).values
+
+
+def test_multiply_parallel_floats():
+    mat1 = Matrix([0.5, 1.5], [2.0, -1.0], [1.0, 1.0])
+    mat2 = Matrix([2.0, 0.0], [0.0, 2.0])
+    storage = multiply_parallel(mat1.rows(), mat2.rows(), 2, workers=3)
+    assert storage.typecode == "d"
+    assert storage.tolist() == [[1.0, 3.0], [4.0, -2.0], [2.0, 2.0]]
+
+
+def test_matrix_parallel_method():
+    mat1, mat2 = random_matrix(7, 6, 3), random_matrix(6, 5, 4, storage="array")
+    mat1.workers = 2
+    mat1.parallel_threshold = mat2.parallel_threshold = 0
+    expected = mat1 * mat2
+    result = mat1.multiply(mat2, method="parallel")
+    assert result == expected
+    assert result.storage is not None
+    assert mat2.multiply(mat2.transpose(), method="parallel").storage is not None
+    list_result = mat1.multiply(mat2.as_storage("list"), method="parallel")
+    assert list_result.storage is None
+    assert list_result == expected
+
+
+def test_parallel_method_falls_back_for_bigints():
+    mat = Matrix([2**40, 1], [1, 2**40])
+    mat.parallel_threshold = 0
+    assert mat.multiply(mat, method="parallel") == mat * mat
+    assert mat.multiply(mat, method="parallel").values[0][0] == 2**80 + 1
+    with pytest.raises(OverflowError):
+        multiply_parallel(mat.rows(), mat.rows(), 2, workers=1)
+
+
+def test_parallel_method_skips_small_products(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("process pool started for a small product")
+
+    monkeypatch.setattr(index, "multiply_parallel", fail)
+    mat1, mat2 = random_matrix(4, 3, 5), random_matrix(3, 2, 6)
+    assert mat1.multiply(mat2, method="parallel") == mat1 * mat2
@@ -0,0 +1,83 @@
+import struct
+import pytest
+from project.homework_1 import serialization
+from project.homework_1.index import Matrix, Vector
+
+
+def test_matrix_roundtrip(tmp_path):
+    path = tmp_path / "matrix.bin"
+    mat = Matrix([1, 2, 3], [4, 5, 6])
+    mat.save(path)
+    loaded = Matrix.load(path)
+    assert loaded == mat
+    assert loaded.storage.typecode == "q"
+
+    floats = Matrix([1.5, 2.5], [3.5, 4.5], storage="array")
+    floats.transpose().save(path)
+    assert Matrix.load(path) == Matrix([1.5, 3.5], [2.5, 4.5])
+
+
+def test_header_layout(tmp_path):
+    path = tmp_path / "matrix.bin"
+    Matrix([1.0, 2.0], [3.0, 4.0], [5.0, 6.0]).save(path)
+    data = path.read_bytes()
+    assert data[:8] == b"HWLA\x01d\x02\x00"
+    assert struct.unpack("<2Q", data[8:24]) == (3, 2)
+    assert struct.unpack("<6d", data[24:]) == (1.0, 2.0, 3.0, 4.0, 5.0, 6.0)
+
+
+def test_matrix_mmap_load(tmp_path):
+    path = tmp_path / "matrix.bin"
+    mat = Matrix([1, 2], [3, 4], storage="array")
+    mat.save(path)
+    loaded = Matrix.load(path, mmap=True)
+    assert loaded == mat
+    assert loaded * loaded == mat * mat
+    assert loaded.transpose() == mat.transpose()
+    with pytest.raises(TypeError):
+        loaded[0, 0] = 10
+
+
+def test_vector_roundtrip(tmp_path):
+    path = tmp_path / "vector.bin"
+    Vector(1, 2, 3).save(path)
+    for mmap in (False, True):
+        loaded = Vector.load(path, mmap=mmap)
+        assert list(loaded.values) == [1, 2, 3]
+        assert loaded * Vector(1, 1, 1) == 6
+        assert loaded.memoryview().format == "q"
+
+    Vector(0.5, 1.5, storage="array").save(path)
+    assert list(Vector.load(path, mmap=True).values) == [0.5, 1.5]
+
+
+def test_invalid_files(tmp_path):
+    path = tmp_path / "data.bin"
+    Vector(1, 2).save(path)
+    with pytest.raises(ValueError):
+        Matrix.load(path)
+    Matrix([1]).save(path)
+    with pytest.raises(ValueError):
+        Vector.load(path)
+
+    path.write_bytes(b"not a matrix file at all")
+    with pytest.raises(ValueError):
+        serialization.read(path)
+    path.write_bytes(b"HWLA\x01d\x01\x00" + struct.pack("<Q", 3) + bytes(8))
+    with pytest.raises(ValueError):
+        Vector.load(path)
+    with pytest.raises(ValueError):
+        serialization.write(path, "d", (2,), [[1.0]])
+    with pytest.raises(ValueError):
+        serialization.write(path, "b", (1,), [[1]])
+
+
+def test_failed_write_keeps_existing_file(tmp_path):
+    path = tmp_path / "data.bin"
+    Vector(1.0, 2.0).save(path)
+    with pytest.raises(ValueError):
+        serialization.write(path, "d", (3,), [[1.0, 2.0]])
+    assert list(Vector.load(path).values) == [1.0, 2.0]
+    with pytest.raises(ValueError):
+        serialization.write(tmp_path / "new.bin", "d", (1,), [[1.0, 2.0]])
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.bin"]
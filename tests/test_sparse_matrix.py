@@ -0,0 +1,86 @@
+import pytest
+from project.homework_1.index import FrozenVector, Matrix, SparseMatrix, Vector
+
+
+def dense():
+    return Matrix([0, 2, 0], [0, 0, 0], [3, 0, 4])
+
+
+def test_from_dense_and_back():
+    sparse = SparseMatrix.from_dense(dense())
+    assert sparse.nnz == 3
+    assert list(sparse.indptr) == [0, 1, 1, 3]
+    assert list(sparse.indices) == [1, 0, 2]
+    assert sparse.data == [2, 3, 4]
+    assert sparse.to_dense() == dense()
+
+
+def test_from_coo_sums_duplicates_and_drops_zeros():
+    sparse = SparseMatrix.from_coo(
+        [2, 0, 2, 1, 1], [0, 1, 2, 1, 1], [3, 2, 4, 5, -5], (3, 3)
+    )
+    assert sparse == SparseMatrix.from_dense(dense())
+    assert sparse.nnz == 3
+    assert sparse.to_coo() == ([0, 2, 2], [1, 0, 2], [2, 3, 4])
+
+
+def test_from_coo_out_of_shape():
+    with pytest.raises(IndexError):
+        SparseMatrix.from_coo([3], [0], [1], (3, 3))
+
+
+def test_sparse_addition():
+    sparse = SparseMatrix.from_dense(dense())
+    other = SparseMatrix.from_dense(Matrix([0, -2, 0], [1, 0, 0], [0, 0, 0]))
+    result = sparse + other
+    assert isinstance(result, SparseMatrix)
+    assert result.nnz == 3
+    assert result == Matrix([0, 0, 0], [1, 0, 0], [3, 0, 4])
+
+
+def test_mixed_addition():
+    sparse = SparseMatrix.from_dense(dense())
+    ones = Matrix([1, 1, 1], [1, 1, 1], [1, 1, 1])
+    expected = Matrix([1, 3, 1], [1, 1, 1], [4, 1, 5])
+    assert sparse + ones == expected
+    assert ones + sparse == expected
+    assert isinstance(ones + sparse, Matrix)
+    with pytest.raises(ValueError):
+        sparse + Matrix([1, 1])
+
+
+def test_sparse_multiplication():
+    mat1 = Matrix([1, 0, 2], [0, 0, 3], [4, 0, 0])
+    mat2 = Matrix([0, 5, 0], [6, 0, 0], [0, 0, 7])
+    expected = mat1 * mat2
+    sparse1, sparse2 = SparseMatrix.from_dense(mat1), SparseMatrix.from_dense(mat2)
+    assert isinstance(sparse1 * sparse2, SparseMatrix)
+    assert sparse1 * sparse2 == expected
+    assert sparse1 * mat2 == expected
+    assert mat1 * sparse2 == expected
+    assert (mat1.as_storage("array") * sparse2).storage is not None
+
+
+def test_sparse_vector_multiplication():
+    sparse = SparseMatrix.from_dense(dense())
+    assert list((sparse * Vector(1, 2, 3)).values) == [4, 0, 15]
+    with pytest.raises(ValueError):
+        sparse * Vector(1, 2)
+
+
+def test_sparse_transpose():
+    sparse = SparseMatrix.from_dense(dense())
+    assert sparse.transpose() == dense().transpose()
+    assert sparse.transpose().shape == (3, 3)
+
+
+def test_rectangular_sparse():
+    mat = Matrix([0, 1], [2, 0], [0, 0])
+    sparse = SparseMatrix.from_dense(mat)
+    assert sparse.transpose() == mat.transpose()
+    assert sparse * mat.transpose() == mat * mat.transpose()
+
+
+def test_multiply_frozen_vector():
+    sparse = SparseMatrix.from_dense(dense())
+    assert list((sparse * FrozenVector(1, 1, 1)).values) == [2, 0, 7]
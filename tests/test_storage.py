@@ -0,0 +1,98 @@
+import pytest
+from project.homework_1.storage import (
+    ArrayStorage,
+    dtype_typecode,
+    infer_typecode,
+    promote_typecodes,
+    typecode_dtype,
+)
+
+
+def test_infer_typecode():
+    assert infer_typecode([1, 2, 3]) == "q"
+    assert infer_typecode([1, 2.5, 3]) == "d"
+
+
+def test_promote_typecodes():
+    assert promote_typecodes("q", "q") == "q"
+    assert promote_typecodes("i", "q") == "q"
+    assert promote_typecodes("q", "d") == "d"
+
+
+def test_storage_from_rows():
+    storage = ArrayStorage.from_rows([[1, 2, 3], [4, 5, 6]])
+    assert storage.shape == (2, 3)
+    assert storage.strides == (3, 1)
+    assert storage.typecode == "q"
+    assert storage[1, 2] == 6
+    assert storage.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_storage_rejects_ragged_rows():
+    with pytest.raises(ValueError):
+        ArrayStorage.from_rows([[1, 2], [3]])
+
+
+def test_storage_rows_share_buffer():
+    storage = ArrayStorage.from_rows([[1.0, 2.0], [3.0, 4.0]])
+    row = storage.row(1)
+    storage[1, 0] = 7.5
+    assert row[0] == 7.5
+
+
+def test_storage_memoryview():
+    storage = ArrayStorage.from_rows([[1.0, 2.0], [3.0, 4.0]])
+    view = storage.memoryview()
+    assert view.shape == (2, 2)
+    assert view.format == "d"
+    assert view.nbytes == 32
+    assert view.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+
+def test_strided_storage_rows():
+    storage = ArrayStorage.from_rows([[1, 2], [3, 4]])
+    transposed = ArrayStorage("q", (2, 2), storage.buffer, strides=(1, 2))
+    assert transposed.tolist() == [[1, 3], [2, 4]]
+    assert list(transposed.flat()) == [1, 3, 2, 4]
+    with pytest.raises(BufferError):
+        transposed.memoryview()
+
+
+def test_storage_views():
+    storage = ArrayStorage.from_rows([[1, 2, 3], [4, 5, 6]])
+    transposed = storage.transposed()
+    assert transposed.shape == (3, 2)
+    assert transposed.base is storage
+    assert transposed.tolist() == [[1, 4], [2, 5], [3, 6]]
+
+    block = transposed.sliced(slice(1, 3), slice(None))
+    assert block.base is storage
+    assert block.tolist() == [[2, 5], [3, 6]]
+    block[0, 1] = 50
+    assert storage.tolist() == [[1, 2, 3], [4, 50, 6]]
+
+
+def test_storage_reversed_slices():
+    storage = ArrayStorage.from_rows([[1, 2, 3], [4, 5, 6]])
+    reversed_view = storage.sliced(slice(None, None, -1), slice(None, None, -1))
+    assert reversed_view.tolist() == [[6, 5, 4], [3, 2, 1]]
+    assert storage.sliced(slice(None), slice(None, None, 2)).tolist() == [
+        [1, 3],
+        [4, 6],
+    ]
+    assert storage.sliced(slice(1, 1), slice(None)).tolist() == []
+
+
+def test_promote_dtypes():
+    assert promote_typecodes("i", "i") == "i"
+    assert promote_typecodes("f", "f") == "f"
+    assert promote_typecodes("i", "f") == "d"
+    assert promote_typecodes("q", "f") == "d"
+    assert promote_typecodes("f", "d") == "d"
+
+
+def test_dtype_names():
+    assert dtype_typecode("float32") == "f"
+    assert typecode_dtype("q") == "int64"
+    with pytest.raises(ValueError):
+        dtype_typecode("complex64")
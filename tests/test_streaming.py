@@ -0,0 +1,84 @@
+from array import array
+import io
+import pytest
+from project.homework_1.index import FrozenVector, Matrix, Vector
+from project.homework_1.streaming import (
+    chunks,
+    multiply_matrix,
+    multiply_vector,
+    read_binary_rows,
+    read_csv_rows,
+)
+
+
+def generate_rows(count, cols):
+    for i in range(count):
+        yield [i * cols + j for j in range(cols)]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_chunks(prefetch):
+    result = list(chunks(generate_rows(5, 2), chunk_size=2, prefetch=prefetch))
+    assert [len(chunk) for chunk in result] == [2, 2, 1]
+    assert result[2] == [[8, 9]]
+    with pytest.raises(ValueError):
+        list(chunks([], chunk_size=0))
+
+
+def test_chunks_propagate_reader_errors():
+    def broken():
+        yield [1]
+        raise OSError("disk is gone")
+
+    with pytest.raises(OSError):
+        list(chunks(broken(), chunk_size=1))
+
+
+def test_chunks_stop_reader_when_abandoned():
+    stream = chunks(generate_rows(10_000, 1), chunk_size=1, prefetch=1)
+    assert next(stream) == [[0]]
+    stream.close()
+
+
+@pytest.mark.parametrize("prefetch", [0, 1])
+def test_multiply_vector(prefetch):
+    mat = Matrix(*generate_rows(7, 3))
+    vec = Vector(1, -1, 2)
+    expected = [sum(x * y for x, y in zip(row, vec.values)) for row in mat.values]
+    result = multiply_vector(generate_rows(7, 3), vec, chunk_size=3, prefetch=prefetch)
+    assert list(result) == expected
+    with pytest.raises(ValueError):
+        list(multiply_vector(generate_rows(2, 2), vec))
+
+
+def test_multiply_matrix():
+    other = Matrix([1, 0], [0, 1], [1, 1])
+    expected = Matrix(*generate_rows(5, 3)) * other
+    result = multiply_matrix(generate_rows(5, 3), other, chunk_size=2)
+    assert Matrix(*result) == expected
+    with pytest.raises(ValueError):
+        list(multiply_matrix(generate_rows(2, 2), other))
+
+
+def test_read_csv_rows(tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text("1,2\n3,4.5\n\n")
+    assert list(read_csv_rows(path)) == [[1.0, 2.0], [3.0, 4.5]]
+    assert list(read_csv_rows(io.StringIO("1;2\n"), delimiter=";")) == [[1.0, 2.0]]
+
+
+def test_read_binary_rows(tmp_path):
+    path = tmp_path / "rows.bin"
+    with open(path, "wb") as file:
+        array("q", range(10)).tofile(file)
+    rows = read_binary_rows(path, cols=2, typecode="q", rows_per_read=2)
+    assert [list(row) for row in rows] == [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+    with pytest.raises(ValueError):
+        list(read_binary_rows(path, cols=3, typecode="q"))
+    products = multiply_vector(read_binary_rows(path, 2, "q"), Vector(1, 1))
+    assert list(products) == [1, 5, 9, 13, 17]
+
+
+def test_multiply_vector_accepts_frozen_vector():
+    rows = ([i, i + 1] for i in range(3))
+    assert list(multiply_vector(rows, FrozenVector(1, 2), prefetch=0)) == [2, 5, 8]
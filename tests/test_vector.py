@@ -1,5 +1,5 @@
 import pytest
-from project.homework_1.index import Vector, Matrix
+from project.homework_1.index import FrozenVector, Vector, Matrix
 
 
 def test_vector_initialization():
@@ -57,3 +57,163 @@ def test_matrix_transposition():
     mat = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
     mat2 = Matrix([1, 4, 7], [2, 5, 8], [3, 6, 9])
     assert mat.transpose() == mat2
+
+
+def test_array_vector():
+    vec1 = Vector(1, 2, 3, storage="array")
+    vec2 = Vector(4.0, 5.0, 6.0, storage="array")
+    assert vec1 * vec2 == 32
+    assert Vector(3, 4, storage="array").length() == 5
+    assert vec2.memoryview().format == "d"
+
+
+def test_array_matrix_operations():
+    mat1 = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9], storage="array")
+    mat2 = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9])
+    assert mat1 + mat2 == Matrix([2, 4, 6], [8, 10, 12], [14, 16, 18])
+    assert mat1 * mat2 == Matrix([30, 36, 42], [66, 81, 96], [102, 126, 150])
+    assert mat1.transpose() == Matrix([1, 4, 7], [2, 5, 8], [3, 6, 9])
+    assert (mat1 * mat2).storage is not None
+    assert (mat2 * mat2).storage is None
+
+
+def test_array_matrix_buffer():
+    mat = Matrix([1.0, 2.0], [3.0, 4.0], storage="array")
+    assert mat.shape == (2, 2)
+    assert mat.values == [[1.0, 2.0], [3.0, 4.0]]
+    assert mat.memoryview().nbytes == 32
+    with pytest.raises(BufferError):
+        Matrix([1, 2]).memoryview()
+
+
+def test_matrix_views_share_storage():
+    mat = Matrix([1, 2, 3], [4, 5, 6], storage="array")
+    transposed = mat.transpose()
+    assert transposed.is_view
+    assert transposed.storage.buffer is mat.storage.buffer
+    transposed[2, 0] = 30
+    assert mat[0, 2] == 30
+    assert mat[:, 1] == Matrix([2], [5])
+    assert mat[1] == Matrix([4, 5, 6])
+    assert mat[0:2, 1:3] == Matrix([2, 30], [5, 6])
+    assert mat[-1, -1] == 6
+
+
+def test_matrix_views_in_operations():
+    mat = Matrix([1, 2, 3], [4, 5, 6], [7, 8, 9], storage="array")
+    block = mat[1:, 1:]
+    assert block + block == Matrix([10, 12], [16, 18])
+    assert block * block.transpose() == Matrix([61, 94], [94, 145])
+    assert mat.transpose() * mat == mat.as_storage("list").transpose() * mat
+    assert block.copy().memoryview().tolist() == [[5, 6], [8, 9]]
+    with pytest.raises(BufferError):
+        block.memoryview()
+
+
+def test_list_matrix_indexing():
+    mat = Matrix([1, 2], [3, 4])
+    assert mat[1, 0] == 3
+    assert mat[:, 0] == Matrix([1], [3])
+    assert not mat[:, 0].is_view
+    mat[0, 0] = 10
+    assert mat.values[0][0] == 10
+    with pytest.raises(IndexError):
+        mat[2, 0]
+    with pytest.raises(TypeError):
+        mat[0] = 1
+
+
+def test_frozen_vector():
+    vec = FrozenVector(1, 0, 0)
+    assert vec * FrozenVector(4, 5, 6) == 4
+    assert vec * Vector(4, 5, 6) == 4
+    assert vec.length() == 1
+    assert vec.angle(FrozenVector(0, 1, 0)) == 90
+    assert Vector(0, 1, 0).angle(vec) == 90
+    assert not hasattr(vec, "__dict__")
+
+
+def test_frozen_vector_is_immutable():
+    vec = Vector(1, 2, 3).freeze()
+    assert vec.values == (1, 2, 3)
+    with pytest.raises(AttributeError):
+        vec.values = (0, 0, 0)  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        del vec.values
+
+
+def test_frozen_vector_caches():
+    vec = FrozenVector(3, 4)
+    assert vec.length() == 5
+    assert vec._length == 5
+    assert FrozenVector(3, 4) == vec
+    assert FrozenVector(3.0, 4.0) == vec
+    assert FrozenVector(4, 3) != vec
+    cache = {vec: "cached"}
+    assert cache[FrozenVector(3, 4)] == "cached"
+
+
+def test_matrix_power():
+    mat = Matrix([1, 1], [1, 0])
+    assert mat**0 == Matrix([1, 0], [0, 1])
+    assert mat**1 == mat and mat**1 is not mat
+    assert mat**10 == Matrix([89, 55], [55, 34])
+    expected = mat
+    for _ in range(6):
+        expected = expected * mat
+    assert mat**7 == expected
+
+    floats = Matrix([0.5, 0.0], [0.0, 2.0], storage="array")
+    assert (floats**0).storage.typecode == "d"
+    assert floats**3 == Matrix([0.125, 0.0], [0.0, 8.0])
+    with pytest.raises(ValueError):
+        mat**-1
+    with pytest.raises(ValueError):
+        Matrix([1, 2]) ** 2
+
+
+def test_matrix_chain():
+    a = Matrix(*([i] * 3 for i in range(5)))
+    b = Matrix([1, 2], [3, 4], [5, 6])
+    c = Matrix([1, 0, 2, 1], [0, 1, 1, 0])
+    d = Matrix([1], [2], [3], [4])
+    assert Matrix.chain(a, b, c, d) == a * b * c * d
+    assert Matrix.chain(b) == b
+    with pytest.raises(ValueError):
+        Matrix.chain(a, c)
+    with pytest.raises(ValueError):
+        Matrix.chain()
+
+
+def test_matrix_dtype():
+    mat = Matrix([1, 2], [3, 4], dtype="int32")
+    assert mat.storage_kind == "array"
+    assert mat.dtype == "int32"
+    assert mat.storage.itemsize == 4
+    assert Matrix([1, 2]).dtype is None
+    assert Matrix([1, 2], storage="array").dtype == "int64"
+
+    floats = mat.astype("float32")
+    assert floats.dtype == "float32"
+    assert floats == mat
+    assert (floats + floats).dtype == "float32"
+    assert (floats * floats).dtype == "float32"
+    assert (mat + mat.astype("int64")).dtype == "int64"
+    assert (mat + floats).dtype == "float64"
+    assert (mat * Matrix([0.5, 0], [0, 1])).dtype == "float64"
+    assert Matrix([0.1], dtype="float32") != Matrix([0.1], dtype="float64")
+    with pytest.raises(OverflowError):
+        Matrix([2**40], dtype="int32")
+    with pytest.raises(ValueError):
+        Matrix([1], dtype="int8")
+
+
+def test_vector_dtype():
+    vec = Vector(1, 2, 3, dtype="float32")
+    assert vec.dtype == "float32"
+    assert vec.memoryview().itemsize == 4
+    assert vec * Vector(1, 1, 1) == 6
+    assert vec.astype("int64").dtype == "int64"
+    assert Vector(1, 2).dtype is None
+    assert Vector(1.9, -1.9).astype("int32").values.tolist() == [1, -1]
+    assert Matrix([2.5]).astype("int64") == Matrix([2])
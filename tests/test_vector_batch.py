@@ -0,0 +1,73 @@
+import math
+import pytest
+from project.homework_1 import backend
+from project.homework_1.index import FrozenVector, Vector
+from project.homework_1.vector_batch import VectorBatch
+
+
+def make_batch():
+    return VectorBatch([Vector(1, 0), Vector(0, 2), Vector(1, 1), Vector(0, 0)])
+
+
+def test_batch_storage():
+    batch = make_batch()
+    assert len(batch) == 4
+    assert batch.dimension == 2
+    assert list(batch.norms) == [1.0, 2.0, math.sqrt(2), 0.0]
+    assert list(batch[1].values) == [0, 2]
+    assert list(batch[-1].values) == [0, 0]
+    with pytest.raises(IndexError):
+        batch[4]
+    with pytest.raises(ValueError):
+        batch.append(Vector(1, 2, 3))
+
+
+def test_batch_dots():
+    assert make_batch().dots(Vector(3, 4)) == [3, 8, 7, 0]
+
+
+def test_batch_angles_match_vector_angle():
+    batch = make_batch()
+    query = Vector(2, 1)
+    angles = batch.angles(query)
+    for vector, angle in zip(list(batch)[:3], angles):
+        assert angle == pytest.approx(query.angle(vector))
+    assert math.isnan(angles[3])
+
+
+def test_batch_top_k():
+    batch = make_batch()
+    top = batch.top_k(Vector(1, 0.1), 2)
+    assert [index for index, _ in top] == [0, 2]
+    assert top[0][1] == pytest.approx(1 / math.sqrt(1.01))
+    assert len(batch.top_k([1, 0], 10)) == 3
+
+
+def test_batch_zero_query():
+    with pytest.raises(ValueError):
+        make_batch().cosine_similarities(Vector(0, 0))
+
+
+def test_batch_numpy_backend():
+    pytest.importorskip("numpy")
+    batch = make_batch()
+    expected = batch.cosine_similarities(Vector(2, 1))
+    backend.set_backend("numpy")
+    try:
+        similarities = batch.cosine_similarities(Vector(2, 1))
+        assert similarities[:3] == pytest.approx(expected[:3])
+        assert math.isnan(similarities[3])
+        assert batch.top_k(Vector(1, 0.1), 2)[0][0] == 0
+        assert batch.dots([3, 4]) == [3, 8, 7, 0]
+        assert batch.dots([3, 4], [2, 0]) == [7, 3]
+        assert batch.cosine_similarities(Vector(2, 1), [1, 0]) == pytest.approx(
+            [expected[1], expected[0]]
+        )
+    finally:
+        backend.set_backend("python")
+
+
+def test_batch_accepts_frozen_vectors():
+    batch = VectorBatch([FrozenVector(1, 0), Vector(0, 2).freeze()])
+    assert batch.dots(FrozenVector(3, 4)) == [3.0, 8.0]
+    assert batch.top_k(FrozenVector(1, 0.1), 1)[0][0] == 0